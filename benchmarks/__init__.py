@@ -0,0 +1 @@
+"""Scan benchmarks against synthetic clusters (see `python -m benchmarks.run --help`)."""
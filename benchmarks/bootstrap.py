@@ -0,0 +1,99 @@
+"""Benchmark bootstrapping and scanning many EKS clusters through stand-in `aws` and `kubectl`.
+
+Times the wizard's serial flow (credential check, kubeconfig, scan, one cluster after the
+other) against `scan-fleet --eks`, with describe-cluster results cached and not.
+
+    python -m benchmarks.bootstrap
+    python -m benchmarks.bootstrap --clusters 8 --aws-latency 1.0 --latency 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+
+
+def _install_shims(directory: Path) -> None:
+    for name, script in (("aws", "fake_aws.py"), ("kubectl", "fake_kubectl.py")):
+        shim = directory / name
+        shim.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{BENCH_DIR / script}" "$@"\n', encoding="utf-8")
+        shim.chmod(0o755)
+
+
+def serial(clusters: list[str], directory: Path) -> None:
+    """What the wizard does, once per cluster."""
+    from kubeval.cli import main as kubeval_main
+    from kubeval.infrastructure.kubernetes.eks import EksEndpoint, kubeconfig_document, parse_eks_clusters
+
+    for cluster in parse_eks_clusters(clusters):
+        region = ["--region", cluster.region, "--output", "json"]
+        subprocess.run(["aws", "sts", "get-caller-identity", *region], capture_output=True, check=True)
+        described = subprocess.run(
+            ["aws", "eks", "describe-cluster", "--name", cluster.name, *region],
+            capture_output=True,
+            check=True,
+        )
+        info = json.loads(described.stdout)["cluster"]
+        endpoint = EksEndpoint(info["arn"], info["endpoint"], info["certificateAuthority"]["data"])
+        path = directory / f"{cluster.region}_{cluster.name}.json"
+        path.write_text(json.dumps(kubeconfig_document(cluster, endpoint)), encoding="utf-8")
+        kubeval_main(["scan-fleet", "--kubeconfig-glob", str(path), "--no-cache"])
+
+
+def timed_ms(run) -> float:
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run()
+    return (time.perf_counter() - started) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bootstrap",
+        description=__doc__.splitlines()[0],
+    )
+    parser.add_argument("--clusters", type=int, default=6)
+    parser.add_argument("--regions", type=int, default=2)
+    parser.add_argument("--aws-latency", type=float, default=0.5, help="Seconds per aws invocation")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds per kubectl invocation")
+    parser.add_argument("--objects", type=int, default=100, help="Objects per resource kind")
+    args = parser.parse_args(argv)
+
+    from kubeval.cli import main as kubeval_main
+
+    clusters = [f"region-{idx % args.regions}/cluster-{idx}" for idx in range(args.clusters)]
+    fleet = ["scan-fleet", "--eks", ",".join(clusters), "--max-clusters", str(args.clusters)]
+    with tempfile.TemporaryDirectory(prefix="kubeval-bootstrap-") as tmp:
+        bin_dir = Path(tmp) / "bin"
+        bin_dir.mkdir()
+        _install_shims(bin_dir)
+        os.environ.update(
+            PATH=f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            KUBEVAL_BENCH_AWS_LATENCY=str(args.aws_latency),
+            KUBEVAL_BENCH_LATENCY=str(args.latency),
+            KUBEVAL_BENCH_OBJECTS=str(args.objects),
+        )
+        cache = ["--cache-dir", str(Path(tmp) / "cache")]
+
+        wizard = timed_ms(lambda: serial(clusters, Path(tmp)))
+        cold = timed_ms(lambda: kubeval_main([*fleet, *cache, "--refresh"]))
+        warm = timed_ms(lambda: kubeval_main([*fleet, *cache]))
+
+    print(f"{args.clusters} cluster(s) in {args.regions} region(s), aws {args.aws_latency}s per call")
+    print(f"  wizard, one by one     {wizard:8.0f} ms")
+    print(f"  --eks                  {cold:8.0f} ms ({wizard / cold:.1f}x faster)")
+    print(f"  --eks, cached          {warm:8.0f} ms ({wizard / warm:.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+"""Benchmark loading many custom checks files, cold and from catalog snapshots.
+
+Writes `--files` JSON files of `--checks` checks each into a temporary directory, then
+times `load_catalog` with no snapshots, with snapshots being written, and once they exist.
+
+    python -m benchmarks.catalog
+    python -m benchmarks.catalog --files 200 --checks 50 --workers 8
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+
+def write_files(directory: Path, files: int, checks: int) -> None:
+    for file_idx in range(files):
+        team = directory / f"team-{file_idx % 10}"
+        team.mkdir(exist_ok=True)
+        payload = {
+            "checks": [
+                {
+                    "id": f"team-{file_idx}-check-{idx}",
+                    "title": f"Synthetic check {idx} of file {file_idx}",
+                    "resource": "deployment",
+                    "namespace": f"team-{file_idx % 10}",
+                    "match_type": ("exact", "contains", "regex")[idx % 3],
+                    "match_value": rf"^app-{file_idx}-{idx}(-canary)?$" if idx % 3 == 2 else f"app-{file_idx}-{idx}",
+                    "label_selector": f"team=team-{file_idx % 10},tier in (web,api)",
+                    "image_regex": rf"^registry\.example\.com/team-{file_idx % 10}/",
+                    "min_ready": 1,
+                }
+                for idx in range(checks)
+            ]
+        }
+        (team / f"checks-{file_idx}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+def timed_ms(load) -> float:
+    started = time.perf_counter()
+    load()
+    return (time.perf_counter() - started) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.catalog", description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--checks", type=int, default=50, help="Checks per file")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    from kubeval.application.checks.matcher import compile_regex
+    from kubeval.checks import load_catalog
+    from kubeval.infrastructure.cache.catalog_snapshot import CatalogSnapshot
+
+    with tempfile.TemporaryDirectory(prefix="kubeval-catalog-") as tmp:
+        checks_dir = Path(tmp) / "checks"
+        checks_dir.mkdir()
+        write_files(checks_dir, args.files, args.checks)
+
+        def load(snapshots: CatalogSnapshot | None) -> None:
+            # Validation compiles regexes once per process; clear so every run pays for them.
+            compile_regex.cache_clear()
+            load_catalog(dirs=[str(checks_dir)], snapshots=snapshots, workers=args.workers)
+
+        cold = statistics.median(timed_ms(lambda: load(None)) for _ in range(args.runs))
+        first = timed_ms(lambda: load(CatalogSnapshot(Path(tmp) / "cache")))
+        warm = statistics.median(
+            timed_ms(lambda: load(CatalogSnapshot(Path(tmp) / "cache"))) for _ in range(args.runs)
+        )
+
+    total = args.files * args.checks
+    print(f"{total} checks in {args.files} file(s), {args.workers} worker(s)")
+    print(f"  validate          {cold:8.1f} ms")
+    print(f"  validate + save   {first:8.1f} ms")
+    print(f"  from snapshots    {warm:8.1f} ms ({cold / warm:.1f}x faster)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.synthetic import DISCOVERY, iter_objects, synthetic_object
+from kubeval.infrastructure.kubernetes.kubeconfig import ClusterCredentials
+
+
+class FakeApiServer:
+    """In-process API server serving paginated synthetic lists over plain HTTP.
+
+    `throttle` is the fraction of list requests answered with 429 Too Many Requests.
+    """
+
+    def __init__(self, size: int, latency: float = 0.0, throttle: float = 0.0) -> None:
+        self.size = size
+        self.latency = latency
+        self.throttle = throttle
+        self.requests = 0
+        self._lists: dict[tuple[str, str | None, str | None, bool], list[dict]] = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+            def do_GET(self) -> None:  # noqa: N802
+                server.requests += 1
+                time.sleep(server.latency)
+                parts = urlsplit(self.path)
+                status = 200
+                if parts.path != "/version" and random.random() < server.throttle:
+                    status = 429
+                    body = {"kind": "Status", "code": 429, "message": "Too many requests, please try again later."}
+                else:
+                    metadata_only = "PartialObjectMetadata" in self.headers.get("Accept", "")
+                    body = server.handle(parts.path, parse_qs(parts.query), metadata_only)
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def handle(self, path: str, query: dict[str, list[str]], metadata_only: bool = True) -> dict:
+        if path == "/version":
+            return {"gitVersion": "v1.30.0-bench"}
+        if path in DISCOVERY:
+            return DISCOVERY[path]
+        segments = path.strip("/").split("/")
+        namespace = None
+        if "namespaces" in segments:
+            idx = segments.index("namespaces")
+            namespace = segments[idx + 1]
+        resource = segments[-1]
+        limit = int(query.get("limit", ["500"])[0])
+        start = int(query.get("continue", ["0"])[0])
+        label_selector = query.get("labelSelector", [None])[0]
+        key = (resource, namespace, label_selector, metadata_only)
+        if key not in self._lists:
+            self._lists[key] = [
+                synthetic_object(ns, name, with_status=not metadata_only)
+                for ns, name in iter_objects(resource, namespace, self.size, label_selector)
+            ]
+        objects = self._lists[key]
+        items = objects[start : start + limit]
+        metadata = {"resourceVersion": "1"}
+        if start + limit < len(objects):
+            metadata["continue"] = str(start + limit)
+        kind = "PartialObjectMetadataList" if metadata_only else "List"
+        return {"kind": kind, "metadata": metadata, "items": items}
+
+    @property
+    def credentials(self) -> ClusterCredentials:
+        host, port = self._httpd.server_address[:2]
+        return ClusterCredentials(server=f"http://{host}:{port}", token="bench")
+
+    def __enter__(self) -> "FakeApiServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Stand-in for the `aws` CLI commands kubeval uses to reach EKS clusters.
+
+Serves `sts get-caller-identity`, `eks describe-cluster` and `eks get-token`; every cluster
+exists unless its name is listed in KUBEVAL_BENCH_AWS_MISSING, and its endpoint points at
+the fake kubectl's cluster.
+
+Environment:
+  KUBEVAL_BENCH_AWS_LATENCY  seconds to sleep per invocation (the real CLI takes about 1s)
+  KUBEVAL_BENCH_AWS_MISSING  comma-separated cluster names describe-cluster does not find
+  KUBEVAL_BENCH_AWS_DENIED   comma-separated regions whose credentials are rejected
+  KUBEVAL_BENCH_CALLS        file that receives one line per invocation
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+
+
+def _option(args: list[str], name: str) -> str | None:
+    if name in args:
+        return args[args.index(name) + 1]
+    return None
+
+
+def _listed(name: str, value: str | None) -> bool:
+    return bool(value) and value in os.environ.get(name, "").split(",")
+
+
+def main(argv: list[str]) -> int:
+    calls = os.environ.get("KUBEVAL_BENCH_CALLS")
+    if calls:
+        with open(calls, "a", encoding="utf-8") as fh:
+            fh.write("aws " + " ".join(argv) + "\n")
+    time.sleep(float(os.environ.get("KUBEVAL_BENCH_AWS_LATENCY", "0")))
+
+    region = _option(argv, "--region") or os.environ.get("AWS_REGION") or "us-east-1"
+    if _listed("KUBEVAL_BENCH_AWS_DENIED", region):
+        message = "An error occurred (ExpiredToken): The security token included in the request is expired"
+        print(message, file=sys.stderr)
+        return 254
+    args = list(argv)
+    # Every option kubeval passes takes a value.
+    while any(arg.startswith("--") for arg in args):
+        idx = next(idx for idx, arg in enumerate(args) if arg.startswith("--"))
+        del args[idx : idx + 2]
+
+    if args[:2] == ["sts", "get-caller-identity"]:
+        identity = {"Account": "123456789012", "Arn": "arn:aws:iam::123456789012:user/bench"}
+        print(json.dumps(identity))
+        return 0
+    name = _option(argv, "--name") or _option(argv, "--cluster-name")
+    if args[:2] == ["eks", "describe-cluster"]:
+        if _listed("KUBEVAL_BENCH_AWS_MISSING", name):
+            message = f"An error occurred (ResourceNotFoundException): No cluster found for name: {name}."
+            print(message, file=sys.stderr)
+            return 254
+        cluster = {
+            "name": name,
+            "arn": f"arn:aws:eks:{region}:123456789012:cluster/{name}",
+            "endpoint": "https://bench.invalid",
+            "certificateAuthority": {"data": "QkVOQ0gtQ0EK"},
+            "status": "ACTIVE",
+        }
+        print(json.dumps({"cluster": cluster}))
+        return 0
+    if args[:2] == ["eks", "get-token"]:
+        status = {"expirationTimestamp": "2099-01-01T00:00:00Z", "token": f"k8s-aws-v1.bench-{name}"}
+        api_version = "client.authentication.k8s.io/v1beta1"
+        print(json.dumps({"kind": "ExecCredential", "apiVersion": api_version, "status": status}))
+        return 0
+    print(f"fake aws: unsupported command {argv}", file=sys.stderr)
+    return 252
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
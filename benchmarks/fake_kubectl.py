@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Stand-in for `kubectl` serving synthetic lists.
+
+Environment:
+  KUBEVAL_BENCH_OBJECTS  objects per resource kind (default 100)
+  KUBEVAL_BENCH_LATENCY  seconds to sleep per invocation, simulating API latency
+  KUBEVAL_BENCH_CALLS    file that receives one line per invocation
+  KUBEVAL_BENCH_THROTTLE fraction of `get` calls rejected with a 429, as a throttled API server does
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import (  # noqa: E402
+    DISCOVERY,
+    cluster_size,
+    column_value,
+    iter_objects,
+    synthetic_object,
+)
+
+
+def _option(args: list[str], name: str) -> str | None:
+    if name in args:
+        return args[args.index(name) + 1]
+    return None
+
+
+def main(argv: list[str]) -> int:
+    calls = os.environ.get("KUBEVAL_BENCH_CALLS")
+    if calls:
+        with open(calls, "a", encoding="utf-8") as fh:
+            fh.write(" ".join(argv) + "\n")
+    time.sleep(float(os.environ.get("KUBEVAL_BENCH_LATENCY", "0")))
+
+    args = list(argv)
+    for flag in ("--context", "--kubeconfig"):
+        if flag in args:
+            idx = args.index(flag)
+            del args[idx : idx + 2]
+
+    if args[:2] == ["version", "--client"]:
+        print(json.dumps({"clientVersion": {"gitVersion": "v1.30.0-bench"}}))
+        return 0
+    if args[:2] == ["config", "view"]:
+        print("https://bench.invalid")
+        return 0
+    if args[:2] == ["get", "--raw"]:
+        document = DISCOVERY.get(args[2])
+        if document is None:
+            message = "Error from server (NotFound): the server could not find the requested resource"
+            print(message, file=sys.stderr)
+            return 1
+        print(json.dumps(document))
+        return 0
+    if not args or args[0] != "get":
+        print(f"fake kubectl: unsupported command {args}", file=sys.stderr)
+        return 1
+
+    if random.random() < float(os.environ.get("KUBEVAL_BENCH_THROTTLE", "0")):
+        print("Error from server (TooManyRequests): the server has received too many requests", file=sys.stderr)
+        return 1
+
+    resource = args[1]
+    namespace = _option(args, "-n")
+    output = _option(args, "-o") or ""
+    objects = iter_objects(resource, namespace, cluster_size(), _option(args, "-l"))
+    write = sys.stdout.write
+    if output.startswith("custom-columns="):
+        paths = [column.split(":", 1)[1] for column in output[len("custom-columns=") :].split(",")]
+        with_status = len(paths) > 2
+        for ns, name in objects:
+            obj = synthetic_object(ns, name, with_status)
+            write("   ".join(column_value(obj, path) for path in paths) + "\n")
+    else:
+        items = [synthetic_object(ns, name, True) for ns, name in objects]
+        write(json.dumps({"apiVersion": "v1", "kind": "List", "items": items}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
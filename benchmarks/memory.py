@@ -0,0 +1,102 @@
+"""Measure memory held by large synthetic lists of domain models.
+
+Decodes `--objects` synthetic objects through the kubectl line decoder and the API object
+decoder, builds as many check results, and reports what each list keeps allocated
+(tracemalloc, after the decoder's temporaries are gone) and how long serializing it takes.
+
+    python -m benchmarks.memory
+    python -m benchmarks.memory --objects 200000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from benchmarks.synthetic import iter_objects
+
+
+def retained(build: Callable[[], Any]) -> tuple[Any, int]:
+    """Return what `build` returns and the bytes it still holds once it has returned."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = build()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return value, current
+
+
+def kubectl_refs(lines: list[str]) -> list[Any]:
+    from kubeval.infrastructure.kubernetes.kubectl_client import KubectlClient
+
+    class _LinesClient(KubectlClient):
+        def stream_command(self, cmd, on_line, timeout=None):  # type: ignore[override]
+            for line in lines:
+                on_line(line)
+            return None
+
+    resources, _ = _LinesClient()._list_once([], None, False, 2, None, 1.0)
+    return resources
+
+
+def api_refs(body: str) -> list[Any]:
+    from kubeval.infrastructure.kubernetes.objects import ref_from_object
+
+    # Pages are decoded and dropped one at a time; only the refs outlive them.
+    items = json.loads(body)["items"]
+    refs = [ref_from_object(item, "default") for item in items]
+    del items
+    return refs
+
+
+def check_results(count: int) -> list[Any]:
+    from kubeval.domain.models import PASS, CheckResult, Timings
+
+    timings = Timings(checks=count)
+    return [
+        CheckResult(f"check-{idx}", f"Synthetic check {idx}", PASS, "Found 1 object(s).", timings)
+        for idx in range(count)
+    ]
+
+
+def serialize_ms(values: list[Any], serialize: Callable[[Any], Any]) -> float:
+    started = time.perf_counter()
+    for value in values:
+        serialize(value)
+    return (time.perf_counter() - started) * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory", description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=50000)
+    args = parser.parse_args(argv)
+
+    from kubeval.presentation.console.reporting import result_to_dict
+
+    pairs = list(iter_objects("deployment", None, args.objects))
+    lines = [f"{ns}   {name}\n" for ns, name in pairs]
+    body = json.dumps({"items": [{"metadata": {"name": name, "namespace": ns}} for ns, name in pairs]})
+
+    rows = []
+    refs, size = retained(lambda: kubectl_refs(lines))
+    rows.append(("kubectl refs", len(refs), size, None))
+    refs, size = retained(lambda: api_refs(body))
+    rows.append(("api refs", len(refs), size, None))
+    results, size = retained(lambda: check_results(args.objects))
+    rows.append(("check results", len(results), size, serialize_ms(results, result_to_dict)))
+
+    print(f"{'list':<16}{'items':>9}{'MiB':>9}{'B/item':>9}{'to dict ms':>12}")
+    for label, count, size, ms in rows:
+        to_dict = f"{ms:12.1f}" if ms is not None else f"{'-':>12}"
+        print(f"{label:<16}{count:>9}{size / 2**20:9.2f}{size / count:9.0f}{to_dict}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
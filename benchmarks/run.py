@@ -0,0 +1,238 @@
+"""Benchmark full scans against synthetic clusters.
+
+Each cluster size runs in its own interpreter so peak RSS is per size. The
+kubectl backend uses benchmarks/fake_kubectl.py on PATH; the api backend uses an
+in-process fake API server, whose lists count towards that run's peak RSS.
+
+    python -m benchmarks.run --sizes 100,1000,10000 --latency 0.05 --save baseline.json
+    python -m benchmarks.run --sizes 100,1000,10000 --latency 0.05 --compare baseline.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+
+# Metrics where a larger value is a regression; shown with their delta on --compare.
+COMPARED_METRICS = ("wall_seconds", "subprocesses", "requests", "peak_rss_mb", "check_p50_ms", "check_p99_ms")
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def _synthetic_checks(count: int) -> list:
+    from kubeval.domain.models import ResourceCheck
+
+    checks = []
+    resources = ("deployment", "daemonset")
+    match_types = ("exact", "contains", "regex")
+    for i in range(count):
+        resource_name = resources[i % len(resources)]
+        match_type = match_types[i % len(match_types)]
+        value = {
+            "exact": f"{resource_name}-app-{i}",
+            "contains": f"app-{i}",
+            "regex": rf"^{resource_name}-app-{i}\d*$",
+        }[match_type]
+        checks.append(
+            ResourceCheck(
+                check_id=f"BENCH-{i:05d}",
+                title=f"Synthetic check {i}",
+                resource=resource_name,
+                namespace=None if i % 4 == 0 else f"team-{i % 50}",
+                match_type=match_type,
+                match_value=value,
+            )
+        )
+    return checks
+
+
+def _install_fake_kubectl(directory: str) -> None:
+    shim = Path(directory) / "kubectl"
+    shim.write_text(
+        f'#!/bin/sh\nexec "{sys.executable}" "{BENCH_DIR / "fake_kubectl.py"}" "$@"\n',
+        encoding="utf-8",
+    )
+    shim.chmod(0o755)
+
+
+def run_single(size: int, args: argparse.Namespace) -> dict:
+    """Run one scan in this process and return its measurements."""
+    from kubeval.application.checks.runner import run_checks
+    from kubeval.checks import builtin_checks
+    from kubeval.domain.models import ScanStats
+    from kubeval.infrastructure.kubernetes.retry import RetryPolicy
+
+    retry = RetryPolicy(retries=args.retries, base_delay=args.retry_delay)
+    checks = builtin_checks() + _synthetic_checks(args.custom_checks)
+    stats = ScanStats()
+    subprocesses = 0
+    requests = 0
+
+    with tempfile.TemporaryDirectory(prefix="kubeval-bench-") as tmp:
+        if args.backend == "kubectl":
+            from kubeval.infrastructure.kubernetes.kubectl_client import KubectlClient
+
+            _install_fake_kubectl(tmp)
+            calls = Path(tmp) / "calls.log"
+            os.environ["PATH"] = tmp + os.pathsep + os.environ.get("PATH", "")
+            os.environ["KUBEVAL_BENCH_OBJECTS"] = str(size)
+            os.environ["KUBEVAL_BENCH_LATENCY"] = str(args.latency)
+            os.environ["KUBEVAL_BENCH_CALLS"] = str(calls)
+            os.environ["KUBEVAL_BENCH_THROTTLE"] = str(args.throttle)
+            client = KubectlClient(timeout_seconds=args.timeout, retry=retry)
+            started = time.perf_counter()
+            results = run_checks(checks, client, stats=stats, workers=args.parallel)
+            wall = time.perf_counter() - started
+            if calls.exists():
+                subprocesses = len(calls.read_text(encoding="utf-8").splitlines())
+        else:
+            from benchmarks.fake_apiserver import FakeApiServer
+            from kubeval.infrastructure.kubernetes.api_client import ApiClient
+
+            with FakeApiServer(size, latency=args.latency, throttle=args.throttle) as server:
+                client = ApiClient(server.credentials, timeout_seconds=args.timeout, retry=retry)
+                started = time.perf_counter()
+                results = run_checks(checks, client, stats=stats, workers=args.parallel)
+                wall = time.perf_counter() - started
+                requests = server.requests
+                client.close()
+
+    # Checks in one fetch group share a Timings object; attribute it to each of them.
+    latencies = [r.timings.total_seconds * 1000 for r in results if r.timings is not None]
+    rusage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "size": size,
+        "checks": len(checks),
+        "fetches": stats.fetches,
+        "wall_seconds": round(wall, 4),
+        "subprocesses": subprocesses,
+        "requests": requests,
+        "retries": stats.retries,
+        "peak_rss_mb": round(rusage.ru_maxrss / divisor, 1),
+        "check_p50_ms": round(_percentile(latencies, 50), 2),
+        "check_p90_ms": round(_percentile(latencies, 90), 2),
+        "check_p99_ms": round(_percentile(latencies, 99), 2),
+        "statuses": {status: sum(1 for r in results if r.status == status) for status in sorted({r.status for r in results})},
+    }
+
+
+def _run_isolated(size: int, args: argparse.Namespace) -> dict:
+    cmd = [
+        sys.executable,
+        "-m",
+        "benchmarks.run",
+        "--single",
+        str(size),
+        "--backend",
+        args.backend,
+        "--latency",
+        str(args.latency),
+        "--custom-checks",
+        str(args.custom_checks),
+        "--parallel",
+        str(args.parallel),
+        "--timeout",
+        str(args.timeout),
+        "--throttle",
+        str(args.throttle),
+        "--retries",
+        str(args.retries),
+        "--retry-delay",
+        str(args.retry_delay),
+    ]
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True, check=False)
+    if proc.returncode != 0:
+        raise RuntimeError(f"benchmark for size {size} failed:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout)
+
+
+def _format_delta(current: float, previous: float) -> str:
+    if not previous:
+        return ""
+    delta = (current - previous) / previous * 100
+    return f" ({delta:+.1f}%)"
+
+
+def print_report(runs: list[dict], baseline: dict | None = None) -> None:
+    previous = {run["size"]: run for run in (baseline or {}).get("runs", [])}
+    for run in runs:
+        before = previous.get(run["size"])
+        print(
+            f"size={run['size']} checks={run['checks']} fetches={run['fetches']} "
+            f"retries={run.get('retries', 0)} statuses={run['statuses']}"
+        )
+        for metric in COMPARED_METRICS:
+            value = run[metric]
+            delta = _format_delta(value, before[metric]) if before and metric in before else ""
+            print(f"  {metric:<14} {value}{delta}")
+
+
+def _parse_sizes(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=_parse_sizes, default=[100, 1000, 10000, 100000])
+    parser.add_argument("--backend", choices=("kubectl", "api"), default="kubectl")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated seconds per call")
+    parser.add_argument("--custom-checks", type=int, default=200, help="Synthetic checks added to the builtins")
+    parser.add_argument("--parallel", type=int, default=1)
+    parser.add_argument("--timeout", type=int, default=120)
+    parser.add_argument("--throttle", type=float, default=0.0, help="Fraction of list calls rejected with 429")
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--retry-delay", type=float, default=0.5, help="Base delay of the jittered backoff")
+    parser.add_argument("--save", help="Write results to this JSON baseline")
+    parser.add_argument("--compare", help="Show deltas against a saved JSON baseline")
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.single is not None:
+        print(json.dumps(run_single(args.single, args)))
+        return 0
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as fh:
+            baseline = json.load(fh)
+
+    runs = [_run_isolated(size, args) for size in args.sizes]
+    print_report(runs, baseline)
+
+    if args.save:
+        payload = {
+            "backend": args.backend,
+            "latency": args.latency,
+            "custom_checks": args.custom_checks,
+            "parallel": args.parallel,
+            "throttle": args.throttle,
+            "runs": runs,
+        }
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2)
+            fh.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""Check the CLI's startup import budget and the built-in catalog.
+
+Exits 1 when a fast command imports a module it should load on demand, when importing
+`kubeval.cli` exceeds the time budget, or when the built-in catalog is out of date.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --budget-ms 40 --runs 10
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that only scans need; none of them may load for --help or list-checks.
+FORBIDDEN = (
+    "ssl",
+    "http.client",
+    "subprocess",
+    "concurrent.futures",
+    "kubeval.application.checks.runner",
+    "kubeval.infrastructure.kubernetes.api_client",
+    "kubeval.infrastructure.kubernetes.kubectl_client",
+    "kubeval.infrastructure.cache.resource_cache",
+    "kubeval.infrastructure.manifests.manifest_client",
+)
+
+_PROBE = """
+import io, json, sys, contextlib
+from kubeval.cli import main
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        main({argv!r})
+    except SystemExit:
+        pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def loaded_modules(argv: list[str]) -> set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(argv=argv)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+def import_ms() -> float:
+    """Cumulative import time of kubeval.cli in a fresh interpreter, from -X importtime."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import kubeval.cli"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in proc.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "kubeval.cli":
+            return int(fields[1]) / 1000
+    raise RuntimeError("kubeval.cli missing from -X importtime output")
+
+
+def catalog_is_fresh() -> bool:
+    from kubeval.checks.builtin import _BUILTIN_CHECK_FILES, _CATALOG_FILE
+
+    with _CATALOG_FILE.open("r", encoding="utf-8") as fh:
+        catalog = json.load(fh)["checks"]
+    per_file = []
+    for path in _BUILTIN_CHECK_FILES:
+        with path.open("r", encoding="utf-8") as fh:
+            per_file.append(json.load(fh))
+    return catalog == per_file
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=80.0, help="Median import time allowed for kubeval.cli")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    failures = []
+    for command in (["--help"], ["list-checks"], ["list-checks", "--output", "json"]):
+        leaked = sorted(set(FORBIDDEN) & loaded_modules(command))
+        status = "ok" if not leaked else "FAIL"
+        print(f"{status:<4} kubeval {' '.join(command)}: {', '.join(leaked) or 'no scan-only imports'}")
+        if leaked:
+            failures.append(f"{' '.join(command)} imported {', '.join(leaked)}")
+
+    import_ms()  # warm the bytecode cache so the first sample is not an outlier
+    median = statistics.median(import_ms() for _ in range(args.runs))
+    status = "ok" if median <= args.budget_ms else "FAIL"
+    print(f"{status:<4} import kubeval.cli: {median:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if median > args.budget_ms:
+        failures.append(f"import kubeval.cli took {median:.1f} ms")
+
+    fresh = catalog_is_fresh()
+    print(f"{'ok' if fresh else 'FAIL':<4} built-in catalog matches check.json files")
+    if not fresh:
+        failures.append("catalog.json is stale; run `python -m kubeval.checks.builtin`")
+
+    for failure in failures:
+        print(f"ERROR: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
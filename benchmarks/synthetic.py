@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import os
+from typing import Iterator
+
+from kubeval.infrastructure.kubernetes.selectors import matches_requirements, parse_label_selector
+
+# Names the built-in checks look for, so every synthetic cluster passes them.
+ADDON_OBJECTS = {
+    "deployment": [
+        ("kube-system", "coredns"),
+        ("kube-system", "metrics-server"),
+        ("kube-system", "ebs-csi-controller"),
+        ("kube-system", "cluster-autoscaler"),
+    ],
+    "daemonset": [
+        ("kube-system", "aws-node"),
+        ("kube-system", "kube-proxy"),
+        ("kube-system", "ebs-csi-node"),
+    ],
+}
+NAMESPACES = 50
+
+
+def _api_resource(name: str, kind: str, namespaced: bool = True, short_names: tuple = ()) -> dict:
+    return {
+        "name": name,
+        "kind": kind,
+        "namespaced": namespaced,
+        "shortNames": list(short_names),
+        "verbs": ["get", "list", "watch"],
+    }
+
+
+# API discovery documents of the synthetic cluster, including one CRD group (Karpenter).
+DISCOVERY = {
+    "/api/v1": {
+        "kind": "APIResourceList",
+        "groupVersion": "v1",
+        "resources": [
+            _api_resource("pods", "Pod", short_names=("po",)),
+            {"name": "pods/log", "kind": "Pod", "namespaced": True, "verbs": ["get"]},
+            _api_resource("namespaces", "Namespace", namespaced=False, short_names=("ns",)),
+        ],
+    },
+    "/apis": {
+        "kind": "APIGroupList",
+        "groups": [
+            {"name": "apps", "preferredVersion": {"groupVersion": "apps/v1", "version": "v1"}},
+            {
+                "name": "karpenter.sh",
+                "preferredVersion": {"groupVersion": "karpenter.sh/v1", "version": "v1"},
+            },
+        ],
+    },
+    "/apis/apps/v1": {
+        "kind": "APIResourceList",
+        "groupVersion": "apps/v1",
+        "resources": [
+            _api_resource("deployments", "Deployment", short_names=("deploy",)),
+            _api_resource("daemonsets", "DaemonSet", short_names=("ds",)),
+        ],
+    },
+    "/apis/karpenter.sh/v1": {
+        "kind": "APIResourceList",
+        "groupVersion": "karpenter.sh/v1",
+        "resources": [
+            _api_resource("nodepools", "NodePool", namespaced=False),
+            _api_resource("nodeclaims", "NodeClaim", namespaced=False),
+        ],
+    },
+}
+
+
+def cluster_size() -> int:
+    return int(os.environ.get("KUBEVAL_BENCH_OBJECTS", "100"))
+
+
+def kind_key(resource: str) -> str:
+    name = resource.lower().split(".", 1)[0]
+    aliases = {"deploy": "deployment", "deployments": "deployment", "ds": "daemonset", "daemonsets": "daemonset"}
+    return aliases.get(name, name.rstrip("s"))
+
+
+def labels_for(name: str) -> dict[str, str]:
+    return {"k8s-app": name}
+
+
+def iter_objects(
+    resource: str,
+    namespace: str | None,
+    size: int,
+    label_selector: str | None = None,
+) -> Iterator[tuple[str, str]]:
+    """Yield (namespace, name) pairs for a synthetic list of `size` objects per resource kind."""
+    requirements = parse_label_selector(label_selector) if label_selector else []
+    kind = kind_key(resource)
+
+    def _selected(ns: str, name: str) -> bool:
+        in_namespace = namespace is None or ns == namespace
+        return in_namespace and matches_requirements(requirements, labels_for(name))
+
+    for ns, name in ADDON_OBJECTS.get(kind, []):
+        if _selected(ns, name):
+            yield ns, name
+    for i in range(size):
+        ns = f"team-{i % NAMESPACES}"
+        name = f"{kind}-app-{i}"
+        if _selected(ns, name):
+            yield ns, name
+
+
+def synthetic_object(namespace: str, name: str, with_status: bool) -> dict:
+    obj: dict = {"metadata": {"name": name, "namespace": namespace, "labels": labels_for(name)}}
+    if with_status:
+        obj["spec"] = {
+            "replicas": 2,
+            "template": {"spec": {"containers": [{"name": "app", "image": f"registry.example/{name}:1.0"}]}},
+        }
+        obj["status"] = {"readyReplicas": 2, "numberReady": 2}
+    return obj
+
+
+def column_value(obj: dict, path: str) -> str:
+    """Evaluate the small JSONPath subset kubeval puts in `custom-columns`."""
+    node: object = obj
+    parts = path.strip(".").split(".")
+    for pos, part in enumerate(parts):
+        if part.endswith("[*]"):
+            items = node.get(part[:-3]) if isinstance(node, dict) else None
+            if not items:
+                return "<none>"
+            values = [column_value(item, "." + ".".join(parts[pos + 1 :])) for item in items]
+            return ",".join(values)
+        node = node.get(part) if isinstance(node, dict) else None
+        if node is None:
+            return "<none>"
+    return str(node)
@@ -1,3 +1,37 @@
-from kubeval.application.checks.runner import matches_name, run_checks, run_resource_check
+from __future__ import annotations
 
-__all__ = ["matches_name", "run_resource_check", "run_checks"]
+import importlib
+from typing import Any
+
+# Resolved on first access so the check loaders can import `matcher` without loading the
+# runner and every backend behind it.
+_RUNNER = "kubeval.application.checks.runner"
+_EXPORTS = {
+    "CHECK_STARTED": _RUNNER,
+    "CHECK_FINISHED": _RUNNER,
+    "matches_name": _RUNNER,
+    "evaluate_check": _RUNNER,
+    "condition_failures": _RUNNER,
+    "plan_fetches": _RUNNER,
+    "run_resource_check": _RUNNER,
+    "run_checks": _RUNNER,
+    "FetchStrategy": "kubeval.application.checks.fetching",
+    "plan_calls": "kubeval.application.checks.fetching",
+    "PolicyBuffer": "kubeval.application.checks.streaming",
+    "resolve_checks": "kubeval.application.checks.resolution",
+    "Baseline": "kubeval.application.checks.baseline",
+    "load_baseline": "kubeval.application.checks.baseline",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
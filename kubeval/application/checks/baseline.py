@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+from kubeval.domain.models import (
+    CHANGE_NEW,
+    CHANGE_NEWLY_FAILING,
+    CHANGE_NEWLY_PASSING,
+    CHANGE_UNCHANGED,
+    CheckResult,
+    PASS,
+    ResourceCheck,
+    ResourceRef,
+    to_dict,
+)
+
+
+def _digest(value: Any) -> str:
+    raw = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def fingerprint_resources(resources: list[ResourceRef]) -> str:
+    """Content hash of a fetched list, independent of the order the backend returned it in."""
+    return _digest(sorted((to_dict(r) for r in resources), key=lambda r: (r["namespace"], r["name"])))
+
+
+def fingerprint_check(check: ResourceCheck, resources_fingerprint: str) -> str:
+    return _digest({"check": to_dict(check), "resources": resources_fingerprint})
+
+
+class Baseline:
+    """Results of an earlier scan, reused for checks whose definition and list are unchanged."""
+
+    def __init__(self, results: Iterable[CheckResult], exclude: Iterable[str] = ()) -> None:
+        self.results = {result.check_id: result for result in results}
+        # Results a policy rewrote are stored as rewritten, so their checks are always re-evaluated.
+        self._exclude = set(exclude)
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any], exclude: Iterable[str] = ()) -> Baseline:
+        """Read the `results` of a scan's `--output json` payload, raising ValueError."""
+        if not isinstance(payload, dict) or not isinstance(payload.get("results"), list):
+            raise ValueError("expected the JSON output of an earlier scan with a 'results' list")
+        results = []
+        for raw in payload["results"]:
+            try:
+                results.append(
+                    CheckResult(
+                        check_id=str(raw["check_id"]),
+                        title=str(raw["title"]),
+                        status=str(raw["status"]),
+                        details=str(raw["details"]),
+                        fingerprint=raw.get("fingerprint"),
+                    )
+                )
+            except (KeyError, TypeError) as exc:
+                raise ValueError(f"invalid result entry {raw!r}") from exc
+        return cls(results, exclude)
+
+    def reuse(self, check_id: str, fingerprint: str) -> CheckResult | None:
+        previous = self.results.get(check_id)
+        if previous is None or previous.fingerprint != fingerprint or check_id in self._exclude:
+            return None
+        return CheckResult(
+            check_id=previous.check_id,
+            title=previous.title,
+            status=previous.status,
+            details=previous.details,
+            fingerprint=fingerprint,
+        )
+
+    def classify(self, result: CheckResult) -> CheckResult:
+        """Set `result.change` from the baseline status of the same check; returns `result`."""
+        previous = self.results.get(result.check_id)
+        if previous is None:
+            result.change = CHANGE_NEW
+        elif previous.status == PASS and result.status != PASS:
+            result.change = CHANGE_NEWLY_FAILING
+        elif previous.status != PASS and result.status == PASS:
+            result.change = CHANGE_NEWLY_PASSING
+        else:
+            result.change = CHANGE_UNCHANGED
+        return result
+
+
+def load_baseline(path: str, exclude: Iterable[str] = ()) -> tuple[Baseline | None, str | None]:
+    try:
+        with Path(path).expanduser().open("r", encoding="utf-8") as fh:
+            return Baseline.from_payload(json.load(fh), exclude), None
+    except (OSError, ValueError) as exc:
+        return None, f"unable to load baseline '{path}': {exc}"
+
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import AbstractSet, Optional, Tuple
+
+from kubeval.domain.models import ResourceRef
+
+# (resource, namespace, label selector, field selector)
+FetchKey = Tuple[str, Optional[str], Optional[str], Optional[str]]
+# (resource, label selector, field selector): lists that differ only in namespace.
+KindKey = Tuple[str, Optional[str], Optional[str]]
+
+
+@dataclass
+class FetchCall:
+    """One list call, serving every plan group in `groups`.
+
+    A cluster-wide call serves namespaced groups too; their objects are picked out by
+    namespace after the call, so each group sees the same list a namespaced call returns.
+    """
+
+    key: FetchKey
+    groups: list[FetchKey]
+
+    @property
+    def batched(self) -> int:
+        """Namespaced groups this call lists at once."""
+        return sum(1 for key in self.groups if key != self.key)
+
+
+def kind_of(key: FetchKey) -> KindKey:
+    resource, _, label_selector, field_selector = key
+    return resource, label_selector, field_selector
+
+
+class FetchStrategy:
+    """Choose, per resource kind, between one cluster-wide list and a call per namespace.
+
+    A call is weighed as `call_cost` objects on top of the objects it returns, using counts
+    observed in earlier calls: of this run, or of earlier runs sharing the strategy. A kind
+    with no cluster-wide count yet is listed per namespace, as its size is unknown: a large
+    population would otherwise be listed in full just to serve a few namespaces.
+    """
+
+    def __init__(self, call_cost: float = 500.0) -> None:
+        self.call_cost = call_cost
+        self._totals: dict[KindKey, int] = {}
+        self._namespaced: dict[KindKey, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key: FetchKey, resources: list[ResourceRef]) -> None:
+        kind = kind_of(key)
+        namespace = key[1]
+        with self._lock:
+            counts = self._namespaced.setdefault(kind, {})
+            if namespace is None:
+                self._totals[kind] = len(resources)
+                # A full list also tells how many objects each namespace holds, absent ones none.
+                counts.update(dict.fromkeys(counts, 0))
+                counts.update(Counter(r.namespace for r in resources))
+            else:
+                counts[namespace] = len(resources)
+
+    def _estimates(self, kind: KindKey) -> tuple[int | None, dict[str, int]]:
+        # Without selectors a kind holds every selected object, so its counts bound them.
+        unselected = (kind[0], None, None)
+        total = self._totals.get(kind, self._totals.get(unselected))
+        counts = self._namespaced.get(kind) or self._namespaced.get(unselected) or {}
+        return total, dict(counts)
+
+    def batch(self, kind: KindKey, namespaces: list[str]) -> bool:
+        """Whether one cluster-wide list of `kind` is cheaper than listing each of `namespaces`."""
+        if len(namespaces) < 2:
+            return False
+        with self._lock:
+            total, counts = self._estimates(kind)
+        if total is None:
+            return False
+        known = [counts[ns] for ns in namespaces if ns in counts]
+        fallback = sum(known) / len(known) if known else 0.0
+        scoped = sum(counts.get(ns, fallback) for ns in namespaces)
+        return self.call_cost + total <= len(namespaces) * self.call_cost + scoped
+
+    def calls_for(
+        self,
+        groups: list[FetchKey],
+        status_keys: AbstractSet[FetchKey] = frozenset(),
+    ) -> list[FetchCall]:
+        """Calls serving namespaced `groups` of one kind, batched if that is cheaper.
+
+        Groups needing status (`status_keys`) are never batched: a cluster-wide list would
+        carry status columns of every object in the cluster.
+        """
+        resource, label_selector, field_selector = kind_of(groups[0])
+        batchable = [key for key in groups if key not in status_keys]
+        calls = [FetchCall(key, [key]) for key in groups if key in status_keys]
+        if self.batch((resource, label_selector, field_selector), [key[1] or "" for key in batchable]):
+            return [FetchCall((resource, None, label_selector, field_selector), batchable), *calls]
+        return [*(FetchCall(key, [key]) for key in batchable), *calls]
+
+
+def plan_calls(
+    plan: dict[FetchKey, list[int]],
+    strategy: FetchStrategy,
+    status_keys: AbstractSet[FetchKey] = frozenset(),
+) -> tuple[list[FetchCall], list[list[FetchKey]]]:
+    """List calls serving `plan`, and the namespaced groups to decide once those have run.
+
+    Namespaced groups join a cluster-wide list the plan already makes of the same kind,
+    unless they need status (`status_keys`) and it does not: that would turn a metadata-only
+    list of the whole cluster into one of full objects. Groups left out that way, and groups
+    with selectors whose resource the plan lists cluster-wide without selectors, wait for the
+    first calls: the count of that list is then known and bounds theirs.
+    """
+    families: dict[KindKey, list[FetchKey]] = {}
+    for key in plan:
+        families.setdefault(kind_of(key), []).append(key)
+    unselected_wide = {key[0] for key in plan if key[1:] == (None, None, None)}
+
+    calls: list[FetchCall] = []
+    deferred: list[list[FetchKey]] = []
+    for kind, keys in families.items():
+        wide = next((key for key in keys if key[1] is None), None)
+        scoped = [key for key in keys if key[1] is not None]
+        if wide is not None:
+            joined = [key for key in scoped if wide in status_keys or key not in status_keys]
+            calls.append(FetchCall(wide, [wide, *joined]))
+            scoped = [key for key in scoped if key not in joined]
+        if not scoped:
+            continue
+        if len(scoped) == 1:
+            calls.append(FetchCall(scoped[0], scoped))
+        elif wide is not None or ((kind[1] or kind[2]) and kind[0] in unselected_wide):
+            deferred.append(scoped)
+        else:
+            calls.extend(strategy.calls_for(scoped, status_keys))
+    return calls, deferred
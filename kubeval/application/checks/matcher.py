@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Pattern
+
+from kubeval.domain.models import ResourceCheck, ResourceRef
+
+# Below this many `contains` patterns plain substring tests beat walking the automaton.
+_AUTOMATON_MIN_PATTERNS = 8
+
+
+@lru_cache(maxsize=None)
+def compile_regex(pattern: str) -> Pattern[str]:
+    return re.compile(pattern)
+
+
+class _SubstringAutomaton:
+    """Aho-Corasick automaton reporting every pattern contained in a name in one pass."""
+
+    def __init__(self, patterns: dict[str, list[int]]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[list[int]] = [[]]
+        for pattern, positions in patterns.items():
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._out.append([])
+                state = nxt
+            self._out[state].extend(positions)
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def search(self, text: str) -> set[int]:
+        goto, fail, out = self._goto, self._fail, self._out
+        found: set[int] = set(out[0])
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class MatcherIndex:
+    """Checks compiled once so a single pass over a resource list resolves all of them."""
+
+    def __init__(self, checks: list[ResourceCheck]) -> None:
+        self.size = len(checks)
+        self._exact: dict[str, list[int]] = {}
+        self._contains: dict[str, list[int]] = {}
+        self._regex: list[tuple[Pattern[str], int]] = []
+        for pos, check in enumerate(checks):
+            if check.match_type == "exact":
+                self._exact.setdefault(check.match_value, []).append(pos)
+            elif check.match_type == "contains":
+                self._contains.setdefault(check.match_value, []).append(pos)
+            elif check.match_type == "regex":
+                self._regex.append((compile_regex(check.match_value), pos))
+        self._automaton = (
+            _SubstringAutomaton(self._contains)
+            if len(self._contains) >= _AUTOMATON_MIN_PATTERNS
+            else None
+        )
+
+    def _contains_hits(self, name: str) -> list[int]:
+        if self._automaton is not None:
+            return list(self._automaton.search(name))
+        hits: list[int] = []
+        for value, positions in self._contains.items():
+            if value in name:
+                hits.extend(positions)
+        return hits
+
+    def match(self, resources: list[ResourceRef]) -> list[list[ResourceRef]]:
+        """Return, per check position, the resources whose name matches that check."""
+        matches: list[list[ResourceRef]] = [[] for _ in range(self.size)]
+        for ref in resources:
+            name = ref.name
+            for pos in self._exact.get(name, ()):
+                matches[pos].append(ref)
+            if self._contains:
+                for pos in self._contains_hits(name):
+                    matches[pos].append(ref)
+            for pattern, pos in self._regex:
+                if pattern.search(name) is not None:
+                    matches[pos].append(ref)
+        return matches
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Callable, List, Optional, Tuple
+
+from kubeval.domain.models import ResourceCheck
+from kubeval.infrastructure.kubernetes.backend import KubernetesBackend
+from kubeval.infrastructure.kubernetes.discovery import (
+    DiscoveryStore,
+    RawGetter,
+    ResourceResolver,
+    discover_resources,
+)
+from kubeval.infrastructure.kubernetes.resources import ResourceType, resolve_resource
+
+# resolve_checks with its store bound: (checks, backend) -> (resolved checks, error).
+CheckResolver = Callable[
+    [List[ResourceCheck], KubernetesBackend],
+    Tuple[Optional[List[ResourceCheck]], Optional[str]],
+]
+
+
+def _resolver(
+    get_raw: RawGetter,
+    server: str | None,
+    names: list[str],
+    store: DiscoveryStore | None,
+    refresh: bool,
+) -> tuple[ResourceResolver | None, str | None]:
+    if store is not None and server and not refresh:
+        cached = store.get(server)
+        if cached is not None:
+            resolver = ResourceResolver(cached)
+            # A name the cached kinds lack may be a kind installed since: discover again.
+            if all(resolver.resolve(name) is not None for name in names):
+                return resolver, None
+    resource_types, err = discover_resources(get_raw)
+    if err:
+        return None, err
+    if store is not None and server:
+        store.put(server, resource_types)
+    return ResourceResolver(resource_types), None
+
+
+def canonical_check(check: ResourceCheck, resource_type: ResourceType) -> ResourceCheck:
+    """`check` naming its kind canonically; a namespace on a cluster-scoped kind is dropped."""
+    namespace = check.namespace if resource_type.namespaced else None
+    return replace(check, resource=resource_type.name, namespace=namespace)
+
+
+def resolve_checks(
+    checks: list[ResourceCheck],
+    backend: KubernetesBackend,
+    store: DiscoveryStore | None = None,
+    refresh: bool = False,
+) -> tuple[list[ResourceCheck] | None, str | None]:
+    """Resolve the kind of every check up front, so a bad one fails before any list call.
+
+    Built-in kinds resolve from a table. Other names are looked up in the cluster's API
+    discovery, read once per scan and kept in `store` per cluster (`refresh` skips it).
+    Resolved checks name their kind canonically (`daemonsets.v1.apps`), so aliases of a kind
+    share one list call. Backends without discovery (manifests) keep the names the table
+    lacks, as they match those by kind.
+    """
+    names = list(dict.fromkeys(check.resource for check in checks))
+    resolved = {name: resolve_resource(name) for name in names}
+    unresolved = [name for name in names if resolved[name] is None]
+    get_raw: RawGetter | None = getattr(backend, "get_raw", None)
+    if unresolved and get_raw is not None:
+        resolver, err = _resolver(get_raw, backend.cluster_server(), unresolved, store, refresh)
+        if resolver is None:
+            return None, f"API discovery failed: {err}"
+        resolved.update((name, resolver.resolve(name)) for name in unresolved)
+        unknown = [check for check in checks if resolved[check.resource] is None]
+        if unknown:
+            listed = ", ".join(f"'{check.resource}' (check '{check.check_id}')" for check in unknown)
+            return None, f"the cluster serves no resource kind named {listed}"
+
+    return [
+        check if resolved[check.resource] is None else canonical_check(check, resolved[check.resource])
+        for check in checks
+    ], None
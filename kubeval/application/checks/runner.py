@@ -1,9 +1,30 @@
 from __future__ import annotations
 
-import re
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
 
-from kubeval.domain.models import CheckResult, ERROR, FAIL, PASS, ResourceCheck
-from kubeval.infrastructure.kubernetes.kubectl_client import KubectlClient
+from kubeval.application.checks.baseline import Baseline, fingerprint_check, fingerprint_resources
+from kubeval.application.checks.fetching import FetchCall, FetchKey, FetchStrategy, plan_calls
+from kubeval.application.checks.matcher import MatcherIndex, compile_regex
+from kubeval.domain.models import (
+    CheckResult,
+    ERROR,
+    FAIL,
+    PASS,
+    ResourceCheck,
+    ResourceRef,
+    ScanStats,
+    Timings,
+)
+from kubeval.infrastructure.kubernetes.backend import KubernetesBackend
+
+CHECK_STARTED = "started"
+CHECK_FINISHED = "finished"
+
+CheckEventHandler = Callable[[str, int, ResourceCheck, Optional[CheckResult]], None]
 
 
 def matches_name(name: str, match_type: str, match_value: str) -> bool:
@@ -12,16 +33,49 @@ def matches_name(name: str, match_type: str, match_value: str) -> bool:
     if match_type == "contains":
         return match_value in name
     if match_type == "regex":
-        return re.search(match_value, name) is not None
+        return compile_regex(match_value).search(name) is not None
     return False
 
 
-def run_resource_check(check: ResourceCheck, client: KubectlClient) -> CheckResult:
-    resources, err = client.get_resources(resource=check.resource, namespace=check.namespace)
+def evaluate_check(
+    check: ResourceCheck,
+    resources: list[ResourceRef],
+    err: str | None = None,
+) -> CheckResult:
     if err:
         return CheckResult(check_id=check.check_id, title=check.title, status=ERROR, details=err)
-
     matches = [r for r in resources if matches_name(r.name, check.match_type, check.match_value)]
+    return build_result(check, matches)
+
+
+def condition_failures(check: ResourceCheck, ref: ResourceRef) -> list[str]:
+    """Describe each condition `ref` violates; fields the backend could not report are skipped."""
+    failures: list[str] = []
+    if check.min_ready is not None and ref.ready is not None and ref.ready < check.min_ready:
+        failures.append(f"ready {ref.ready} < {check.min_ready}")
+    max_unavailable = check.max_unavailable
+    if max_unavailable is not None and ref.unavailable is not None and ref.unavailable > max_unavailable:
+        failures.append(f"unavailable {ref.unavailable} > {check.max_unavailable}")
+    if check.image_regex is not None:
+        pattern = compile_regex(check.image_regex)
+        mismatched = [image for image in ref.images or [] if pattern.search(image) is None]
+        if mismatched:
+            failures.append(f"image {', '.join(mismatched)} does not match '{check.image_regex}'")
+    return failures
+
+
+def build_result(check: ResourceCheck, matches: list[ResourceRef]) -> CheckResult:
+    unhealthy: list[str] = []
+    if check.has_conditions:
+        healthy: list[ResourceRef] = []
+        for ref in matches:
+            failures = condition_failures(check, ref)
+            if failures:
+                unhealthy.append(f"{ref.namespace}/{ref.name} ({'; '.join(failures)})")
+            else:
+                healthy.append(ref)
+        matches = healthy
+
     if len(matches) >= check.min_count:
         matched_text = ", ".join(f"{r.namespace}/{r.name}" for r in matches)
         return CheckResult(
@@ -32,6 +86,19 @@ def run_resource_check(check: ResourceCheck, client: KubectlClient) -> CheckResu
         )
 
     ns_text = check.namespace if check.namespace else "all namespaces"
+    selectors = [sel for sel in (check.label_selector, check.field_selector) if sel]
+    if selectors:
+        ns_text += f" selected by {', '.join(selectors)}"
+    if unhealthy:
+        return CheckResult(
+            check_id=check.check_id,
+            title=check.title,
+            status=FAIL,
+            details=(
+                f"Expected at least {check.min_count} healthy match(es) for {check.resource} "
+                f"in {ns_text}; unhealthy: {', '.join(unhealthy)}"
+            ),
+        )
     return CheckResult(
         check_id=check.check_id,
         title=check.title,
@@ -43,5 +110,186 @@ def run_resource_check(check: ResourceCheck, client: KubectlClient) -> CheckResu
     )
 
 
-def run_checks(checks: list[ResourceCheck], client: KubectlClient) -> list[CheckResult]:
-    return [run_resource_check(check, client) for check in checks]
+def run_resource_check(check: ResourceCheck, client: KubernetesBackend) -> CheckResult:
+    resources, err = client.get_resources(
+        resource=check.resource,
+        namespace=check.namespace,
+        with_status=check.has_conditions,
+        label_selector=check.label_selector,
+        field_selector=check.field_selector,
+    )
+    return evaluate_check(check, resources, err)
+
+
+def plan_fetches(checks: list[ResourceCheck]) -> dict[FetchKey, list[int]]:
+    """Group check indexes by the list call that serves them, in first-seen order."""
+    plan: dict[FetchKey, list[int]] = {}
+    for idx, check in enumerate(checks):
+        key = (check.resource, check.namespace, check.label_selector, check.field_selector)
+        plan.setdefault(key, []).append(idx)
+    return plan
+
+
+def needs_status(checks: list[ResourceCheck], indexes: list[int]) -> bool:
+    """Whether the list serving `indexes` must carry status; one fetch then covers every check."""
+    return any(checks[idx].has_conditions for idx in indexes)
+
+
+def record_plan(stats: ScanStats, checks: list[ResourceCheck], calls: int, batched: int = 0) -> None:
+    stats.checks += len(checks)
+    stats.fetches += calls
+    stats.fetches_saved += len(checks) - calls
+    stats.batched += batched
+
+
+def _cache_counters(client: KubernetesBackend) -> tuple[int, int]:
+    return getattr(client, "cache_hits", 0), getattr(client, "cache_misses", 0)
+
+
+def run_checks(
+    checks: list[ResourceCheck],
+    client: KubernetesBackend,
+    stats: ScanStats | None = None,
+    workers: int = 1,
+    on_event: CheckEventHandler | None = None,
+    baseline: Baseline | None = None,
+    fingerprint: bool = False,
+    deadline_seconds: float | None = None,
+    strategy: FetchStrategy | None = None,
+) -> list[CheckResult]:
+    """Run checks with at most `workers` list calls in flight; results keep check order.
+
+    Checks sharing a list are served by one call, and namespaced lists of one kind by a
+    single cluster-wide call when `strategy` (a fresh FetchStrategy by default) expects
+    that to be cheaper. With `fingerprint` (implied by `baseline`) each result records a
+    fingerprint of its check and list; checks whose fingerprint matches the baseline reuse
+    its result unevaluated. With `deadline_seconds`, each list call gets an equal share of
+    the time left for the calls still waiting to start, and calls that would start past the
+    deadline are skipped.
+    """
+    fingerprint = fingerprint or baseline is not None
+    strategy = strategy or FetchStrategy()
+    plan = plan_fetches(checks)
+    status_keys = {key for key, indexes in plan.items() if needs_status(checks, indexes)}
+    calls, deferred = plan_calls(plan, strategy, status_keys)
+    results: list[CheckResult | None] = [None] * len(checks)
+    reused_counts: dict[FetchKey, int] = {}
+    call_timings: list[Timings] = []
+    made: list[FetchCall] = []
+    # Deferred groups count as one call each until decided.
+    pending = len(calls) + sum(len(groups) for groups in deferred)
+    lanes = max(1, min(workers, pending))
+    pending_lock = threading.Lock()
+    hits_before, misses_before = _cache_counters(client)
+    scan_started = time.perf_counter()
+
+    def _call_budget() -> float | None:
+        nonlocal pending
+        if deadline_seconds is None:
+            return None
+        with pending_lock:
+            rounds = math.ceil(pending / lanes)
+            pending -= 1
+        return (deadline_seconds - (time.perf_counter() - scan_started)) / rounds
+
+    def _run_call(call: FetchCall) -> None:
+        resource, namespace, label_selector, field_selector = call.key
+        indexes = [idx for key in call.groups for idx in plan[key]]
+        if on_event is not None:
+            for idx in indexes:
+                on_event(CHECK_STARTED, idx, checks[idx], None)
+        timings = Timings(started_at=time.perf_counter() - scan_started, checks=len(indexes))
+        call_timings.append(timings)
+        made.append(call)
+        budget = _call_budget()
+        if budget is not None and budget <= 0:
+            resources, err = [], f"scan deadline of {deadline_seconds:g}s reached before listing {resource}"
+        else:
+            resources, err = client.get_resources(
+                resource=resource,
+                namespace=namespace,
+                timings=timings,
+                with_status=needs_status(checks, indexes),
+                label_selector=label_selector,
+                field_selector=field_selector,
+                timeout=budget,
+            )
+        if not err:
+            strategy.observe(call.key, resources)
+        by_namespace: dict[str, list[ResourceRef]] = {}
+        if call.batched:
+            for ref in resources:
+                by_namespace.setdefault(ref.namespace, []).append(ref)
+        for key in call.groups:
+            group_resources = resources if key == call.key else by_namespace.get(key[1] or "", [])
+            _evaluate_group(key, group_resources, err, timings)
+
+    def _evaluate_group(
+        key: FetchKey,
+        resources: list[ResourceRef],
+        err: str | None,
+        timings: Timings,
+    ) -> None:
+        indexes = plan[key]
+        if err:
+            group_results = [evaluate_check(checks[idx], [], err) for idx in indexes]
+        else:
+            fingerprints: list[str | None] = [None] * len(indexes)
+            reused: list[CheckResult | None] = [None] * len(indexes)
+            if fingerprint:
+                list_fingerprint = fingerprint_resources(resources)
+                fingerprints = [fingerprint_check(checks[idx], list_fingerprint) for idx in indexes]
+            if baseline is not None:
+                reused = [
+                    baseline.reuse(checks[idx].check_id, fp or "") for idx, fp in zip(indexes, fingerprints)
+                ]
+            match_started = time.perf_counter()
+            # The group shares one matcher, only built when a result is not reused from the baseline.
+            matched: list[list[ResourceRef]] = []
+            if None in reused:
+                matched = MatcherIndex([checks[idx] for idx in indexes]).match(resources)
+            timings.match_seconds += time.perf_counter() - match_started
+            reused_counts[key] = len(indexes) - reused.count(None)
+            group_results = []
+            for pos, idx in enumerate(indexes):
+                result = reused[pos]
+                if result is None:
+                    result = build_result(checks[idx], matched[pos])
+                    result.fingerprint = fingerprints[pos]
+                group_results.append(result)
+        for idx, result in zip(indexes, group_results):
+            result.timings = timings
+            results[idx] = result
+            if on_event is not None:
+                on_event(CHECK_FINISHED, idx, checks[idx], result)
+
+    def _run_all(batch: list[FetchCall]) -> None:
+        if workers <= 1 or len(batch) <= 1:
+            for call in batch:
+                _run_call(call)
+            return
+        with ThreadPoolExecutor(max_workers=min(workers, len(batch))) as pool:
+            futures = [pool.submit(_run_call, call) for call in batch]
+            for future in futures:
+                future.result()
+
+    _run_all(calls)
+    if deferred:
+        # Decided now, with the counts of the cluster-wide lists that just ran.
+        later: list[FetchCall] = []
+        for groups in deferred:
+            decided = strategy.calls_for(groups, status_keys)
+            with pending_lock:
+                pending -= len(groups) - len(decided)
+            later.extend(decided)
+        _run_all(later)
+
+    if stats is not None:
+        record_plan(stats, checks, len(made), sum(call.batched for call in made))
+        stats.wall_seconds += time.perf_counter() - scan_started
+        stats.reused += sum(reused_counts.values())
+        stats.retries += sum(t.retries for t in call_timings)
+        hits_after, misses_after = _cache_counters(client)
+        stats.cache_hits += hits_after - hits_before
+        stats.cache_misses += misses_after - misses_before
+    return [r for r in results if r is not None]
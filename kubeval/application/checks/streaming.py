@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, List, Sequence, Tuple
+
+from kubeval.domain.models import CheckResult, PolicyOutcome, ResourceCheck
+
+PolicyApplier = Callable[[List[CheckResult]], List[PolicyOutcome]]
+# Check IDs a policy reads, and a callable applying it to their results.
+ResultPolicy = Tuple[Sequence[str], PolicyApplier]
+ResultSink = Callable[[CheckResult], None]
+OutcomeSink = Callable[[PolicyOutcome], None]
+
+
+@dataclass
+class _PolicyGroup:
+    members: list[str]
+    policies: list[PolicyApplier]
+    held: dict[str, CheckResult] = field(default_factory=dict)
+
+
+class PolicyBuffer:
+    """Pass results on as they finish, holding back those a policy may still rewrite.
+
+    A held result is released, with its policies applied, once every check those policies
+    read has finished; policies sharing a check are held and applied together, in order.
+    Results outside any policy are never buffered. Policy outcomes are kept in `outcomes`
+    and passed to `emit_outcome` as they are decided.
+    """
+
+    def __init__(
+        self,
+        checks: list[ResourceCheck],
+        policies: list[ResultPolicy],
+        emit: ResultSink,
+        emit_outcome: OutcomeSink | None = None,
+    ) -> None:
+        self.emit = emit
+        self.emit_outcome = emit_outcome
+        self.outcomes: list[PolicyOutcome] = []
+        present = list(dict.fromkeys(c.check_id for c in checks))
+        self._group_of: dict[str, _PolicyGroup] = {}
+        for check_ids, policy in policies:
+            members = [check_id for check_id in present if check_id in check_ids]
+            if not members:
+                continue
+            group = _PolicyGroup(members=[], policies=[])
+            for other in {id(g): g for g in (self._group_of.get(m) for m in members) if g}.values():
+                group.members.extend(other.members)
+                group.policies.extend(other.policies)
+            group.members.extend(m for m in members if m not in group.members)
+            group.policies.append(policy)
+            for check_id in group.members:
+                self._group_of[check_id] = group
+        self._lock = threading.Lock()
+
+    def add(self, result: CheckResult) -> None:
+        outcomes: list[PolicyOutcome] = []
+        with self._lock:
+            group = self._group_of.get(result.check_id)
+            if group is None:
+                ready = [result]
+            else:
+                group.held[result.check_id] = result
+                if len(group.held) < len(group.members):
+                    return
+                ready = [group.held[check_id] for check_id in group.members]
+                for policy in group.policies:
+                    outcomes.extend(policy(ready))
+                self.outcomes.extend(outcomes)
+        for item in ready:
+            self.emit(item)
+        if self.emit_outcome is not None:
+            for outcome in outcomes:
+                self.emit_outcome(outcome)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import queue
+import threading
+from dataclasses import replace
+from typing import Callable, List, Optional, Tuple
+
+from kubeval.application.checks.matcher import MatcherIndex
+from kubeval.application.checks.runner import FetchKey, build_result, needs_status, plan_fetches
+from kubeval.domain.models import (
+    ERROR,
+    WATCH_DELETED,
+    WATCH_ERROR,
+    WATCH_SYNCED,
+    CheckResult,
+    ResourceCheck,
+    ResourceRef,
+    WatchEvent,
+)
+from kubeval.infrastructure.kubernetes.backend import WatchableBackend
+
+ObjectKey = Tuple[str, str]
+ChangeHandler = Callable[[CheckResult, Optional[CheckResult]], None]
+ResultsFinalizer = Callable[[List[CheckResult]], None]
+
+
+class CheckWatcher:
+    """Keeps check results current from watch events, re-evaluating only affected checks."""
+
+    def __init__(
+        self,
+        checks: list[ResourceCheck],
+        client: WatchableBackend,
+        on_change: ChangeHandler,
+        finalize: ResultsFinalizer | None = None,
+    ) -> None:
+        self.checks = checks
+        self.client = client
+        self.on_change = on_change
+        self.finalize = finalize
+        self.plan = plan_fetches(checks)
+        self._matchers = {
+            key: MatcherIndex([checks[idx] for idx in indexes]) for key, indexes in self.plan.items()
+        }
+        self._objects: dict[FetchKey, dict[ObjectKey, ResourceRef]] = {key: {} for key in self.plan}
+        self._matched: list[dict[ObjectKey, ResourceRef]] = [{} for _ in checks]
+        self._raw: list[CheckResult | None] = [None] * len(checks)
+        self._reported: list[CheckResult | None] = [None] * len(checks)
+
+    def run(self, stop_event: threading.Event) -> None:
+        events: queue.Queue[tuple[FetchKey, WatchEvent]] = queue.Queue()
+
+        def _follow(key: FetchKey) -> None:
+            resource, namespace, label_selector, field_selector = key
+            events_iter = self.client.watch_resources(
+                resource,
+                namespace,
+                stop_event,
+                with_status=needs_status(self.checks, self.plan[key]),
+                label_selector=label_selector,
+                field_selector=field_selector,
+            )
+            for event in events_iter:
+                events.put((key, event))
+                if stop_event.is_set():
+                    return
+
+        for key in self.plan:
+            threading.Thread(target=_follow, args=(key,), daemon=True).start()
+
+        while not stop_event.is_set():
+            try:
+                key, event = events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            self.apply(key, event)
+
+    def apply(self, key: FetchKey, event: WatchEvent) -> None:
+        indexes = self.plan[key]
+        matcher = self._matchers[key]
+        objects = self._objects[key]
+
+        if event.type == WATCH_ERROR:
+            for idx in indexes:
+                check = self.checks[idx]
+                self._raw[idx] = CheckResult(
+                    check_id=check.check_id,
+                    title=check.title,
+                    status=ERROR,
+                    details=event.error or "watch failed",
+                )
+            self._report()
+            return
+
+        if event.type == WATCH_SYNCED:
+            objects.clear()
+            objects.update(((r.namespace, r.name), r) for r in event.resources)
+            matched = matcher.match(event.resources)
+            for pos, idx in enumerate(indexes):
+                self._matched[idx] = {(r.namespace, r.name): r for r in matched[pos]}
+        else:
+            for ref in event.resources:
+                obj_key = (ref.namespace, ref.name)
+                if event.type == WATCH_DELETED:
+                    objects.pop(obj_key, None)
+                    for idx in indexes:
+                        self._matched[idx].pop(obj_key, None)
+                    continue
+                objects[obj_key] = ref
+                hits = matcher.match([ref])
+                for pos, idx in enumerate(indexes):
+                    if hits[pos]:
+                        self._matched[idx][obj_key] = ref
+                    else:
+                        self._matched[idx].pop(obj_key, None)
+
+        for idx in indexes:
+            self._raw[idx] = build_result(self.checks[idx], list(self._matched[idx].values()))
+        self._report()
+
+    def results(self) -> list[CheckResult]:
+        """Current results for checks whose lists have been synced, with policies applied."""
+        known = [replace(r) for r in self._raw if r is not None]
+        if self.finalize is not None:
+            self.finalize(known)
+        return known
+
+    def _report(self) -> None:
+        by_id = {r.check_id: r for r in self.results()}
+        for idx, check in enumerate(self.checks):
+            current = by_id.get(check.check_id)
+            previous = self._reported[idx]
+            if current is None or (previous is not None and previous.status == current.status):
+                continue
+            self._reported[idx] = current
+            self.on_change(current, previous)
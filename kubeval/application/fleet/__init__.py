@@ -0,0 +1,9 @@
+from kubeval.application.fleet.scanner import (
+    ClusterScan,
+    ClusterTarget,
+    fleet_targets,
+    scan_cluster,
+    scan_fleet,
+)
+
+__all__ = ["ClusterTarget", "ClusterScan", "fleet_targets", "scan_cluster", "scan_fleet"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Optional, Tuple
+
+from kubeval.application.checks.resolution import CheckResolver
+from kubeval.application.checks.runner import CheckEventHandler, run_checks
+from kubeval.domain.models import CheckResult, ClusterScan, ClusterTarget, ResourceCheck
+from kubeval.infrastructure.kubernetes.backend import KubernetesBackend
+
+
+ClientFactory = Callable[[ClusterTarget], Tuple[Optional[KubernetesBackend], Optional[str]]]
+# Same as CheckEventHandler with the cluster the event belongs to in front.
+FleetEventHandler = Callable[[ClusterTarget, str, int, ResourceCheck, Optional[CheckResult]], None]
+ClusterDoneHandler = Callable[[ClusterScan], None]
+
+
+def fleet_targets(contexts: list[str], kubeconfig_globs: list[str]) -> list[ClusterTarget]:
+    """Build scan targets from context names and kubeconfig globs, dropping duplicates."""
+    targets: list[ClusterTarget] = []
+    seen: set[tuple[str | None, str | None]] = set()
+    for context in contexts:
+        if (context, None) not in seen:
+            seen.add((context, None))
+            targets.append(ClusterTarget(name=context, context=context))
+    for pattern in kubeconfig_globs:
+        for path in sorted(glob.glob(os.path.expanduser(pattern))):
+            if (None, path) not in seen:
+                seen.add((None, path))
+                name = os.path.splitext(os.path.basename(path))[0]
+                targets.append(ClusterTarget(name=name, kubeconfig=path))
+    return targets
+
+
+def scan_cluster(
+    target: ClusterTarget,
+    checks: list[ResourceCheck],
+    client_factory: ClientFactory,
+    workers: int = 1,
+    on_event: CheckEventHandler | None = None,
+    deadline_seconds: float | None = None,
+    resolve: CheckResolver | None = None,
+) -> ClusterScan:
+    """Scan one cluster; `resolve` checks its kinds first, as kinds served differ per cluster."""
+    scan = ClusterScan(target=target)
+    client, err = client_factory(target)
+    if client is None:
+        scan.error = err or "unable to create cluster client"
+        return scan
+    err = client.validate()
+    if err:
+        scan.error = err
+        return scan
+    if resolve is not None:
+        resolved, err = resolve(checks, client)
+        if resolved is None:
+            scan.error = err
+            return scan
+        checks = resolved
+    scan.results = run_checks(
+        checks,
+        client,
+        scan.stats,
+        workers=workers,
+        on_event=on_event,
+        deadline_seconds=deadline_seconds,
+    )
+    return scan
+
+
+def scan_fleet(
+    targets: list[ClusterTarget],
+    checks: list[ResourceCheck],
+    client_factory: ClientFactory,
+    max_clusters: int = 4,
+    workers: int = 1,
+    on_event: FleetEventHandler | None = None,
+    on_cluster: ClusterDoneHandler | None = None,
+    deadline_seconds: float | None = None,
+    resolve: CheckResolver | None = None,
+) -> list[ClusterScan]:
+    """Scan clusters concurrently, at most `max_clusters` at a time; output keeps target order.
+
+    `on_event` sees every check start/finish and `on_cluster` each scan as soon as it ends,
+    so callers can stream results before the slowest cluster is done. `deadline_seconds`
+    applies to each cluster's checks from the moment that cluster's scan starts.
+    """
+    if not targets:
+        return []
+
+    def _scan(target: ClusterTarget) -> ClusterScan:
+        handler = partial(on_event, target) if on_event is not None else None
+        scan = scan_cluster(
+            target,
+            checks,
+            client_factory,
+            workers,
+            on_event=handler,
+            deadline_seconds=deadline_seconds,
+            resolve=resolve,
+        )
+        if on_cluster is not None:
+            on_cluster(scan)
+        return scan
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_clusters, len(targets)))) as pool:
+        futures = [pool.submit(_scan, target) for target in targets]
+        return [future.result() for future in futures]
@@ -0,0 +1,4 @@
+from kubeval.application.serve.metrics import Histogram, ServeMetrics
+from kubeval.application.serve.scheduler import PeriodicScanner
+
+__all__ = ["Histogram", "PeriodicScanner", "ServeMetrics"]
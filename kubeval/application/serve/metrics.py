@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import copy
+import threading
+from bisect import bisect_left
+
+from kubeval.domain.models import ScanSnapshot
+
+# Upper bounds in seconds; a list call is usually well under a second, a scan a few seconds.
+CALL_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SCAN_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class Histogram:
+    """Count of observations per bucket upper bound, plus their sum and total count."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # One extra slot for values above the last bound (the +Inf bucket).
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """(upper bound, observations at or below it) pairs, ending with +Inf."""
+        pairs: list[tuple[float, int]] = []
+        running = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+
+class ServeMetrics:
+    """Counters and histograms accumulated over every scan of a `serve` process.
+
+    List calls are observed from the runner's worker threads while a scan is in progress;
+    `copy()` gives a consistent view to render.
+    """
+
+    def __init__(self) -> None:
+        self.scans = 0
+        self.scan_errors = 0
+        self.last_error_at: float | None = None
+        self.scan_duration = Histogram(SCAN_BUCKETS)
+        # (backend, resource, "ok" or "error") -> calls
+        self.calls: dict[tuple[str, str, str], int] = {}
+        # (backend, resource) -> wall time of each call, retries included
+        self.call_duration: dict[tuple[str, str], Histogram] = {}
+        self.retries = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._lock = threading.Lock()
+
+    def observe_call(self, backend: str, resource: str, seconds: float, err: str | None) -> None:
+        outcome = "error" if err else "ok"
+        with self._lock:
+            key = (backend, resource, outcome)
+            self.calls[key] = self.calls.get(key, 0) + 1
+            histogram = self.call_duration.get((backend, resource))
+            if histogram is None:
+                histogram = self.call_duration[(backend, resource)] = Histogram(CALL_BUCKETS)
+            histogram.observe(seconds)
+
+    def observe_scan(self, snapshot: ScanSnapshot) -> None:
+        with self._lock:
+            self.scans += 1
+            self.scan_duration.observe(snapshot.duration_seconds)
+            self.retries += snapshot.stats.retries
+            self.cache_hits += snapshot.stats.cache_hits
+            self.cache_misses += snapshot.stats.cache_misses
+
+    def observe_scan_error(self, at: float) -> None:
+        with self._lock:
+            self.scan_errors += 1
+            self.last_error_at = at
+
+    def copy(self) -> ServeMetrics:
+        with self._lock:
+            clone = copy.copy(self)
+            clone.scan_duration = copy.deepcopy(self.scan_duration)
+            clone.calls = dict(self.calls)
+            clone.call_duration = copy.deepcopy(self.call_duration)
+        clone._lock = threading.Lock()
+        return clone
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+import time
+import traceback
+from typing import Callable, Iterable, List
+
+from kubeval.application.checks.baseline import Baseline
+from kubeval.application.checks.fetching import FetchStrategy
+from kubeval.application.checks.runner import run_checks
+from kubeval.domain.models import CheckResult, PolicyOutcome, ResourceCheck, ScanSnapshot, ScanStats
+from kubeval.infrastructure.kubernetes.backend import KubernetesBackend
+
+ResultsFinalizer = Callable[[List[CheckResult]], List[PolicyOutcome]]
+SnapshotHandler = Callable[[ScanSnapshot], None]
+ScanErrorHandler = Callable[[Exception], None]
+
+
+class PeriodicScanner:
+    """Re-run the checks on one shared client every `interval_seconds`.
+
+    Each scan takes the previous one as its baseline, so checks whose list came back
+    unchanged reuse their result instead of being matched again, and one FetchStrategy
+    batches namespaced lists from the object counts of every scan so far. `on_scan` is
+    called with every completed scan, which also stays available as `latest`; a scan that
+    raises is reported to `on_error` (printed with its traceback by default) and the schedule
+    goes on, keeping the last completed scan.
+    """
+
+    def __init__(
+        self,
+        checks: list[ResourceCheck],
+        client: KubernetesBackend,
+        interval_seconds: float,
+        finalize: ResultsFinalizer | None = None,
+        on_scan: SnapshotHandler | None = None,
+        on_error: ScanErrorHandler | None = None,
+        reuse_exclude: Iterable[str] = (),
+        workers: int = 1,
+        deadline_seconds: float | None = None,
+    ) -> None:
+        self.checks = checks
+        self.client = client
+        self.interval_seconds = interval_seconds
+        self.finalize = finalize
+        self.on_scan = on_scan
+        self.on_error = on_error
+        # Results a policy rewrote are kept as rewritten, so their checks are always re-evaluated.
+        self.reuse_exclude = list(reuse_exclude)
+        self.workers = workers
+        self.deadline_seconds = deadline_seconds
+        self.strategy = FetchStrategy()
+        self.latest: ScanSnapshot | None = None
+
+    def scan_once(self) -> ScanSnapshot:
+        previous = self.latest
+        baseline = Baseline(previous.results, self.reuse_exclude) if previous is not None else None
+        stats = ScanStats()
+        started = time.perf_counter()
+        results = run_checks(
+            self.checks,
+            self.client,
+            stats,
+            workers=self.workers,
+            baseline=baseline,
+            fingerprint=True,
+            deadline_seconds=self.deadline_seconds,
+            strategy=self.strategy,
+        )
+        outcomes = self.finalize(results) if self.finalize is not None else []
+        snapshot = ScanSnapshot(
+            results=results,
+            policies=outcomes,
+            stats=stats,
+            finished_at=time.time(),
+            duration_seconds=time.perf_counter() - started,
+        )
+        self.latest = snapshot
+        if self.on_scan is not None:
+            self.on_scan(snapshot)
+        return snapshot
+
+    def run(self, stop_event: threading.Event) -> None:
+        """Scan until `stop_event` is set; a scan outlasting the interval is followed at once."""
+        while not stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.scan_once()
+            except Exception as exc:
+                if self.on_error is not None:
+                    self.on_error(exc)
+                else:
+                    traceback.print_exc()
+            stop_event.wait(max(0.0, self.interval_seconds - (time.monotonic() - started)))
@@ -1,7 +1,34 @@
 from __future__ import annotations
 
 from kubeval.checks.builtin import builtin_checks
+from kubeval.checks.catalog import check_files, load_catalog, load_checks_file
 from kubeval.checks.custom import load_custom_checks
-from kubeval.checks.policies import enforce_autoscaling_coverage
+from kubeval.checks.policies import (
+    apply_policies,
+    apply_result_policies,
+    builtin_policies,
+    enforce_autoscaling_coverage,
+    load_policies,
+    merge_policies,
+    policy_groups,
+    validate_policies,
+)
+from kubeval.checks.schema import parse_check, parse_checks
 
-__all__ = ["builtin_checks", "enforce_autoscaling_coverage", "load_custom_checks"]
+__all__ = [
+    "apply_policies",
+    "apply_result_policies",
+    "builtin_checks",
+    "builtin_policies",
+    "check_files",
+    "enforce_autoscaling_coverage",
+    "load_catalog",
+    "load_checks_file",
+    "load_custom_checks",
+    "load_policies",
+    "merge_policies",
+    "parse_check",
+    "parse_checks",
+    "policy_groups",
+    "validate_policies",
+]
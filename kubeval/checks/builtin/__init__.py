@@ -3,7 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from kubeval.models import ResourceCheck, VALID_MATCH_TYPES
+from kubeval.checks.schema import parse_check
+from kubeval.models import ResourceCheck
 
 _BUILTIN_CHECK_FILES = [
     Path(__file__).with_name("metrics-server") / "check.json",
@@ -17,27 +18,51 @@ _BUILTIN_CHECK_FILES = [
 ]
 
 
+# Every check.json compiled into one file so startup costs a single read; rebuild it with
+# `python -m kubeval.checks.builtin` after editing a check.
+_CATALOG_FILE = Path(__file__).with_name("catalog.json")
+
+
+def _check_from_raw(raw: dict, source: object) -> ResourceCheck:
+    try:
+        return parse_check(raw)
+    except ValueError as exc:
+        raise ValueError(f"Invalid built-in check definition '{source}': {exc}") from exc
+
+
 def _load_builtin_check(path: Path) -> ResourceCheck:
     with path.open("r", encoding="utf-8") as fh:
-        raw = json.load(fh)
+        return _check_from_raw(json.load(fh), path)
+
 
+def _catalog_is_current() -> bool:
     try:
-        match_type = str(raw.get("match_type", "contains"))
-        if match_type not in VALID_MATCH_TYPES:
-            raise ValueError(f"unsupported match_type '{match_type}'")
-
-        return ResourceCheck(
-            check_id=str(raw["id"]),
-            title=str(raw["title"]),
-            resource=str(raw["resource"]),
-            namespace=raw.get("namespace"),
-            match_type=match_type,
-            match_value=str(raw["match_value"]),
-            min_count=int(raw.get("min_count", 1)),
-        )
-    except KeyError as exc:
-        raise ValueError(f"Invalid built-in check definition '{path}': missing key {exc}") from exc
+        built = _CATALOG_FILE.stat().st_mtime
+        return all(path.stat().st_mtime <= built for path in _BUILTIN_CHECK_FILES)
+    except OSError:
+        return False
+
+
+def build_catalog(path: Path = _CATALOG_FILE) -> int:
+    """Write every built-in check.json, in registration order, into the catalog file."""
+    raws = []
+    for check_file in _BUILTIN_CHECK_FILES:
+        with check_file.open("r", encoding="utf-8") as fh:
+            raw = json.load(fh)
+        _check_from_raw(raw, check_file)
+        raws.append(raw)
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump({"checks": raws}, fh, indent=2)
+        fh.write("\n")
+    return len(raws)
 
 
 def builtin_checks() -> list[ResourceCheck]:
+    # A missing or stale catalog falls back to the per-check files, so edits are never ignored.
+    if _catalog_is_current():
+        try:
+            raws = json.loads(_CATALOG_FILE.read_text(encoding="utf-8"))["checks"]
+            return [_check_from_raw(raw, _CATALOG_FILE) for raw in raws]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
     return [_load_builtin_check(path) for path in _BUILTIN_CHECK_FILES]
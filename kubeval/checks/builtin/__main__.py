@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from kubeval.checks.builtin import _CATALOG_FILE, build_catalog
+
+if __name__ == "__main__":
+    count = build_catalog()
+    print(f"Wrote {count} built-in check(s) to {_CATALOG_FILE}")
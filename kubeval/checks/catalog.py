@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Protocol
+
+from kubeval.checks.schema import SCHEMA_VERSION, parse_checks
+from kubeval.models import ResourceCheck
+
+_DEFAULT_WORKERS = 8
+
+
+class SnapshotStore(Protocol):
+    """Where validated checks are kept by content hash (see CatalogSnapshot)."""
+
+    def get(self, digest: str) -> list[ResourceCheck] | None:
+        ...
+
+    def put(self, digest: str, checks: list[ResourceCheck]) -> None:
+        ...
+
+
+def check_files(files: Iterable[str] = (), dirs: Iterable[str] = ()) -> list[Path]:
+    """`files` in order, then every *.json file under each of `dirs`, sorted; no path twice."""
+    paths = [Path(path).expanduser() for path in files]
+    for directory in dirs:
+        root = Path(directory).expanduser()
+        if not root.is_dir():
+            raise ValueError(f"checks directory '{directory}' does not exist")
+        paths.extend(sorted(path for path in root.rglob("*.json") if path.is_file()))
+    return list(dict.fromkeys(paths))
+
+
+def load_checks_file(path: Path, snapshots: SnapshotStore | None = None) -> list[ResourceCheck]:
+    """Checks of one file, taken from `snapshots` when its content was validated before."""
+    try:
+        content = path.read_bytes()
+    except OSError as exc:
+        raise ValueError(f"unable to read checks file '{path}': {exc.strerror or exc}") from exc
+    digest = hashlib.sha256(b"%d:" % SCHEMA_VERSION + content).hexdigest()
+    if snapshots is not None:
+        cached = snapshots.get(digest)
+        if cached is not None:
+            return cached
+    try:
+        checks = parse_checks(json.loads(content))
+    except ValueError as exc:
+        raise ValueError(f"checks file '{path}': {exc}") from exc
+    if snapshots is not None:
+        snapshots.put(digest, checks)
+    return checks
+
+
+def load_catalog(
+    files: Iterable[str] = (),
+    dirs: Iterable[str] = (),
+    base: Iterable[ResourceCheck] = (),
+    snapshots: SnapshotStore | None = None,
+    workers: int = _DEFAULT_WORKERS,
+) -> list[ResourceCheck]:
+    """`base` followed by the checks of every file, loaded concurrently and kept in order.
+
+    Raises ValueError for an unreadable or invalid file, naming it, and for a check ID defined
+    twice anywhere in the catalog, `base` included.
+    """
+    paths = check_files(files, dirs)
+    checks = list(base)
+    origin = {check.check_id: "the built-in checks" for check in checks}
+    if not paths:
+        return checks
+
+    loaded: Iterable[list[ResourceCheck]]
+    if len(paths) == 1 or workers <= 1:
+        loaded = [load_checks_file(path, snapshots) for path in paths]
+    else:
+        # Imported here so `list-checks` never loads the thread pool machinery.
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            loaded = list(pool.map(partial(load_checks_file, snapshots=snapshots), paths))
+
+    for path, file_checks in zip(paths, loaded):
+        for check in file_checks:
+            first = origin.get(check.check_id)
+            if first is not None:
+                raise ValueError(f"duplicate check id '{check.check_id}' in '{path}', already defined in {first}")
+            origin[check.check_id] = f"'{path}'"
+            checks.append(check)
+    return checks
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from kubeval.application.checks.matcher import compile_regex
+from kubeval.infrastructure.kubernetes.selectors import parse_field_selector, parse_label_selector
+
+
+def _non_negative_int(raw: dict[str, Any], key: str) -> int | None:
+    value = raw.get(key)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"'{key}' must be a non-negative integer")
+    return value
+
+
+def parse_conditions(raw: dict[str, Any]) -> dict[str, Any]:
+    """Read the optional health conditions of a check definition as ResourceCheck kwargs."""
+    image_regex = raw.get("image_regex")
+    if image_regex is not None:
+        image_regex = str(image_regex)
+        try:
+            compile_regex(image_regex)
+        except re.error as exc:
+            raise ValueError(f"invalid image_regex '{image_regex}': {exc}") from exc
+    return {
+        "min_ready": _non_negative_int(raw, "min_ready"),
+        "max_unavailable": _non_negative_int(raw, "max_unavailable"),
+        "image_regex": image_regex,
+    }
+
+
+def parse_selectors(raw: dict[str, Any]) -> dict[str, Any]:
+    """Read and syntax-check the optional label/field selectors as ResourceCheck kwargs."""
+    selectors: dict[str, Any] = {}
+    for key, parse in (("label_selector", parse_label_selector), ("field_selector", parse_field_selector)):
+        value = raw.get(key)
+        if value is not None:
+            value = str(value).strip()
+            parse(value)
+        selectors[key] = value or None
+    return selectors
@@ -1,17 +1,175 @@
 from __future__ import annotations
 
-from kubeval.models import CheckResult, FAIL, PASS
+import json
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+from kubeval.models import (
+    ALL_OF,
+    ANY_OF,
+    ERROR,
+    FAIL,
+    PASS,
+    VALID_POLICY_KINDS,
+    CheckPolicy,
+    CheckResult,
+    PolicyOutcome,
+    ResourceCheck,
+)
+
+_BUILTIN_POLICIES_FILE = Path(__file__).with_name("builtin") / "policies.json"
+_DEFAULT_ANY_OF_MESSAGE = "Optional: {name} not required, {passed_names} passed."
+_MESSAGE_FIELDS = dict.fromkeys(("check_id", "passed", "name", "passed_names"), "")
+
+# Check IDs a policy reads and rewrites, with a callable applying just that policy.
+PolicyGroup = Tuple[List[str], Callable[[List[CheckResult]], List[PolicyOutcome]]]
+
+
+def parse_policies(data: Any, source: object) -> list[CheckPolicy]:
+    if not isinstance(data, dict) or not isinstance(data.get("policies"), list):
+        raise ValueError(f"'{source}' must contain a top-level 'policies' list")
+
+    policies: list[CheckPolicy] = []
+    seen: set[str] = set()
+    for idx, raw in enumerate(data["policies"], start=1):
+        if not isinstance(raw, dict) or not raw.get("id"):
+            raise ValueError(f"Invalid policy #{idx}: missing key 'id'")
+        policy_id = str(raw["id"])
+        if policy_id in seen:
+            raise ValueError(f"Invalid policy #{idx}: duplicate id '{policy_id}'")
+        seen.add(policy_id)
+
+        kinds = [kind for kind in VALID_POLICY_KINDS if kind in raw]
+        if len(kinds) != 1:
+            expected = ", ".join(VALID_POLICY_KINDS)
+            raise ValueError(f"Invalid policy '{policy_id}': expected exactly one of {expected}")
+        kind = kinds[0]
+        check_ids = raw[kind]
+        valid_ids = isinstance(check_ids, list) and all(isinstance(c, str) and c for c in check_ids)
+        if not valid_ids or not check_ids:
+            raise ValueError(f"Invalid policy '{policy_id}': {kind} must be a non-empty list of check IDs")
+
+        message = raw.get("message")
+        if message is not None:
+            try:
+                str(message).format(**_MESSAGE_FIELDS)
+            except (KeyError, IndexError, ValueError) as exc:
+                raise ValueError(f"Invalid policy '{policy_id}': bad message placeholder {exc}") from exc
+
+        names = raw.get("names") or {}
+        if not isinstance(names, dict) or not all(isinstance(v, str) for v in names.values()):
+            raise ValueError(f"Invalid policy '{policy_id}': names must map check IDs to display names")
+        note = raw.get("note")
+
+        policies.append(
+            CheckPolicy(
+                policy_id=policy_id,
+                title=str(raw.get("title", policy_id)),
+                kind=kind,
+                check_ids=list(dict.fromkeys(check_ids)),
+                message=None if message is None else str(message),
+                names={str(k): v for k, v in names.items()},
+                note=None if note is None else str(note),
+            )
+        )
+    return policies
+
+
+def load_policies(path: str) -> list[CheckPolicy]:
+    with open(path, "r", encoding="utf-8") as fh:
+        return parse_policies(json.load(fh), path)
+
+
+def builtin_policies() -> list[CheckPolicy]:
+    raw = json.loads(_BUILTIN_POLICIES_FILE.read_text(encoding="utf-8"))
+    return parse_policies(raw, _BUILTIN_POLICIES_FILE)
+
+
+def merge_policies(base: list[CheckPolicy], extra: list[CheckPolicy]) -> list[CheckPolicy]:
+    """Append `extra`; one sharing an ID with a `base` policy replaces it in place."""
+    merged = {policy.policy_id: policy for policy in base}
+    merged.update((policy.policy_id, policy) for policy in extra)
+    return list(merged.values())
+
+
+def validate_policies(policies: list[CheckPolicy], checks: list[ResourceCheck]) -> str | None:
+    known = {check.check_id for check in checks}
+    for policy in policies:
+        unknown = [check_id for check_id in policy.check_ids if check_id not in known]
+        if unknown:
+            return f"policy '{policy.policy_id}' refers to unknown check(s): {', '.join(unknown)}"
+    return None
+
+
+def _outcome(policy: CheckPolicy, status: str, details: str) -> PolicyOutcome:
+    return PolicyOutcome(policy_id=policy.policy_id, title=policy.title, status=status, details=details)
+
+
+def apply_policy(policy: CheckPolicy, index: dict[str, CheckResult]) -> PolicyOutcome:
+    """Rewrite the results `policy` governs in `index` and report whether it holds."""
+    members = [index[check_id] for check_id in policy.check_ids if check_id in index]
+    passed = [r.check_id for r in members if r.status == PASS]
+    errored = [r.check_id for r in members if r.status == ERROR]
+
+    if policy.kind == ANY_OF:
+        if not passed:
+            status = ERROR if errored else FAIL
+            return _outcome(policy, status, f"none of {', '.join(policy.check_ids)} passed")
+        message = policy.message or _DEFAULT_ANY_OF_MESSAGE
+        names = {r.check_id: policy.names.get(r.check_id, r.title) for r in members}
+        passed_names = ", ".join(names[check_id] for check_id in passed)
+        for result in members:
+            if result.status == FAIL:
+                result.status = PASS
+                result.details = message.format(
+                    check_id=result.check_id,
+                    passed=", ".join(passed),
+                    name=names[result.check_id],
+                    passed_names=passed_names,
+                )
+        return _outcome(policy, PASS, f"satisfied by {', '.join(passed)}")
+
+    if policy.kind == ALL_OF:
+        not_passing = [check_id for check_id in policy.check_ids if check_id not in passed]
+        if not not_passing:
+            return _outcome(policy, PASS, f"all of {', '.join(policy.check_ids)} passed")
+        status = ERROR if set(not_passing) <= set(errored) else FAIL
+        return _outcome(policy, status, f"not passing: {', '.join(not_passing)}")
+
+    # none_of: a check that finds its objects now fails, one that finds nothing passes.
+    for result in members:
+        if result.status == PASS:
+            result.status = FAIL
+            result.details = f"Not allowed by policy '{policy.policy_id}'; {result.details}"
+        elif result.status == FAIL:
+            result.status = PASS
+            result.details = f"Not installed, as policy '{policy.policy_id}' requires."
+    if passed:
+        return _outcome(policy, FAIL, f"found: {', '.join(passed)}")
+    if errored:
+        return _outcome(policy, ERROR, f"unable to verify: {', '.join(errored)}")
+    return _outcome(policy, PASS, f"none of {', '.join(policy.check_ids)} found")
+
+
+def apply_policies(results: list[CheckResult], policies: list[CheckPolicy]) -> list[PolicyOutcome]:
+    """Apply every policy in order over one ID index of `results`; returns their outcomes."""
+    # Reversed so the first result wins when a check ID appears twice.
+    index = {result.check_id: result for result in reversed(results)}
+    return [apply_policy(policy, index) for policy in policies]
+
+
+def policy_groups(policies: list[CheckPolicy]) -> list[PolicyGroup]:
+    return [(policy.check_ids, partial(apply_policies, policies=[policy])) for policy in policies]
+
+
+def apply_result_policies(
+    results: list[CheckResult],
+    policies: list[CheckPolicy] | None = None,
+) -> list[PolicyOutcome]:
+    return apply_policies(results, builtin_policies() if policies is None else policies)
 
 
 def enforce_autoscaling_coverage(results: list[CheckResult]) -> None:
-    autoscaler = next((r for r in results if r.check_id == "cluster-autoscaler"), None)
-    karpenter = next((r for r in results if r.check_id == "karpenter"), None)
-    if autoscaler is None or karpenter is None:
-        return
-
-    if autoscaler.status == PASS and karpenter.status == FAIL:
-        karpenter.status = PASS
-        karpenter.details = "Optional: Karpenter not installed, Cluster Autoscaler is present."
-    elif karpenter.status == PASS and autoscaler.status == FAIL:
-        autoscaler.status = PASS
-        autoscaler.details = "Optional: Cluster Autoscaler not installed, Karpenter is present."
+    """The built-in `autoscaling-coverage` any_of policy, applied on its own."""
+    apply_policies(results, [p for p in builtin_policies() if p.policy_id == "autoscaling-coverage"])
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from kubeval.application.checks.matcher import compile_regex
+from kubeval.checks.conditions import parse_conditions, parse_selectors
+from kubeval.models import ResourceCheck, VALID_MATCH_TYPES
+
+# Bump when validation or ResourceCheck fields change, so saved catalog snapshots are rebuilt.
+SCHEMA_VERSION = 1
+
+_REQUIRED = ("id", "title", "resource", "match_value")
+
+
+def parse_check(raw: Any) -> ResourceCheck:
+    """Validate one check definition, shared by the built-in and custom loaders.
+
+    Raises ValueError naming the first problem; callers add which definition it was.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("expected a JSON object")
+    for key in _REQUIRED:
+        if key not in raw:
+            raise ValueError(f"missing key '{key}'")
+
+    match_type = str(raw.get("match_type", "contains"))
+    if match_type not in VALID_MATCH_TYPES:
+        raise ValueError(f"unsupported match_type '{match_type}'")
+    match_value = str(raw["match_value"])
+    if match_type == "regex":
+        try:
+            compile_regex(match_value)
+        except re.error as exc:
+            raise ValueError(f"invalid regex '{match_value}': {exc}") from exc
+
+    namespace = raw.get("namespace")
+    if namespace is not None and not isinstance(namespace, str):
+        raise ValueError("'namespace' must be a string")
+    try:
+        min_count = int(raw.get("min_count", 1))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'min_count' must be an integer") from exc
+
+    return ResourceCheck(
+        check_id=str(raw["id"]),
+        title=str(raw["title"]),
+        resource=str(raw["resource"]),
+        namespace=namespace or None,
+        match_type=match_type,
+        match_value=match_value,
+        min_count=min_count,
+        **parse_selectors(raw),
+        **parse_conditions(raw),
+    )
+
+
+def parse_checks(data: Any) -> list[ResourceCheck]:
+    """Validate a checks document: an object with a `checks` list."""
+    if not isinstance(data, dict) or not isinstance(data.get("checks", []), list):
+        raise ValueError("expected an object with a 'checks' list")
+    checks: list[ResourceCheck] = []
+    for idx, raw in enumerate(data.get("checks", []), start=1):
+        try:
+            checks.append(parse_check(raw))
+        except ValueError as exc:
+            raise ValueError(f"Invalid custom check #{idx}: {exc}") from exc
+    return checks
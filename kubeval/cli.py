@@ -3,28 +3,168 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
 import threading
 import time
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
-from kubeval.application.checks.runner import run_checks, run_resource_check
-from kubeval.banner import print_banner
-from kubeval.checks import builtin_checks, enforce_autoscaling_coverage, load_custom_checks
-from kubeval.domain.models import CheckResult, ERROR, FAIL, PASS, ResourceCheck
-from kubeval.infrastructure.kubernetes.kubectl_client import KubectlClient
-from kubeval.presentation.console.reporting import (
-    print_checks_catalog,
-    print_table,
-    summarize,
-    to_checks_payload,
-    to_results_payload,
+from kubeval.domain.models import (
+    CheckPolicy,
+    CheckResult,
+    ClusterScan,
+    ClusterTarget,
+    ERROR,
+    FAIL,
+    PASS,
+    PolicyOutcome,
+    ResourceCheck,
+    ScanSnapshot,
+    ScanStats,
 )
 
-RESET = "\033[0m"
-RED = "\033[91m"
-ORANGE = "\033[38;5;208m"
-YELLOW = "\033[93m"
-GREEN = "\033[92m"
+# Commands import the runner, backends and reporting they need on demand, so `--help`,
+# `list-checks` and argument errors never load ssl, http.client or subprocess machinery.
+if TYPE_CHECKING:
+    from kubeval.application.checks.resolution import CheckResolver
+    from kubeval.application.checks.runner import CheckEventHandler
+    from kubeval.application.checks.streaming import PolicyBuffer
+    from kubeval.application.fleet.scanner import ClientFactory
+    from kubeval.infrastructure.kubernetes.backend import KubernetesBackend
+    from kubeval.infrastructure.kubernetes.eks import EksBootstrap, EksCluster
+    from kubeval.infrastructure.kubernetes.instrumented import CallObserver
+    from kubeval.presentation.console.progress import ProgressRenderer
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'") from exc
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got '{value}'") from exc
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got '{value}'")
+    return number
+
+
+def _positive_float(value: str) -> float:
+    try:
+        number = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got '{value}'") from exc
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got '{value}'")
+    return number
+
+
+def _add_scan_options(parser: argparse.ArgumentParser, with_output: bool = True) -> None:
+    parser.add_argument(
+        "--backend",
+        choices=("kubectl", "api"),
+        default="kubectl",
+        help="Query the cluster by running kubectl or by calling the API server directly",
+    )
+    parser.add_argument(
+        "--checks-file",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="JSON file containing additional checks (repeatable)",
+    )
+    parser.add_argument(
+        "--checks-dir",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Load every *.json file under DIR as additional checks (repeatable)",
+    )
+    parser.add_argument(
+        "--policies-file",
+        help="Path to JSON file of any_of/all_of/none_of policies; a matching id replaces a built-in",
+        default=None,
+    )
+    if with_output:
+        parser.add_argument(
+            "--output",
+            choices=("table", "json", "ndjson"),
+            default="table",
+            help="Output format; ndjson streams one JSON object per result as checks finish",
+        )
+    parser.add_argument(
+        "--parallel",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help="Number of kubectl list calls to run concurrently",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=_positive_float,
+        default=15,
+        metavar="SECONDS",
+        help="Time limit of each list call attempt",
+    )
+    parser.add_argument(
+        "--retries",
+        type=_non_negative_int,
+        default=2,
+        metavar="N",
+        help="Retry throttled (429) or transiently failing list calls up to N times with jittered backoff",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=_positive_float,
+        default=None,
+        metavar="SECONDS",
+        help="Overall time limit of a scan, shared out across the list calls still pending",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=os.environ.get("KUBEVAL_CACHE", "") not in ("", "0"),
+        help="Reuse resource lists cached on disk by earlier scans (or set KUBEVAL_CACHE=1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the resource cache (even if KUBEVAL_CACHE is set), checks file snapshots and "
+        "the API discovery cache",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached lists but store freshly fetched ones",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=_positive_int,
+        default=300,
+        metavar="SECONDS",
+        help="Maximum age of cached resource lists",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=_positive_int,
+        default=50,
+        metavar="MB",
+        help="Size limit of the cache directory; least recently used lists are evicted",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Cache directory (default: $XDG_CACHE_HOME/kubeval or ~/.cache/kubeval)",
+    )
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -35,28 +175,172 @@ def _build_parser() -> argparse.ArgumentParser:
 
     scan_parser = subparsers.add_parser("scan", help="Run checks against the current cluster")
     scan_parser.add_argument("--context", help="kubectl context to use", default=None)
+    _add_scan_options(scan_parser)
     scan_parser.add_argument(
-        "--checks-file",
-        help="Path to JSON file containing additional checks",
+        "--from-dir",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Scan YAML/JSON manifests under DIR instead of a live cluster (repeatable)",
+    )
+    scan_parser.add_argument(
+        "--from-file",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="Scan a manifest file or `kubectl get -o json` dump instead of a live cluster (repeatable)",
+    )
+    scan_parser.add_argument(
+        "--baseline",
         default=None,
+        metavar="FILE",
+        help="JSON output of an earlier scan; checks whose lists are unchanged reuse its results",
     )
     scan_parser.add_argument(
-        "--output",
-        choices=("table", "json"),
-        default="table",
-        help="Output format",
+        "--profile",
+        action="store_true",
+        help="Print per-phase totals and the slowest checks to stderr after the scan",
+    )
+    scan_parser.add_argument(
+        "--trace-file",
+        default=None,
+        metavar="PATH",
+        help="Write a Chrome trace (chrome://tracing, Perfetto) of the scan timeline",
     )
     scan_parser.add_argument(
         "--no-banner",
         action="store_true",
         help="Disable pixel banner in table output",
     )
+    scan_parser.add_argument(
+        "--progress",
+        choices=("auto", "bar", "plain", "none"),
+        default="auto",
+        help="Progress on stderr: a bar with an ETA, one line per finished check (plain), or none; "
+        "auto shows the bar for table output on a terminal",
+    )
     scan_parser.add_argument(
         "--no-spinner",
         action="store_true",
-        help="Disable retro spinner animation during scan",
+        help="Same as --progress none",
     )
 
+    fleet_parser = subparsers.add_parser(
+        "scan-fleet",
+        help="Run checks against several clusters concurrently",
+    )
+    fleet_parser.add_argument(
+        "--contexts",
+        action="append",
+        default=[],
+        metavar="CTX[,CTX...]",
+        help="Comma-separated kubectl contexts to scan (repeatable)",
+    )
+    fleet_parser.add_argument(
+        "--kubeconfig-glob",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Glob of kubeconfig files; each file's current context is scanned (repeatable)",
+    )
+    fleet_parser.add_argument(
+        "--eks",
+        action="append",
+        default=[],
+        metavar="REGION/NAME[,...]",
+        help="Comma-separated EKS clusters to scan through temporary kubeconfigs of their own, built "
+        "with the aws CLI; your kubeconfig is left untouched (repeatable)",
+    )
+    fleet_parser.add_argument(
+        "--aws-region",
+        default=os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION"),
+        metavar="REGION",
+        help="Region of --eks clusters given without one (default: $AWS_REGION or $AWS_DEFAULT_REGION)",
+    )
+    fleet_parser.add_argument(
+        "--aws-profile",
+        default=None,
+        metavar="PROFILE",
+        help="aws CLI profile used for --eks clusters",
+    )
+    fleet_parser.add_argument(
+        "--eks-cache-ttl",
+        type=_positive_int,
+        default=6 * 3600,
+        metavar="SECONDS",
+        help="Maximum age of cached EKS endpoints and CA data (--refresh or --no-cache describe again)",
+    )
+    fleet_parser.add_argument(
+        "--max-clusters",
+        type=_positive_int,
+        default=4,
+        metavar="N",
+        help="Number of clusters to scan concurrently",
+    )
+    _add_scan_options(fleet_parser)
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Keep validating the current cluster from watch streams and report state changes",
+    )
+    watch_parser.add_argument("--context", help="kubectl context to use", default=None)
+    watch_parser.add_argument(
+        "--backend",
+        choices=("kubectl", "api"),
+        default="kubectl",
+        help="Follow changes through kubectl or directly through the API server",
+    )
+    watch_parser.add_argument(
+        "--checks-file",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="JSON file containing additional checks (repeatable)",
+    )
+    watch_parser.add_argument(
+        "--checks-dir",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Load every *.json file under DIR as additional checks (repeatable)",
+    )
+    watch_parser.add_argument(
+        "--policies-file",
+        help="Path to JSON file of any_of/all_of/none_of policies; a matching id replaces a built-in",
+        default=None,
+    )
+    watch_parser.add_argument(
+        "--output",
+        choices=("table", "json"),
+        default="table",
+        help="Print readable lines or one JSON object per state change",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Scan the current cluster on an interval and expose the results at /metrics",
+    )
+    serve_parser.add_argument("--context", help="kubectl context to use", default=None)
+    serve_parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on (use 0.0.0.0 to accept scrapes from other hosts)",
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=_positive_int,
+        default=9108,
+        help="Port serving /metrics in the Prometheus text format",
+    )
+    serve_parser.add_argument(
+        "--interval",
+        type=_positive_float,
+        default=60,
+        metavar="SECONDS",
+        help="Time between the starts of two scans",
+    )
+    _add_scan_options(serve_parser, with_output=False)
+
     list_parser = subparsers.add_parser("list-checks", help="List available built-in checks")
     list_parser.add_argument(
         "--output",
@@ -84,87 +368,538 @@ def _parse_args(argv: list[str] | None) -> argparse.Namespace:
     return args
 
 
+def _build_client(
+    args: argparse.Namespace,
+    target: ClusterTarget,
+    observe: CallObserver | None = None,
+) -> tuple[KubernetesBackend | None, str | None]:
+    """Backend for `target`, wrapped by the resource cache when enabled.
+
+    `observe` sees every call that reaches kubectl or the API server, cache hits excluded.
+    """
+    client: KubernetesBackend
+    manifest_paths = [*getattr(args, "from_dir", []), *getattr(args, "from_file", [])]
+    if manifest_paths:
+        from kubeval.infrastructure.manifests.manifest_client import ManifestClient
+
+        client = ManifestClient(manifest_paths)
+        return _with_cache(args, client), None
+
+    from kubeval.infrastructure.kubernetes.retry import RetryPolicy
+
+    retry = RetryPolicy(retries=getattr(args, "retries", 2))
+    timeout = getattr(args, "timeout", 15)
+    if args.backend == "api":
+        from kubeval.infrastructure.kubernetes.api_client import ApiClient
+
+        try:
+            client = ApiClient.from_kubeconfig(
+                context=target.context,
+                timeout_seconds=timeout,
+                kubeconfig=target.kubeconfig,
+                retry=retry,
+            )
+        except ValueError as exc:
+            return None, str(exc)
+    else:
+        from kubeval.infrastructure.kubernetes.kubectl_client import KubectlClient
+
+        client = KubectlClient(
+            context=target.context,
+            timeout_seconds=timeout,
+            kubeconfig=target.kubeconfig,
+            retry=retry,
+        )
+    if observe is not None:
+        from kubeval.infrastructure.kubernetes.instrumented import InstrumentedBackend
+
+        client = InstrumentedBackend(client, observe)
+    return _with_cache(args, client), None
+
+
+def _with_cache(args: argparse.Namespace, client: KubernetesBackend) -> KubernetesBackend:
+    use_cache = getattr(args, "cache", False) or getattr(args, "refresh", False)
+    if use_cache and not args.no_cache:
+        from kubeval.infrastructure.cache.resource_cache import CachedBackend, ResourceCache
+
+        cache = ResourceCache(
+            directory=Path(args.cache_dir).expanduser() if args.cache_dir else None,
+            ttl_seconds=args.cache_ttl,
+            max_bytes=args.cache_max_mb * 1024 * 1024,
+        )
+        client = CachedBackend(client, cache, refresh=args.refresh)
+    return client
+
+
+def _load_checks(args: argparse.Namespace) -> list[ResourceCheck] | None:
+    from kubeval.checks import builtin_checks, load_catalog
+
+    snapshots = None
+    if (args.checks_file or args.checks_dir) and not getattr(args, "no_cache", False):
+        from kubeval.infrastructure.cache.catalog_snapshot import CatalogSnapshot
+
+        cache_dir = getattr(args, "cache_dir", None)
+        snapshots = CatalogSnapshot(Path(cache_dir).expanduser() if cache_dir else None)
+    try:
+        return load_catalog(args.checks_file, args.checks_dir, base=builtin_checks(), snapshots=snapshots)
+    except ValueError as exc:
+        print(f"ERROR: unable to load checks: {exc}", file=sys.stderr)
+        return None
+
+
+def _check_resolver(args: argparse.Namespace) -> CheckResolver:
+    """Resolve check kinds against a cluster, with API discovery cached on disk unless --no-cache."""
+    from kubeval.application.checks.resolution import resolve_checks
+
+    store = None
+    if not getattr(args, "no_cache", False):
+        from kubeval.infrastructure.cache.discovery_cache import DiscoveryCache
+
+        cache_dir = getattr(args, "cache_dir", None)
+        store = DiscoveryCache(Path(cache_dir).expanduser() if cache_dir else None)
+    return partial(resolve_checks, store=store, refresh=getattr(args, "refresh", False))
+
+
+def _resolve_checks(
+    args: argparse.Namespace,
+    checks: list[ResourceCheck],
+    client: KubernetesBackend,
+) -> list[ResourceCheck] | None:
+    resolved, err = _check_resolver(args)(checks, client)
+    if resolved is None:
+        print(f"ERROR: {err}", file=sys.stderr)
+    return resolved
+
+
+def _load_policies(args: argparse.Namespace, checks: list[ResourceCheck]) -> list[CheckPolicy] | None:
+    from kubeval.checks import builtin_policies, load_policies, merge_policies, validate_policies
+
+    policies = builtin_policies()
+    if args.policies_file:
+        try:
+            policies = merge_policies(policies, load_policies(args.policies_file))
+        except (OSError, ValueError) as exc:
+            print(f"ERROR: unable to load policies file '{args.policies_file}': {exc}", file=sys.stderr)
+            return None
+    err = validate_policies(policies, checks)
+    if err:
+        print(f"ERROR: {err}", file=sys.stderr)
+        return None
+    return policies
+
+
 def _command_scan(args: argparse.Namespace) -> int:
-    client = KubectlClient(context=args.context)
+    from contextlib import nullcontext
+
+    from kubeval.application.checks.runner import run_checks
+    from kubeval.banner import print_banner
+    from kubeval.checks import apply_policies
+    from kubeval.presentation.console.reporting import (
+        print_changes,
+        print_policies,
+        print_policy_notes,
+        print_profile,
+        print_table,
+        summarize,
+        summarize_changes,
+        to_chrome_trace,
+        to_results_payload,
+    )
+
+    target = ClusterTarget(name=args.context or "current", context=args.context)
+    client, client_err = _build_client(args, target)
+    if client is None:
+        print(f"ERROR: {client_err}", file=sys.stderr)
+        return 2
     kubectl_err = client.validate()
     if kubectl_err:
         print(f"ERROR: {kubectl_err}", file=sys.stderr)
         return 2
 
-    checks = builtin_checks()
-    if args.checks_file:
-        try:
-            checks.extend(load_custom_checks(args.checks_file))
-        except (OSError, ValueError, json.JSONDecodeError) as exc:
-            print(f"ERROR: unable to load checks file '{args.checks_file}': {exc}", file=sys.stderr)
+    checks = _load_checks(args)
+    if checks is None:
+        return 2
+    checks = _resolve_checks(args, checks, client)
+    if checks is None:
+        return 2
+    policies = _load_policies(args, checks)
+    if policies is None:
+        return 2
+
+    baseline = None
+    if args.baseline:
+        from kubeval.application.checks.baseline import load_baseline
+
+        policy_checks = [check_id for policy in policies for check_id in policy.check_ids]
+        baseline, baseline_err = load_baseline(args.baseline, exclude=policy_checks)
+        if baseline is None:
+            print(f"ERROR: {baseline_err}", file=sys.stderr)
             return 2
 
-    use_spinner = args.output == "table" and sys.stdout.isatty() and not args.no_spinner
-    results = _run_checks_with_spinner(checks, client) if use_spinner else run_checks(checks, client)
-    enforce_autoscaling_coverage(results)
+    stats = ScanStats()
+    progress = _progress_renderer(args, len(checks))
+    # Saved JSON output carries fingerprints so it can serve as a later --baseline.
+    run_options = {
+        "workers": args.parallel,
+        "baseline": baseline,
+        "fingerprint": args.output != "table",
+        "deadline_seconds": args.deadline,
+    }
+    writer = None
+    buffer = None
+    on_event: CheckEventHandler | None = None
+    if args.output == "ndjson":
+        from kubeval.presentation.console.ndjson import NdjsonWriter
+
+        writer = NdjsonWriter()
+
+        def emit(result: CheckResult) -> None:
+            if baseline is not None:
+                baseline.classify(result)
+            writer.write_result(result)
+
+        on_event, buffer = _streaming_handler(checks, policies, emit, writer.write_policy)
+    if progress is not None:
+        on_event = _chain_events(on_event, progress.on_event) if on_event else progress.on_event
+    with progress or nullcontext():
+        results = run_checks(checks, client, stats, on_event=on_event, **run_options)
+    # Streaming output already applied each policy as soon as its checks had finished.
+    outcomes = buffer.outcomes if buffer is not None else apply_policies(results, policies)
+    if baseline is not None:
+        for result in results:
+            baseline.classify(result)
     summary = summarize(results)
 
-    if args.output == "json":
-        print(json.dumps(to_results_payload(results), indent=2))
+    if args.trace_file:
+        try:
+            with open(args.trace_file, "w", encoding="utf-8") as fh:
+                json.dump(to_chrome_trace(results), fh)
+        except OSError as exc:
+            print(f"ERROR: unable to write trace file '{args.trace_file}': {exc}", file=sys.stderr)
+    if args.profile:
+        print_profile(results, stats)
+
+    if writer is not None:
+        writer.write_summary(summary, stats, summarize_changes(results))
+    elif args.output == "json":
+        print(json.dumps(to_results_payload(results, stats, outcomes), indent=2))
     else:
         if not args.no_banner:
             print_banner()
         print_table(results)
         print()
         print(f"Summary: PASS={summary['PASS']} FAIL={summary['FAIL']} ERROR={summary['ERROR']}")
-        print("Note: Cluster scaling is considered covered if Cluster Autoscaler or Karpenter is present.")
+        print(
+            f"Fetches: {stats.fetches} list call(s) for {stats.checks} check(s) "
+            f"({stats.fetches_saved} saved)"
+        )
+        if stats.batched:
+            print(f"Batched: {stats.batched} namespaced list(s) served by cluster-wide calls")
+        if stats.cache_hits or stats.cache_misses:
+            print(f"Cache: {stats.cache_hits} hit(s), {stats.cache_misses} miss(es)")
+        if stats.retries:
+            print(f"Retries: {stats.retries} list call attempt(s) retried")
+        print_changes(results, stats)
+        print_policies(outcomes)
+        print_policy_notes(policies)
 
     return 1 if summary[FAIL] > 0 or summary[ERROR] > 0 else 0
 
 
-def _run_checks_with_spinner(
+def _progress_renderer(args: argparse.Namespace, total: int) -> ProgressRenderer | None:
+    mode = "none" if args.no_spinner else args.progress
+    if mode == "auto":
+        mode = "bar" if args.output == "table" and sys.stderr.isatty() else "none"
+    if mode == "none":
+        return None
+    from kubeval.presentation.console.progress import ProgressRenderer
+
+    return ProgressRenderer(total, mode)
+
+
+def _chain_events(*handlers: CheckEventHandler) -> CheckEventHandler:
+    def _on_event(kind: str, idx: int, check: ResourceCheck, result: CheckResult | None) -> None:
+        for handler in handlers:
+            handler(kind, idx, check, result)
+
+    return _on_event
+
+
+def _streaming_handler(
     checks: list[ResourceCheck],
-    client: KubectlClient,
-) -> list[CheckResult]:
-    frames = ["[■□□□□]", "[□■□□□]", "[□□■□□]", "[□□□■□]", "[□□□□■]"]
-    frame_colors = [RED, ORANGE, YELLOW]
-    status_icons = {
-        PASS: f"{GREEN}✅{RESET}",
-        FAIL: f"{RED}❌{RESET}",
-        ERROR: f"{YELLOW}⚠️{RESET}",
-    }
-    results = []
-    total = len(checks)
-
-    for idx, check in enumerate(checks, start=1):
-        stop_event = threading.Event()
-
-        def _spin() -> None:
-            frame_idx = 0
-            while not stop_event.is_set():
-                frame = frames[frame_idx % len(frames)]
-                color = frame_colors[frame_idx % len(frame_colors)]
-                print(
-                    f"\r{color}{frame}{RESET} {YELLOW}Scanning{RESET} {idx}/{total}: {check.title:<45}",
-                    end="",
-                    flush=True,
-                )
-                frame_idx += 1
-                time.sleep(0.08)
-
-        spinner_thread = threading.Thread(target=_spin, daemon=True)
-        spinner_thread.start()
-        result = run_resource_check(check, client)
+    policies: list[CheckPolicy],
+    emit: Callable[[CheckResult], None],
+    emit_outcome: Callable[[PolicyOutcome], None],
+) -> tuple[Callable[[str, int, ResourceCheck, CheckResult | None], None], PolicyBuffer]:
+    """Event handler passing finished results to `emit`, after any policy that rewrites them."""
+    from kubeval.application.checks.runner import CHECK_FINISHED
+    from kubeval.application.checks.streaming import PolicyBuffer
+    from kubeval.checks import policy_groups
+
+    buffer = PolicyBuffer(checks, policy_groups(policies), emit, emit_outcome)
+
+    def _on_event(kind: str, idx: int, check: ResourceCheck, result: CheckResult | None) -> None:
+        if kind == CHECK_FINISHED and result is not None:
+            buffer.add(result)
+
+    return _on_event, buffer
+
+
+def _command_scan_fleet(args: argparse.Namespace) -> int:
+    import tempfile
+
+    from kubeval.application.fleet.scanner import fleet_targets
+    from kubeval.infrastructure.kubernetes.eks import parse_eks_clusters
+
+    contexts = [ctx.strip() for value in args.contexts for ctx in value.split(",") if ctx.strip()]
+    targets = fleet_targets(contexts, args.kubeconfig_glob)
+    try:
+        eks_clusters = parse_eks_clusters(args.eks, args.aws_region)
+    except ValueError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+    if not targets and not eks_clusters:
+        print("ERROR: no clusters to scan; pass --contexts, --kubeconfig-glob or --eks", file=sys.stderr)
+        return 2
+    if not eks_clusters:
+        return _scan_fleet(args, targets, lambda target: _build_client(args, target))
+
+    with tempfile.TemporaryDirectory(prefix="kubeval-eks-") as kubeconfig_dir:
+        bootstrap = _eks_bootstrap(args, Path(kubeconfig_dir))
+        pending: dict[int, EksCluster] = {}
+        for cluster in eks_clusters:
+            target = ClusterTarget(name=cluster.label, kubeconfig=bootstrap.kubeconfig_path(cluster))
+            pending[id(target)] = cluster
+            targets.append(target)
+
+        def client_factory(target: ClusterTarget) -> tuple[KubernetesBackend | None, str | None]:
+            # Runs on the fleet pool, so each cluster is scanned as soon as its kubeconfig exists.
+            cluster = pending.get(id(target))
+            if cluster is not None:
+                _, err = bootstrap.prepare(cluster)
+                if err:
+                    return None, err
+            return _build_client(args, target)
+
+        return _scan_fleet(args, targets, client_factory)
+
+
+def _eks_bootstrap(args: argparse.Namespace, directory: Path) -> EksBootstrap:
+    from kubeval.infrastructure.kubernetes.eks import EksBootstrap
+
+    store = None
+    if not args.no_cache:
+        from kubeval.infrastructure.cache.eks_cache import EksEndpointCache
+
+        cache_dir = Path(args.cache_dir).expanduser() if args.cache_dir else None
+        store = EksEndpointCache(cache_dir, ttl_seconds=args.eks_cache_ttl)
+    return EksBootstrap(directory, profile=args.aws_profile, store=store, refresh=args.refresh)
+
+
+def _scan_fleet(args: argparse.Namespace, targets: list[ClusterTarget], client_factory: ClientFactory) -> int:
+    from kubeval.application.fleet.scanner import scan_fleet
+    from kubeval.checks import apply_policies
+    from kubeval.presentation.console.reporting import (
+        print_fleet_table,
+        summarize,
+        summarize_fleet,
+        to_fleet_payload,
+    )
+
+    checks = _load_checks(args)
+    if checks is None:
+        return 2
+    policies = _load_policies(args, checks)
+    if policies is None:
+        return 2
+
+    writer = None
+    on_event = on_cluster = None
+    if args.output == "ndjson":
+        from kubeval.presentation.console.ndjson import NdjsonWriter
+
+        writer = NdjsonWriter()
+        streams = {
+            id(target): _streaming_handler(
+                checks,
+                policies,
+                partial(writer.write_result, cluster=target.name),
+                partial(writer.write_policy, cluster=target.name),
+            )
+            for target in targets
+        }
+
+        def on_event(
+            target: ClusterTarget,
+            kind: str,
+            idx: int,
+            check: ResourceCheck,
+            result: CheckResult | None,
+        ) -> None:
+            streams[id(target)][0](kind, idx, check, result)
+
+        def on_cluster(scan: ClusterScan) -> None:
+            scan.policies = streams[id(scan.target)][1].outcomes
+            writer.write_cluster(scan)
+
+    scans = scan_fleet(
+        targets,
+        checks,
+        client_factory,
+        resolve=_check_resolver(args),
+        max_clusters=args.max_clusters,
+        workers=args.parallel,
+        on_event=on_event,
+        on_cluster=on_cluster,
+        deadline_seconds=args.deadline,
+    )
+    if writer is None:
+        for scan in scans:
+            scan.policies = apply_policies(scan.results, policies)
+    fleet_summary = summarize_fleet(scans)
+
+    if writer is not None:
+        all_results = [r for scan in scans for r in scan.results]
+        writer.write_summary({"clusters": fleet_summary, "checks": summarize(all_results)})
+    elif args.output == "json":
+        print(json.dumps(to_fleet_payload(scans), indent=2))
+    else:
+        print_fleet_table(scans)
+        print()
+        print(
+            f"Fleet: {len(scans)} cluster(s) PASS={fleet_summary[PASS]} "
+            f"FAIL={fleet_summary[FAIL]} ERROR={fleet_summary[ERROR]}"
+        )
+
+    return 0 if fleet_summary[FAIL] == 0 and fleet_summary[ERROR] == 0 else 1
+
+
+def _command_watch(args: argparse.Namespace) -> int:
+    from kubeval.application.checks.watcher import CheckWatcher
+    from kubeval.checks import apply_policies
+    from kubeval.presentation.console.reporting import result_to_dict
+
+    target = ClusterTarget(name=args.context or "current", context=args.context)
+    client, client_err = _build_client(args, target)
+    if client is None:
+        print(f"ERROR: {client_err}", file=sys.stderr)
+        return 2
+    backend_err = client.validate()
+    if backend_err:
+        print(f"ERROR: {backend_err}", file=sys.stderr)
+        return 2
+
+    checks = _load_checks(args)
+    if checks is None:
+        return 2
+    checks = _resolve_checks(args, checks, client)
+    if checks is None:
+        return 2
+    policies = _load_policies(args, checks)
+    if policies is None:
+        return 2
+
+    def _on_change(result: CheckResult, previous: CheckResult | None) -> None:
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        previous_status = previous.status if previous else None
+        if args.output == "json":
+            record = {"time": stamp, "previous_status": previous_status, **result_to_dict(result)}
+            print(json.dumps(record), flush=True)
+        else:
+            change = f"{previous_status} -> {result.status}" if previous_status else result.status
+            print(f"[{stamp}] {result.check_id}: {change}  {result.details}", flush=True)
+
+    watcher = CheckWatcher(checks, client, _on_change, finalize=partial(apply_policies, policies=policies))
+    stop_event = threading.Event()
+    try:
+        watcher.run(stop_event)
+    except KeyboardInterrupt:
         stop_event.set()
-        spinner_thread.join()
+    return 0
+
+
+def _command_serve(args: argparse.Namespace) -> int:
+    from kubeval.application.serve import PeriodicScanner, ServeMetrics
+    from kubeval.checks import apply_policies
+    from kubeval.presentation.console.reporting import summarize
+    from kubeval.presentation.metrics import MetricsServer, render_metrics
+
+    metrics = ServeMetrics()
+    target = ClusterTarget(name=args.context or "current", context=args.context)
+    client, client_err = _build_client(args, target, observe=partial(metrics.observe_call, args.backend))
+    if client is None:
+        print(f"ERROR: {client_err}", file=sys.stderr)
+        return 2
+    backend_err = client.validate()
+    if backend_err:
+        print(f"ERROR: {backend_err}", file=sys.stderr)
+        return 2
 
-        icon = status_icons.get(result.status, "•")
-        print("\r\033[2K", end="", flush=True)
+    checks = _load_checks(args)
+    if checks is None:
+        return 2
+    checks = _resolve_checks(args, checks, client)
+    if checks is None:
+        return 2
+    policies = _load_policies(args, checks)
+    if policies is None:
+        return 2
+
+    try:
+        server = MetricsServer(args.host, args.port)
+    except OSError as exc:
+        print(f"ERROR: unable to listen on {args.host}:{args.port}: {exc}", file=sys.stderr)
+        return 2
+    server.publish(render_metrics(None, metrics.copy()))
+
+    # Scrapes are answered from the text rendered once per completed scan.
+    def _on_scan(snapshot: ScanSnapshot) -> None:
+        metrics.observe_scan(snapshot)
+        server.publish(render_metrics(snapshot, metrics.copy()))
+        summary = summarize(snapshot.results)
         print(
-            f"{icon} {ORANGE}Finished{RESET} {idx}/{total}: {check.check_id} -> {result.status:<5}"
+            f"[{time.strftime('%Y-%m-%dT%H:%M:%S')}] scan finished in {snapshot.duration_seconds:.2f}s "
+            f"PASS={summary[PASS]} FAIL={summary[FAIL]} ERROR={summary[ERROR]}",
+            file=sys.stderr,
+            flush=True,
         )
-        results.append(result)
 
-    print()
-    return results
+    # The last completed scan keeps being served; the error count and time tell it is stale.
+    def _on_error(exc: Exception) -> None:
+        metrics.observe_scan_error(time.time())
+        server.publish(render_metrics(scanner.latest, metrics.copy()))
+        print(f"[{time.strftime('%Y-%m-%dT%H:%M:%S')}] scan failed: {exc!r}", file=sys.stderr, flush=True)
+
+    scanner = PeriodicScanner(
+        checks,
+        client,
+        args.interval,
+        finalize=partial(apply_policies, policies=policies),
+        on_scan=_on_scan,
+        on_error=_on_error,
+        reuse_exclude=[check_id for policy in policies for check_id in policy.check_ids],
+        workers=args.parallel,
+        deadline_seconds=args.deadline,
+    )
+    stop_event = threading.Event()
+    threading.Thread(target=scanner.run, args=(stop_event,), daemon=True).start()
+    host, port = server.address
+    print(f"Serving http://{host}:{port}/metrics, scanning every {args.interval:g}s", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_event.set()
+        server.close()
+    return 0
 
 
 def _command_list_checks(args: argparse.Namespace) -> int:
+    from kubeval.banner import print_banner
+    from kubeval.checks import builtin_checks
+    from kubeval.presentation.console.reporting import print_checks_catalog, to_checks_payload
+
     checks = builtin_checks()
     if args.output == "json":
         print(json.dumps(to_checks_payload(checks), indent=2))
@@ -179,4 +914,10 @@ def main(argv: list[str] | None = None) -> int:
 
     if args.command == "list-checks":
         return _command_list_checks(args)
+    if args.command == "scan-fleet":
+        return _command_scan_fleet(args)
+    if args.command == "watch":
+        return _command_watch(args)
+    if args.command == "serve":
+        return _command_serve(args)
     return _command_scan(args)
@@ -1,21 +1,65 @@
 """Domain models and shared constants."""
 
 from kubeval.domain.models import (
+    ALL_OF,
+    ANY_OF,
+    NONE_OF,
+    VALID_POLICY_KINDS,
+    CHANGE_NEW,
+    CHANGE_NEWLY_FAILING,
+    CHANGE_NEWLY_PASSING,
+    CHANGE_UNCHANGED,
     ERROR,
     FAIL,
     PASS,
     VALID_MATCH_TYPES,
+    WATCH_ADDED,
+    WATCH_DELETED,
+    WATCH_ERROR,
+    WATCH_MODIFIED,
+    WATCH_SYNCED,
+    CheckPolicy,
     CheckResult,
+    ClusterScan,
+    ClusterTarget,
+    PolicyOutcome,
     ResourceCheck,
     ResourceRef,
+    ScanSnapshot,
+    ScanStats,
+    Timings,
+    WatchEvent,
+    to_dict,
 )
 
 __all__ = [
+    "CHANGE_NEW",
+    "CHANGE_NEWLY_FAILING",
+    "CHANGE_NEWLY_PASSING",
+    "CHANGE_UNCHANGED",
     "PASS",
     "FAIL",
     "ERROR",
     "VALID_MATCH_TYPES",
+    "ANY_OF",
+    "ALL_OF",
+    "NONE_OF",
+    "VALID_POLICY_KINDS",
+    "WATCH_SYNCED",
+    "WATCH_ADDED",
+    "WATCH_MODIFIED",
+    "WATCH_DELETED",
+    "WATCH_ERROR",
+    "CheckPolicy",
     "CheckResult",
+    "ClusterScan",
+    "ClusterTarget",
+    "PolicyOutcome",
     "ResourceCheck",
     "ResourceRef",
+    "ScanSnapshot",
+    "ScanStats",
+    "Timings",
+    "WatchEvent",
+    "to_dict",
 ]
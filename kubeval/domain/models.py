@@ -1,27 +1,113 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Type, TypeVar
+
+_Model = TypeVar("_Model")
 
 PASS = "PASS"
 FAIL = "FAIL"
 ERROR = "ERROR"
 VALID_MATCH_TYPES = {"exact", "contains", "regex"}
 
+ANY_OF = "any_of"
+ALL_OF = "all_of"
+NONE_OF = "none_of"
+VALID_POLICY_KINDS = (ANY_OF, ALL_OF, NONE_OF)
+
+WATCH_SYNCED = "SYNCED"
+WATCH_ADDED = "ADDED"
+WATCH_MODIFIED = "MODIFIED"
+WATCH_DELETED = "DELETED"
+WATCH_ERROR = "ERROR"
+
+# How a result compares with the same check in a --baseline scan.
+CHANGE_NEW = "NEW"
+CHANGE_NEWLY_FAILING = "NEWLY_FAILING"
+CHANGE_NEWLY_PASSING = "NEWLY_PASSING"
+CHANGE_UNCHANGED = "UNCHANGED"
+
+
+def _slotted(cls: Type[_Model]) -> Type[_Model]:
+    """Rebuild dataclass `cls` with `__slots__`, as `dataclass(slots=True)` does on Python 3.10+.
+
+    Used for the models a scan creates one of per object or check: without a per-instance
+    `__dict__`, each takes about half the memory.
+    """
+    names = tuple(f.name for f in fields(cls))
+    # Field defaults live on the class and would clash with the slots; __init__ has its own copy.
+    skipped = {*names, "__dict__", "__weakref__"}
+    namespace = {key: value for key, value in cls.__dict__.items() if key not in skipped}
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Field names of a model class; empty for any other type."""
+    return tuple(f.name for f in fields(cls)) if is_dataclass(cls) else ()
+
+
+def to_dict(model: Any) -> dict[str, Any]:
+    """Fields of a model by name, reading attributes rather than `__dict__`.
+
+    Model-valued fields are converted too. Unlike `dataclasses.asdict`, nothing is
+    deep-copied, so the record is for serializing straight away, not for keeping.
+    """
+    record = {name: getattr(model, name) for name in _field_names(type(model))}
+    for name, value in record.items():
+        if _field_names(type(value)):
+            record[name] = to_dict(value)
+    return record
+
 
+@_slotted
+@dataclass
+class Timings:
+    """Phase timings of the list call that served a check; shared by every check in the group."""
+
+    started_at: float = 0.0
+    fetch_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    match_seconds: float = 0.0
+    bytes_received: int = 0
+    checks: int = 1
+    # Failed attempts of a retried list call and the time they and their backoff took.
+    retries: int = 0
+    retry_seconds: float = 0.0
+
+    @property
+    def total_seconds(self) -> float:
+        return self.fetch_seconds + self.decode_seconds + self.match_seconds
+
+
+@_slotted
 @dataclass
 class CheckResult:
     check_id: str
     title: str
     status: str
     details: str
+    timings: Timings | None = None
+    # Digest of the check definition and the list it was evaluated against; equal
+    # fingerprints mean the result can be reused from a baseline.
+    fingerprint: str | None = None
+    change: str | None = None
 
 
+@_slotted
 @dataclass
 class ResourceRef:
     name: str
     namespace: str
+    # Only filled when a check in the fetch group has conditions; None means not fetched.
+    ready: int | None = None
+    unavailable: int | None = None
+    images: list[str] | None = None
 
 
+@_slotted
 @dataclass
 class ResourceCheck:
     check_id: str
@@ -31,3 +117,91 @@ class ResourceCheck:
     match_type: str
     match_value: str
     min_count: int = 1
+    # Pushed down to the list call; checks with identical selectors share one query.
+    label_selector: str | None = None
+    field_selector: str | None = None
+    min_ready: int | None = None
+    max_unavailable: int | None = None
+    image_regex: str | None = None
+
+    @property
+    def has_conditions(self) -> bool:
+        return self.min_ready is not None or self.max_unavailable is not None or self.image_regex is not None
+
+
+@dataclass
+class CheckPolicy:
+    """Rule over a group of check IDs, loaded from JSON.
+
+    any_of makes the others optional once one passes, all_of requires every one and
+    none_of requires that none is found.
+    """
+
+    policy_id: str
+    title: str
+    kind: str
+    check_ids: list[str]
+    # any_of only: details of results it makes optional. {check_id} and {passed} are filled in
+    # with check IDs, {name} and {passed_names} with `names` (check titles where absent).
+    message: str | None = None
+    names: dict[str, str] = field(default_factory=dict)
+    # Shown under the table output.
+    note: str | None = None
+
+
+@dataclass
+class PolicyOutcome:
+    policy_id: str
+    title: str
+    status: str
+    details: str
+
+
+@dataclass
+class ScanStats:
+    checks: int = 0
+    fetches: int = 0
+    fetches_saved: int = 0
+    # Namespaced lists served by a cluster-wide call of the same kind.
+    batched: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    reused: int = 0
+    retries: int = 0
+    wall_seconds: float = 0.0
+
+
+@dataclass
+class WatchEvent:
+    """A change to one watched list; SYNCED carries the full list and replaces prior state."""
+
+    type: str
+    resources: list[ResourceRef] = field(default_factory=list)
+    error: str | None = None
+
+
+@dataclass
+class ClusterTarget:
+    name: str
+    context: str | None = None
+    kubeconfig: str | None = None
+
+
+@dataclass
+class ClusterScan:
+    target: ClusterTarget
+    results: list[CheckResult] = field(default_factory=list)
+    stats: ScanStats = field(default_factory=ScanStats)
+    error: str | None = None
+    policies: list[PolicyOutcome] = field(default_factory=list)
+
+
+@dataclass
+class ScanSnapshot:
+    """A completed scan, kept by `serve` mode until the next one replaces it."""
+
+    results: list[CheckResult]
+    policies: list[PolicyOutcome]
+    stats: ScanStats
+    finished_at: float
+    duration_seconds: float
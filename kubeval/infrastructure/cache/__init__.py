@@ -0,0 +1,13 @@
+from kubeval.infrastructure.cache.catalog_snapshot import CatalogSnapshot
+from kubeval.infrastructure.cache.discovery_cache import DiscoveryCache
+from kubeval.infrastructure.cache.eks_cache import EksEndpointCache
+from kubeval.infrastructure.cache.resource_cache import CachedBackend, ResourceCache, default_cache_dir
+
+__all__ = [
+    "CachedBackend",
+    "CatalogSnapshot",
+    "DiscoveryCache",
+    "EksEndpointCache",
+    "ResourceCache",
+    "default_cache_dir",
+]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from kubeval.domain.models import ResourceCheck, to_dict
+from kubeval.infrastructure.cache.files import atomic_write_json
+from kubeval.infrastructure.cache.resource_cache import default_cache_dir
+
+
+class CatalogSnapshot:
+    """Validated checks of a checks file, stored under a hash of its content.
+
+    Entries are never stale: an edited file hashes differently and gets a new entry.
+    """
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = (directory or default_cache_dir()) / "catalog"
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / f"{digest}.json"
+
+    def get(self, digest: str) -> list[ResourceCheck] | None:
+        try:
+            with self._path(digest).open("r", encoding="utf-8") as fh:
+                return [ResourceCheck(**item) for item in json.load(fh)["checks"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, digest: str, checks: list[ResourceCheck]) -> None:
+        entry = {"checks": [to_dict(check) for check in checks]}
+        try:
+            atomic_write_json(self._path(digest), entry)
+        except OSError:
+            return
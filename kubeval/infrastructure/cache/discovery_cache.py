@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from kubeval.domain.models import to_dict
+from kubeval.infrastructure.cache.files import atomic_write_json
+from kubeval.infrastructure.cache.resource_cache import default_cache_dir
+from kubeval.infrastructure.kubernetes.resources import ResourceType
+
+
+class DiscoveryCache:
+    """Kinds discovered on each cluster, keyed by API server URL, for `ttl_seconds`.
+
+    Kinds installed since are picked up early: a name the cached kinds cannot resolve
+    makes the caller discover again.
+    """
+
+    def __init__(self, directory: Path | None = None, ttl_seconds: float = 6 * 3600) -> None:
+        self.directory = (directory or default_cache_dir()) / "discovery"
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, server: str) -> Path:
+        return self.directory / f"{hashlib.sha256(server.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, server: str) -> list[ResourceType] | None:
+        try:
+            with self._path(server).open("r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+            if time.time() - float(entry.get("created", 0)) > self.ttl_seconds:
+                return None
+            return [
+                ResourceType(**{**item, "short_names": tuple(item.get("short_names", ()))})
+                for item in entry["resources"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, server: str, resource_types: list[ResourceType]) -> None:
+        entry = {"created": time.time(), "resources": [to_dict(rt) for rt in resource_types]}
+        try:
+            atomic_write_json(self._path(server), entry)
+        except OSError:
+            return
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from pathlib import Path
+
+from kubeval.domain.models import to_dict
+from kubeval.infrastructure.cache.files import atomic_write_json
+from kubeval.infrastructure.cache.resource_cache import default_cache_dir
+from kubeval.infrastructure.kubernetes.eks import EksCluster, EksEndpoint
+
+
+class EksEndpointCache:
+    """API server URL and CA data of EKS clusters by profile, region and name, for `ttl_seconds`.
+
+    Both only change when a cluster is recreated, so `describe-cluster` need not run per scan.
+    """
+
+    def __init__(self, directory: Path | None = None, ttl_seconds: float = 6 * 3600) -> None:
+        self.directory = (directory or default_cache_dir()) / "eks"
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, profile: str | None, cluster: EksCluster) -> Path:
+        key = "\0".join((profile or "", cluster.region, cluster.name))
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, profile: str | None, cluster: EksCluster) -> EksEndpoint | None:
+        try:
+            with self._path(profile, cluster).open("r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+            if time.time() - float(entry.get("created", 0)) > self.ttl_seconds:
+                return None
+            return EksEndpoint(**entry["endpoint"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, profile: str | None, cluster: EksCluster, endpoint: EksEndpoint) -> None:
+        entry = {"created": time.time(), "endpoint": to_dict(endpoint)}
+        try:
+            atomic_write_json(self._path(profile, cluster), entry)
+        except OSError:
+            return
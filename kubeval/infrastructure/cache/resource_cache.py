@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from kubeval.domain.models import ResourceRef, Timings, to_dict
+from kubeval.infrastructure.cache.files import atomic_write_json
+from kubeval.infrastructure.kubernetes.backend import KubernetesBackend
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "kubeval"
+
+
+class ResourceCache:
+    """On-disk store of fetched resource lists with a TTL and size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        ttl_seconds: float = 300,
+        max_bytes: int = 50 * 1024 * 1024,
+    ) -> None:
+        self.directory = (directory or default_cache_dir()) / "resources"
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        raw = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> list[ResourceRef] | None:
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                entry = json.load(fh)
+            if time.time() - float(entry.get("created", 0)) > self.ttl_seconds:
+                return None
+            resources = [ResourceRef(**item) for item in entry.get("items", [])]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Unreadable, corrupt or from an older model: a miss, refetched and rewritten.
+            return None
+        try:
+            # Touch on hit so eviction drops the least recently used entries first.
+            os.utime(path)
+        except OSError:
+            pass
+        return resources
+
+    def put(self, key: str, resources: list[ResourceRef]) -> None:
+        entry = {"created": time.time(), "items": [to_dict(r) for r in resources]}
+        try:
+            atomic_write_json(self._path(key), entry)
+        except OSError:
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+                total -= size
+
+
+class CachedBackend:
+    """Serve `get_resources` from a ResourceCache, falling through to the wrapped backend."""
+
+    def __init__(
+        self,
+        backend: KubernetesBackend,
+        cache: ResourceCache,
+        refresh: bool = False,
+    ) -> None:
+        self.backend = backend
+        self.cache = cache
+        self.refresh = refresh
+        # Discovery has its own cache (DiscoveryCache) and goes straight to the backend.
+        self.get_raw = getattr(backend, "get_raw", None)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._lock = threading.Lock()
+
+    def validate(self) -> str | None:
+        return self.backend.validate()
+
+    def cluster_server(self) -> str | None:
+        return self.backend.cluster_server()
+
+    def get_resources(
+        self,
+        resource: str,
+        namespace: str | None,
+        timings: Timings | None = None,
+        with_status: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout: float | None = None,
+    ) -> tuple[list[ResourceRef], str | None]:
+        key = self.cache.make_key(
+            context=getattr(self.backend, "context", None),
+            server=self.backend.cluster_server(),
+            resource=resource,
+            namespace=namespace,
+            with_status=with_status,
+            label_selector=label_selector,
+            field_selector=field_selector,
+        )
+        if not self.refresh:
+            started = time.perf_counter()
+            cached = self.cache.get(key)
+            if timings is not None:
+                timings.decode_seconds += time.perf_counter() - started
+            if cached is not None:
+                with self._lock:
+                    self.cache_hits += 1
+                return cached, None
+
+        with self._lock:
+            self.cache_misses += 1
+        resources, err = self.backend.get_resources(
+            resource=resource,
+            namespace=namespace,
+            timings=timings,
+            with_status=with_status,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            timeout=timeout,
+        )
+        if not err:
+            self.cache.put(key, resources)
+        return resources, err
@@ -1,3 +1,39 @@
-from kubeval.infrastructure.kubernetes.kubectl_client import KubectlClient
+from __future__ import annotations
 
-__all__ = ["KubectlClient"]
+import importlib
+from typing import Any
+
+# Resolved on first access so importing `backend` or `resources` does not pull in ssl and
+# http.client through the API client.
+_EXPORTS = {
+    "ApiClient": "kubeval.infrastructure.kubernetes.api_client",
+    "DiscoverableBackend": "kubeval.infrastructure.kubernetes.backend",
+    "EksBootstrap": "kubeval.infrastructure.kubernetes.eks",
+    "InstrumentedBackend": "kubeval.infrastructure.kubernetes.instrumented",
+    "KubectlClient": "kubeval.infrastructure.kubernetes.kubectl_client",
+    "KubernetesBackend": "kubeval.infrastructure.kubernetes.backend",
+    "ResourceResolver": "kubeval.infrastructure.kubernetes.discovery",
+    "WatchableBackend": "kubeval.infrastructure.kubernetes.backend",
+}
+
+__all__ = [
+    "ApiClient",
+    "DiscoverableBackend",
+    "EksBootstrap",
+    "InstrumentedBackend",
+    "KubectlClient",
+    "KubernetesBackend",
+    "ResourceResolver",
+    "WatchableBackend",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import base64
+import http.client
+import json
+import os
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Generator, Iterator
+from urllib.parse import urlencode, urlsplit
+
+from kubeval.domain.models import (
+    WATCH_ERROR,
+    WATCH_SYNCED,
+    ResourceRef,
+    Timings,
+    WatchEvent,
+)
+from kubeval.infrastructure.kubernetes.kubeconfig import ClusterCredentials, load_kubeconfig
+from kubeval.infrastructure.kubernetes.objects import ref_from_object
+from kubeval.infrastructure.kubernetes.resources import ResourceType, parse_canonical, resolve_resource
+from kubeval.infrastructure.kubernetes.retry import RetryPolicy, call_with_retry
+
+_TOKEN_REFRESH_MARGIN_SECONDS = 60
+# Ask for PartialObjectMetadataList so the server drops specs, status and managedFields;
+# servers without metadata-only support fall back to plain JSON.
+_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+_METADATA_WATCH_ACCEPT = "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1,application/json"
+# Conditions read status and pod template fields, which only full objects carry.
+_FULL_ACCEPT = "application/json"
+
+
+def _parse_expiry(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+
+
+def _resource_type(resource: str) -> ResourceType | None:
+    return resolve_resource(resource) or parse_canonical(resource)
+
+
+class ApiClient:
+    """Talks to the API server directly over one keep-alive connection per thread."""
+
+    def __init__(
+        self,
+        credentials: ClusterCredentials,
+        timeout_seconds: float = 15,
+        page_size: int = 500,
+        watch_timeout_seconds: int = 300,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        self.credentials = credentials
+        self.context = credentials.context
+        self.timeout_seconds = timeout_seconds
+        self.retry = retry or RetryPolicy()
+        self.page_size = page_size
+        self.watch_timeout_seconds = watch_timeout_seconds
+        parts = urlsplit(credentials.server)
+        self._scheme = parts.scheme or "https"
+        self._host = parts.hostname or ""
+        self._port = parts.port
+        self._base_path = parts.path.rstrip("/")
+        self._ssl_context = self._build_ssl_context() if self._scheme == "https" else None
+        self._local = threading.local()
+        # Every thread's keep-alive connection, so close() can reach those of worker threads.
+        self._connections: set[http.client.HTTPConnection] = set()
+        self._connections_lock = threading.Lock()
+        self._token_lock = threading.Lock()
+        self._token = credentials.token
+        self._token_expiry: float | None = None
+
+    @classmethod
+    def from_kubeconfig(
+        cls,
+        context: str | None = None,
+        timeout_seconds: float = 15,
+        kubeconfig: str | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> "ApiClient":
+        credentials = load_kubeconfig(context, timeout_seconds, kubeconfig=kubeconfig)
+        return cls(credentials, timeout_seconds=timeout_seconds, retry=retry)
+
+    def _build_ssl_context(self) -> ssl.SSLContext:
+        creds = self.credentials
+        if creds.insecure_skip_tls_verify:
+            ctx = ssl._create_unverified_context()
+        elif creds.ca_data:
+            ctx = ssl.create_default_context(cadata=base64.b64decode(creds.ca_data).decode("ascii"))
+        else:
+            ctx = ssl.create_default_context()
+        if creds.client_certificate_data and creds.client_key_data:
+            self._load_client_cert(
+                ctx,
+                base64.b64decode(creds.client_certificate_data),
+                base64.b64decode(creds.client_key_data),
+            )
+        return ctx
+
+    @staticmethod
+    def _load_client_cert(ctx: ssl.SSLContext, cert: bytes, key: bytes) -> None:
+        # ssl only loads key material from files, so stage it briefly on disk.
+        paths = []
+        try:
+            for data in (cert, key):
+                fd, path = tempfile.mkstemp(prefix="kubeval-", suffix=".pem")
+                paths.append(path)
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+            ctx.load_cert_chain(paths[0], paths[1])
+        finally:
+            for path in paths:
+                os.unlink(path)
+
+    def _exec_token(self) -> tuple[str | None, float | None]:
+        exec_config = self.credentials.exec_config or {}
+        cmd = [exec_config.get("command", ""), *exec_config.get("args", [])]
+        env = os.environ.copy()
+        for item in exec_config.get("env") or []:
+            env[item["name"]] = item["value"]
+        env["KUBERNETES_EXEC_INFO"] = json.dumps(
+            {
+                "apiVersion": exec_config.get("apiVersion", "client.authentication.k8s.io/v1beta1"),
+                "kind": "ExecCredential",
+                "spec": {"interactive": False},
+            }
+        )
+        proc = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=self.timeout_seconds,
+            env=env,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip() or f"credential plugin '{cmd[0]}' failed")
+        status = json.loads(proc.stdout or "{}").get("status", {})
+        return status.get("token"), _parse_expiry(status.get("expirationTimestamp"))
+
+    def _bearer_token(self) -> str | None:
+        if not self.credentials.exec_config:
+            return self._token
+        with self._token_lock:
+            expired = (
+                self._token_expiry is not None
+                and self._token_expiry - time.time() < _TOKEN_REFRESH_MARGIN_SECONDS
+            )
+            if self._token is None or expired:
+                self._token, self._token_expiry = self._exec_token()
+            return self._token
+
+    def _new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(
+                self._host,
+                self._port,
+                timeout=timeout,
+                context=self._ssl_context,
+            )
+        return http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        with self._connections_lock:
+            # A connection close() has closed is replaced rather than silently reopened.
+            if conn is None or conn not in self._connections:
+                conn = self._new_connection(self.timeout_seconds)
+                self._connections.add(conn)
+                self._local.conn = conn
+        return conn
+
+    def _reset_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            with self._connections_lock:
+                self._connections.discard(conn)
+            conn.close()
+        self._local.conn = None
+
+    def _url(self, path: str, params: dict[str, str] | None) -> str:
+        url = self._base_path + path
+        if params:
+            url += "?" + urlencode(params)
+        return url
+
+    def _headers(self, accept: str) -> tuple[dict[str, str], str | None]:
+        headers = {"Accept": accept, "User-Agent": "kubeval"}
+        try:
+            token = self._bearer_token()
+        except (OSError, RuntimeError, subprocess.TimeoutExpired, json.JSONDecodeError) as exc:
+            return headers, f"unable to obtain API token: {exc}"
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        return headers, None
+
+    def request(
+        self,
+        path: str,
+        params: dict[str, str] | None = None,
+        accept: str = "application/json",
+        timings: Timings | None = None,
+        timeout: float | None = None,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        url = self._url(path, params)
+        headers, err = self._headers(accept)
+        if err:
+            return None, err
+
+        started = time.perf_counter()
+        for attempt in range(2):
+            conn = self._connection()
+            # Pooled connections are shared by calls with different budgets; set it every time.
+            conn.timeout = self.timeout_seconds if timeout is None else timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(conn.timeout)
+            try:
+                conn.request("GET", url, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                # Keep-alive connection was closed by the server; reconnect once.
+                self._reset_connection()
+                if attempt:
+                    return None, f"API request failed: {exc}"
+            except (OSError, http.client.HTTPException) as exc:
+                self._reset_connection()
+                return None, f"API request failed: {exc}"
+
+        received = time.perf_counter()
+        try:
+            data = json.loads(body or b"{}")
+        except json.JSONDecodeError:
+            return None, f"API server returned non-JSON response (HTTP {resp.status})"
+        finally:
+            if timings is not None:
+                timings.fetch_seconds += received - started
+                timings.decode_seconds += time.perf_counter() - received
+                timings.bytes_received += len(body)
+        if resp.status >= 400:
+            message = data.get("message") if isinstance(data, dict) else None
+            return None, message or f"API request failed with HTTP {resp.status}"
+        return data, None
+
+    def cluster_server(self) -> str | None:
+        return self.credentials.server
+
+    def validate(self) -> str | None:
+        data, err = self.request("/version")
+        if err:
+            return f"Kubernetes API is not reachable: {err}"
+        return None if data and data.get("gitVersion") else "Unable to read Kubernetes API version"
+
+    def get_raw(self, path: str) -> tuple[dict[str, Any] | None, str | None]:
+        return call_with_retry(
+            lambda attempt_timeout: self.request(path, timeout=attempt_timeout),
+            self.retry,
+            self.timeout_seconds,
+        )
+
+    @staticmethod
+    def _selector_params(label_selector: str | None, field_selector: str | None) -> dict[str, str]:
+        params = {}
+        if label_selector:
+            params["labelSelector"] = label_selector
+        if field_selector:
+            params["fieldSelector"] = field_selector
+        return params
+
+    def _list(
+        self,
+        path: str,
+        default_ns: str,
+        timings: Timings | None = None,
+        with_status: bool = False,
+        selectors: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> tuple[list[ResourceRef], str | None, str | None]:
+        """Return (refs, list resourceVersion, error) for a collection path.
+
+        Each page is retried on its own; `timeout` bounds the whole list, retries included.
+        """
+        params = {"limit": str(self.page_size), **(selectors or {})}
+        accept = _FULL_ACCEPT if with_status else _METADATA_ACCEPT
+        resources: list[ResourceRef] = []
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            budget = None if deadline is None else deadline - time.monotonic()
+            if budget is not None and budget <= 0:
+                return [], None, f"listing {path} did not finish within {timeout:.1f}s"
+            # Each page is decoded and reduced to refs before the next one is requested,
+            # so peak memory is bounded by the page size rather than the cluster size.
+            page_params = dict(params)
+            data, err = call_with_retry(
+                lambda attempt_timeout: self.request(path, page_params, accept, timings, attempt_timeout),
+                self.retry,
+                self.timeout_seconds,
+                budget=budget,
+                timings=timings,
+            )
+            if err:
+                return [], None, err
+            started = time.perf_counter()
+            for item in (data or {}).get("items", []):
+                ref = ref_from_object(item, default_ns, with_status)
+                if ref is not None:
+                    resources.append(ref)
+            if timings is not None:
+                timings.decode_seconds += time.perf_counter() - started
+            list_meta = (data or {}).get("metadata") or {}
+            token = list_meta.get("continue")
+            if not token:
+                return resources, list_meta.get("resourceVersion"), None
+            params["continue"] = token
+
+    def get_resources(
+        self,
+        resource: str,
+        namespace: str | None,
+        timings: Timings | None = None,
+        with_status: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout: float | None = None,
+    ) -> tuple[list[ResourceRef], str | None]:
+        resource_type = _resource_type(resource)
+        if resource_type is None:
+            return [], f"unsupported resource '{resource}' for the api backend"
+        path = resource_type.collection_path(namespace)
+        selectors = self._selector_params(label_selector, field_selector)
+        resources, _, err = self._list(path, namespace or "default", timings, with_status, selectors, timeout)
+        return resources, err
+
+    def watch_resources(
+        self,
+        resource: str,
+        namespace: str | None,
+        stop_event: threading.Event,
+        with_status: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> Iterator[WatchEvent]:
+        """List once, then follow the watch stream from that resourceVersion until stopped.
+
+        The list is repeated only when the server reports the resourceVersion as expired
+        (410 Gone) or the stream fails; normal stream timeouts resume from the last version.
+        """
+        resource_type = _resource_type(resource)
+        if resource_type is None:
+            yield WatchEvent(WATCH_ERROR, error=f"unsupported resource '{resource}' for the api backend")
+            return
+
+        path = resource_type.collection_path(namespace)
+        default_ns = namespace or "default"
+        selectors = self._selector_params(label_selector, field_selector)
+        resource_version: str | None = None
+        while not stop_event.is_set():
+            if resource_version is None:
+                resources, resource_version, err = self._list(
+                    path, default_ns, with_status=with_status, selectors=selectors
+                )
+                if err:
+                    yield WatchEvent(WATCH_ERROR, error=err)
+                    stop_event.wait(self.timeout_seconds)
+                    continue
+                yield WatchEvent(WATCH_SYNCED, resources)
+            resource_version = yield from self._watch_stream(
+                path, default_ns, resource_version, stop_event, with_status, selectors
+            )
+            if resource_version is None:
+                stop_event.wait(1)
+
+    def _watch_stream(
+        self,
+        path: str,
+        default_ns: str,
+        resource_version: str | None,
+        stop_event: threading.Event,
+        with_status: bool = False,
+        selectors: dict[str, str] | None = None,
+    ) -> Generator[WatchEvent, None, str | None]:
+        params = {
+            "watch": "1",
+            "allowWatchBookmarks": "true",
+            "timeoutSeconds": str(self.watch_timeout_seconds),
+            **(selectors or {}),
+        }
+        if resource_version:
+            params["resourceVersion"] = resource_version
+        headers, err = self._headers(_FULL_ACCEPT if with_status else _METADATA_WATCH_ACCEPT)
+        if err:
+            yield WatchEvent(WATCH_ERROR, error=err)
+            return None
+
+        # Watches hold their connection open, so they never borrow the pooled one.
+        conn = self._new_connection(self.watch_timeout_seconds + 30)
+        try:
+            conn.request("GET", self._url(path, params), headers=headers)
+            resp = conn.getresponse()
+            if resp.status == 410:
+                return None
+            if resp.status >= 400:
+                yield WatchEvent(WATCH_ERROR, error=f"watch failed with HTTP {resp.status}")
+                return None
+            while not stop_event.is_set():
+                line = resp.readline()
+                if not line:
+                    return resource_version
+                event = json.loads(line)
+                event_type = event.get("type", "")
+                obj = event.get("object") or {}
+                metadata = obj.get("metadata") or {}
+                if event_type == "ERROR":
+                    if obj.get("code") != 410:
+                        yield WatchEvent(WATCH_ERROR, error=obj.get("message") or "watch error")
+                    return None
+                resource_version = metadata.get("resourceVersion", resource_version)
+                if event_type == "BOOKMARK":
+                    continue
+                ref = ref_from_object(obj, default_ns, with_status)
+                if ref is not None:
+                    yield WatchEvent(event_type, [ref])
+        except (OSError, http.client.HTTPException, json.JSONDecodeError) as exc:
+            yield WatchEvent(WATCH_ERROR, error=f"watch failed: {exc}")
+            return None
+        finally:
+            conn.close()
+        return resource_version
+
+    def close(self) -> None:
+        """Close the keep-alive connection of every thread that made a call."""
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+        self._local.conn = None
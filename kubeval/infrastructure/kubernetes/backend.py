@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Iterator, Protocol
+
+from kubeval.domain.models import ResourceRef, Timings, WatchEvent
+
+
+class KubernetesBackend(Protocol):
+    """Interface shared by every way of listing cluster resources."""
+
+    def validate(self) -> str | None:
+        ...
+
+    def cluster_server(self) -> str | None:
+        ...
+
+    def get_resources(
+        self,
+        resource: str,
+        namespace: str | None,
+        timings: Timings | None = None,
+        with_status: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout: float | None = None,
+    ) -> tuple[list[ResourceRef], str | None]:
+        """List `resource`; `with_status` also fills readiness and images for check conditions.
+
+        `timeout` bounds the whole call, retries included; None leaves it to the backend.
+        """
+        ...
+
+
+class WatchableBackend(KubernetesBackend, Protocol):
+    """Backend that can follow changes to a list after an initial SYNCED snapshot."""
+
+    def watch_resources(
+        self,
+        resource: str,
+        namespace: str | None,
+        stop_event: threading.Event,
+        with_status: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> Iterator[WatchEvent]:
+        ...
+
+
+class DiscoverableBackend(KubernetesBackend, Protocol):
+    """Backend that can read raw API paths, used for API discovery."""
+
+    def get_raw(self, path: str) -> tuple[Any | None, str | None]:
+        """GET `path` on the API server and decode its JSON body."""
+        ...
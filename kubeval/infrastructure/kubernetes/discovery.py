@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional, Protocol, Tuple
+
+from kubeval.infrastructure.kubernetes.resources import ResourceType, alias_index
+
+# GET one API path and decode its JSON body: (document, error).
+RawGetter = Callable[[str], Tuple[Optional[Any], Optional[str]]]
+
+_DEFAULT_WORKERS = 8
+
+
+class DiscoveryStore(Protocol):
+    """Where discovered kinds are kept per cluster (see DiscoveryCache)."""
+
+    def get(self, server: str) -> list[ResourceType] | None:
+        ...
+
+    def put(self, server: str, resource_types: list[ResourceType]) -> None:
+        ...
+
+
+def parse_resource_list(group: str, version: str, data: Any) -> list[ResourceType]:
+    """Listable kinds of one APIResourceList; subresources such as `pods/log` are skipped."""
+    resource_types: list[ResourceType] = []
+    for raw in (data or {}).get("resources") or []:
+        name = str(raw.get("name", ""))
+        if not name or "/" in name or "list" not in (raw.get("verbs") or []):
+            continue
+        resource_types.append(
+            ResourceType(
+                group,
+                version,
+                name,
+                str(raw.get("kind") or name),
+                namespaced=bool(raw.get("namespaced", True)),
+                short_names=tuple(str(short) for short in raw.get("shortNames") or ()),
+            )
+        )
+    return resource_types
+
+
+def discover_resources(
+    get_raw: RawGetter,
+    workers: int = _DEFAULT_WORKERS,
+) -> tuple[list[ResourceType], str | None]:
+    """Every listable kind the cluster serves, at each group's preferred version.
+
+    Reads `/api/v1` and `/apis`, then each group's resource list, `workers` at a time; the
+    core group comes first and groups keep the server's order, which is kubectl's priority.
+    """
+    core, err = get_raw("/api/v1")
+    if err:
+        return [], err
+    groups, err = get_raw("/apis")
+    if err:
+        return [], err
+    versions = [
+        (group.get("name", ""), (group.get("preferredVersion") or {}).get("version", ""))
+        for group in (groups or {}).get("groups") or []
+    ]
+    versions = [(group, version) for group, version in versions if group and version]
+
+    def _fetch(group_version: tuple[str, str]) -> tuple[Any, str | None]:
+        group, version = group_version
+        return get_raw(f"/apis/{group}/{version}")
+
+    if len(versions) > 1 and workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(versions))) as pool:
+            documents = list(pool.map(_fetch, versions))
+    else:
+        documents = [_fetch(group_version) for group_version in versions]
+
+    resource_types = parse_resource_list("", "v1", core)
+    for (group, version), (data, err) in zip(versions, documents):
+        if err:
+            # An unavailable aggregated API (metrics.k8s.io, ...) fails alone, as in kubectl.
+            continue
+        resource_types.extend(parse_resource_list(group, version, data))
+    return resource_types, None
+
+
+class ResourceResolver:
+    """Resolve loose resource names against the kinds one cluster serves."""
+
+    def __init__(self, resource_types: list[ResourceType]) -> None:
+        self.resource_types = resource_types
+        self._by_alias = alias_index(resource_types)
+
+    def resolve(self, name: str) -> ResourceType | None:
+        return self._by_alias.get(name.strip().lower())
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+_TOKEN_API_VERSION = "client.authentication.k8s.io/v1beta1"
+
+
+@dataclass(frozen=True)
+class EksCluster:
+    region: str
+    name: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.region}/{self.name}"
+
+
+@dataclass(frozen=True)
+class EksEndpoint:
+    """What `aws eks describe-cluster` tells a kubeconfig: API server URL and CA bundle."""
+
+    arn: str
+    server: str
+    ca_data: str
+
+
+class EndpointStore(Protocol):
+    """Where cluster endpoints are kept between runs (see EksEndpointCache)."""
+
+    def get(self, profile: str | None, cluster: EksCluster) -> EksEndpoint | None:
+        ...
+
+    def put(self, profile: str | None, cluster: EksCluster, endpoint: EksEndpoint) -> None:
+        ...
+
+
+def parse_eks_clusters(values: list[str], default_region: str | None = None) -> list[EksCluster]:
+    """Clusters from comma-separated `REGION/NAME` values; a bare NAME is in `default_region`."""
+    clusters: list[EksCluster] = []
+    for value in values:
+        for item in value.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            region, _, name = item.rpartition("/")
+            region = region or default_region or ""
+            if not region or not name:
+                raise ValueError(f"invalid EKS cluster '{item}', expected REGION/NAME or a default region")
+            cluster = EksCluster(region, name)
+            if cluster not in clusters:
+                clusters.append(cluster)
+    return clusters
+
+
+def kubeconfig_document(
+    cluster: EksCluster,
+    endpoint: EksEndpoint,
+    profile: str | None = None,
+    aws: str = "aws",
+) -> dict[str, Any]:
+    """A one-cluster kubeconfig getting tokens from `aws eks get-token`, like update-kubeconfig's."""
+    exec_config: dict[str, Any] = {
+        "apiVersion": _TOKEN_API_VERSION,
+        "command": aws,
+        "args": ["--region", cluster.region, "eks", "get-token", "--cluster-name", cluster.name],
+    }
+    if profile:
+        exec_config["env"] = [{"name": "AWS_PROFILE", "value": profile}]
+    return {
+        "apiVersion": "v1",
+        "kind": "Config",
+        "clusters": [
+            {
+                "name": endpoint.arn,
+                "cluster": {"server": endpoint.server, "certificate-authority-data": endpoint.ca_data},
+            }
+        ],
+        "users": [{"name": endpoint.arn, "user": {"exec": exec_config}}],
+        "contexts": [{"name": endpoint.arn, "context": {"cluster": endpoint.arn, "user": endpoint.arn}}],
+        "current-context": endpoint.arn,
+    }
+
+
+class EksBootstrap:
+    """Write a kubeconfig of its own for each EKS cluster, into `directory` only.
+
+    `prepare` is safe to call from many threads: the caller identity is checked once per
+    region, in the background while the cluster is described, and endpoints are read from
+    `store` when it has them (`refresh` skips it). The user's own kubeconfig is never read
+    or written.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        profile: str | None = None,
+        store: EndpointStore | None = None,
+        refresh: bool = False,
+        aws: str = "aws",
+        timeout_seconds: int = 60,
+    ) -> None:
+        self.directory = directory
+        self.profile = profile
+        self.store = store
+        self.refresh = refresh
+        self.aws = aws
+        self.timeout_seconds = timeout_seconds
+        self._lock = threading.Lock()
+        self._identities: dict[str, Future] = {}
+
+    def kubeconfig_path(self, cluster: EksCluster) -> str:
+        return str(self.directory / f"{cluster.region}_{cluster.name}.json")
+
+    def _aws(self, region: str, args: list[str]) -> tuple[Any, str | None]:
+        cmd = [self.aws]
+        if self.profile:
+            cmd += ["--profile", self.profile]
+        cmd += ["--region", region, *args, "--output", "json"]
+        try:
+            proc = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=self.timeout_seconds,
+            )
+        except subprocess.TimeoutExpired:
+            return None, f"`{' '.join(cmd[:1] + args[:2])}` timed out after {self.timeout_seconds}s"
+        except OSError as exc:
+            return None, str(exc)
+        if proc.returncode != 0:
+            return None, proc.stderr.strip() or proc.stdout.strip() or f"aws exited with {proc.returncode}"
+        try:
+            return json.loads(proc.stdout or "null"), None
+        except json.JSONDecodeError as exc:
+            return None, f"unable to decode aws output: {exc}"
+
+    def _check_identity(self, region: str, future: Future) -> None:
+        _, err = self._aws(region, ["sts", "get-caller-identity"])
+        future.set_result(err)
+
+    def _identity(self, region: str) -> Future:
+        with self._lock:
+            future = self._identities.get(region)
+            if future is None:
+                future = self._identities[region] = Future()
+                threading.Thread(
+                    target=self._check_identity,
+                    args=(region, future),
+                    name=f"kubeval-sts-{region}",
+                    daemon=True,
+                ).start()
+        return future
+
+    def _describe(self, cluster: EksCluster) -> tuple[EksEndpoint | None, str | None]:
+        data, err = self._aws(cluster.region, ["eks", "describe-cluster", "--name", cluster.name])
+        if err:
+            return None, err
+        info = (data or {}).get("cluster") or {}
+        server = info.get("endpoint")
+        ca_data = (info.get("certificateAuthority") or {}).get("data")
+        if not server or not ca_data:
+            return None, f"cluster has no API endpoint yet (status {info.get('status', 'unknown')})"
+        return EksEndpoint(str(info.get("arn") or cluster.label), str(server), str(ca_data)), None
+
+    def endpoint(self, cluster: EksCluster) -> tuple[EksEndpoint | None, str | None]:
+        if self.store is not None and not self.refresh:
+            cached = self.store.get(self.profile, cluster)
+            if cached is not None:
+                return cached, None
+        endpoint, err = self._describe(cluster)
+        if endpoint is not None and self.store is not None:
+            self.store.put(self.profile, cluster, endpoint)
+        return endpoint, err
+
+    def prepare(self, cluster: EksCluster) -> tuple[str | None, str | None]:
+        """Path of a kubeconfig reaching `cluster`, or why there is none."""
+        identity = self._identity(cluster.region)
+        endpoint, err = self.endpoint(cluster)
+        identity_err = identity.result()
+        if identity_err:
+            return None, f"AWS credentials are not valid in {cluster.region}: {identity_err}"
+        if endpoint is None:
+            return None, f"unable to describe EKS cluster {cluster.label}: {err}"
+        path = self.kubeconfig_path(cluster)
+        document = kubeconfig_document(cluster, endpoint, self.profile, self.aws)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                # JSON is YAML, so kubectl reads this as it reads any kubeconfig.
+                json.dump(document, fh, indent=2)
+        except OSError as exc:
+            return None, f"unable to write kubeconfig for {cluster.label}: {exc}"
+        return path, None
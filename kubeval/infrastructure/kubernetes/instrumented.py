@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+from kubeval.domain.models import ResourceRef, Timings
+from kubeval.infrastructure.kubernetes.backend import KubernetesBackend
+
+# (resource, wall seconds, error or None) of one list call, retries included.
+CallObserver = Callable[[str, float, Optional[str]], None]
+
+
+class InstrumentedBackend:
+    """Report every `get_resources` call of the wrapped backend to `observe`."""
+
+    def __init__(self, backend: KubernetesBackend, observe: CallObserver) -> None:
+        self.backend = backend
+        self.observe = observe
+        # Read by CachedBackend to key its entries.
+        self.context = getattr(backend, "context", None)
+        # Discovery reads are not list calls; they bypass `observe`.
+        self.get_raw = getattr(backend, "get_raw", None)
+
+    def validate(self) -> str | None:
+        return self.backend.validate()
+
+    def cluster_server(self) -> str | None:
+        return self.backend.cluster_server()
+
+    def get_resources(
+        self,
+        resource: str,
+        namespace: str | None,
+        timings: Timings | None = None,
+        with_status: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout: float | None = None,
+    ) -> tuple[list[ResourceRef], str | None]:
+        started = time.perf_counter()
+        resources, err = self.backend.get_resources(
+            resource=resource,
+            namespace=namespace,
+            timings=timings,
+            with_status=with_status,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            timeout=timeout,
+        )
+        self.observe(resource, time.perf_counter() - started, err)
+        return resources, err
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class ClusterCredentials:
+    server: str
+    ca_data: str | None = None
+    insecure_skip_tls_verify: bool = False
+    token: str | None = None
+    client_certificate_data: str | None = None
+    client_key_data: str | None = None
+    exec_config: dict[str, Any] | None = None
+    context: str | None = None
+
+
+def _named(entries: list[dict[str, Any]], name: str | None, key: str) -> dict[str, Any]:
+    for entry in entries or []:
+        if name is None or entry.get("name") == name:
+            return entry.get(key) or {}
+    return {}
+
+
+def parse_kubeconfig(config: dict[str, Any], context: str | None = None) -> ClusterCredentials:
+    """Build credentials from an already flattened kubeconfig document."""
+    context_name = context or config.get("current-context") or None
+    ctx = _named(config.get("contexts", []), context_name, "context")
+    if context_name and not ctx:
+        raise ValueError(f"context '{context_name}' not found in kubeconfig")
+
+    cluster = _named(config.get("clusters", []), ctx.get("cluster"), "cluster")
+    user = _named(config.get("users", []), ctx.get("user"), "user")
+    server = cluster.get("server")
+    if not server:
+        raise ValueError("kubeconfig cluster has no server URL")
+
+    token = user.get("token")
+    token_file = user.get("tokenFile")
+    if not token and token_file:
+        with open(token_file, "r", encoding="utf-8") as fh:
+            token = fh.read().strip()
+
+    return ClusterCredentials(
+        server=server.rstrip("/"),
+        ca_data=cluster.get("certificate-authority-data"),
+        insecure_skip_tls_verify=bool(cluster.get("insecure-skip-tls-verify", False)),
+        token=token,
+        client_certificate_data=user.get("client-certificate-data"),
+        client_key_data=user.get("client-key-data"),
+        exec_config=user.get("exec"),
+        context=context_name,
+    )
+
+
+def load_kubeconfig(
+    context: str | None = None,
+    timeout_seconds: int = 15,
+    kubeconfig: str | None = None,
+) -> ClusterCredentials:
+    """Resolve credentials once through `kubectl config view`, which merges KUBECONFIG for us."""
+    cmd = ["kubectl", "config", "view", "--minify", "--flatten", "--raw", "-o", "json"]
+    if kubeconfig:
+        cmd += ["--kubeconfig", kubeconfig]
+    if context:
+        cmd += ["--context", context]
+    try:
+        proc = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=timeout_seconds,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        raise ValueError(f"unable to read kubeconfig: {exc}") from exc
+    if proc.returncode != 0:
+        raise ValueError(f"unable to read kubeconfig: {proc.stderr.strip() or 'kubectl config view failed'}")
+    try:
+        config = json.loads(proc.stdout or "{}")
+    except json.JSONDecodeError as exc:
+        raise ValueError("kubectl config view returned non-JSON output") from exc
+    return parse_kubeconfig(config, context)
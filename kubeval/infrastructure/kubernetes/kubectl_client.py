@@ -3,14 +3,52 @@ from __future__ import annotations
 import json
 import shutil
 import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Iterator
 
-from kubeval.domain.models import ResourceRef
+from kubeval.domain.models import WATCH_ERROR, WATCH_SYNCED, ResourceRef, Timings, WatchEvent
+from kubeval.infrastructure.kubernetes.objects import object_from_columns, ref_from_object
+from kubeval.infrastructure.kubernetes.retry import RetryPolicy, call_with_retry
+
+# Only the fields the matcher reads are requested, so kubectl prints one short line per
+# object instead of full JSON bodies.
+_COLUMNS = [
+    ("NAMESPACE", ".metadata.namespace"),
+    ("NAME", ".metadata.name"),
+]
+# Added when a check has conditions; covers replica-based workloads and daemonsets alike.
+_STATUS_COLUMNS = [
+    ("READY", ".status.readyReplicas"),
+    ("NUMBER_READY", ".status.numberReady"),
+    ("UNAVAILABLE", ".status.unavailableReplicas"),
+    ("NUMBER_UNAVAILABLE", ".status.numberUnavailable"),
+    ("REPLICAS", ".spec.replicas"),
+    ("DESIRED", ".status.desiredNumberScheduled"),
+    ("IMAGES", ".spec.template.spec.containers[*].image"),
+    ("POD_IMAGES", ".spec.containers[*].image"),
+]
+_NONE = "<none>"
 
 
 class KubectlClient:
-    def __init__(self, context: str | None = None, timeout_seconds: int = 15) -> None:
+    def __init__(
+        self,
+        context: str | None = None,
+        timeout_seconds: float = 15,
+        chunk_size: int = 500,
+        kubeconfig: str | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> None:
         self.context = context
+        self.kubeconfig = kubeconfig
+        self._server: str | None = None
+        self.watch_restart_seconds = 5
         self.timeout_seconds = timeout_seconds
+        self.chunk_size = chunk_size
+        self.retry = retry or RetryPolicy()
 
     def validate(self) -> str | None:
         if shutil.which("kubectl") is None:
@@ -26,6 +64,27 @@ class KubectlClient:
             version = "unknown"
         return None if version else "Unable to read kubectl version"
 
+    def _base_command(self) -> list[str]:
+        cmd = ["kubectl"]
+        if self.kubeconfig:
+            cmd += ["--kubeconfig", self.kubeconfig]
+        if self.context:
+            cmd += ["--context", self.context]
+        return cmd
+
+    def cluster_server(self) -> str | None:
+        if self._server is None:
+            cmd = self._base_command() + [
+                "config",
+                "view",
+                "--minify",
+                "-o",
+                "jsonpath={.clusters[0].cluster.server}",
+            ]
+            stdout, err = self.run_command(cmd)
+            self._server = "" if err else (stdout or "").strip()
+        return self._server or None
+
     def run_command(self, cmd: list[str]) -> tuple[str | None, str | None]:
         try:
             proc = subprocess.run(
@@ -45,35 +104,211 @@ class KubectlClient:
             return None, stderr
         return proc.stdout, None
 
+    def get_raw(self, path: str) -> tuple[Any | None, str | None]:
+        cmd = self._base_command() + ["get", "--raw", path]
+
+        def _attempt(_: float) -> tuple[Any | None, str | None]:
+            stdout, err = self.run_command(cmd)
+            if err:
+                return None, err
+            try:
+                return json.loads(stdout or "null"), None
+            except json.JSONDecodeError:
+                return None, f"kubectl get --raw {path} returned non-JSON output"
+
+        return call_with_retry(_attempt, self.retry, self.timeout_seconds)
+
+    def stream_command(
+        self,
+        cmd: list[str],
+        on_line: Callable[[str], None],
+        timeout: float | None = None,
+    ) -> str | None:
+        """Run `cmd`, feeding stdout to `on_line` as it arrives so output is never buffered whole."""
+        timed_out = threading.Event()
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            try:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+            except Exception as exc:  # pragma: no cover
+                return str(exc)
+
+            def _kill() -> None:
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(self.timeout_seconds if timeout is None else timeout, _kill)
+            timer.start()
+            try:
+                for line in proc.stdout or []:
+                    on_line(line)
+                proc.wait()
+            finally:
+                timer.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+            if timed_out.is_set():
+                return f"Command timed out: {' '.join(cmd)}"
+            if proc.returncode != 0:
+                stderr_file.seek(0)
+                return stderr_file.read().strip() or "unknown kubectl error"
+        return None
+
+    def _get_command(
+        self,
+        resource: str,
+        namespace: str | None,
+        label_selector: str | None,
+        field_selector: str | None,
+    ) -> list[str]:
+        cmd = self._base_command() + ["get", resource]
+        cmd += ["-n", namespace] if namespace else ["-A"]
+        if label_selector:
+            cmd += ["-l", label_selector]
+        if field_selector:
+            cmd += ["--field-selector", field_selector]
+        return cmd
+
     def get_resources(
         self,
         resource: str,
         namespace: str | None,
+        timings: Timings | None = None,
+        with_status: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout: float | None = None,
     ) -> tuple[list[ResourceRef], str | None]:
-        cmd = ["kubectl"]
-        if self.context:
-            cmd += ["--context", self.context]
-        cmd += ["get", resource]
-        if namespace:
-            cmd += ["-n", namespace]
-        else:
-            cmd += ["-A"]
-        cmd += ["-o", "json"]
-
-        stdout, err = self.run_command(cmd)
-        if err:
-            return [], err
+        """List `resource`, retrying throttling and transient failures within `timeout` seconds."""
+        cmd = self._get_command(resource, namespace, label_selector, field_selector)
+        selected = _COLUMNS + _STATUS_COLUMNS if with_status else _COLUMNS
+        columns = ",".join(f"{header}:{path}" for header, path in selected)
+        cmd += ["-o", f"custom-columns={columns}", "--no-headers", f"--chunk-size={self.chunk_size}"]
 
-        try:
-            data = json.loads(stdout or "{}")
-        except json.JSONDecodeError:
-            return [], "kubectl returned non-JSON output"
+        def _attempt(attempt_timeout: float) -> tuple[list[ResourceRef], str | None]:
+            return self._list_once(cmd, namespace, with_status, len(selected), timings, attempt_timeout)
+
+        return call_with_retry(_attempt, self.retry, self.timeout_seconds, budget=timeout, timings=timings)
 
+    def _list_once(
+        self,
+        cmd: list[str],
+        namespace: str | None,
+        with_status: bool,
+        column_count: int,
+        timings: Timings | None,
+        timeout: float,
+    ) -> tuple[list[ResourceRef], str | None]:
         resources: list[ResourceRef] = []
-        for item in data.get("items", []):
-            metadata = item.get("metadata", {})
-            name = metadata.get("name", "")
-            ns = metadata.get("namespace", namespace or "default")
-            if name:
-                resources.append(ResourceRef(name=name, namespace=ns))
+        default_ns = namespace or "default"
+        decode_seconds = 0.0
+        received = 0
+
+        def _on_line(line: str) -> None:
+            nonlocal decode_seconds, received
+            started = time.perf_counter()
+            received += len(line)
+            fields = line.split()
+            if len(fields) == column_count:
+                ns, name = fields[:2]
+                if name and name != _NONE:
+                    ns = default_ns if ns == _NONE else sys.intern(ns)
+                    if with_status:
+                        values = {path: value for (_, path), value in zip(_STATUS_COLUMNS, fields[2:])}
+                        obj = object_from_columns(values)
+                        obj["metadata"] = {"name": name, "namespace": ns}
+                        ref = ref_from_object(obj, default_ns, with_status=True)
+                    else:
+                        ref = ResourceRef(name=name, namespace=ns)
+                    if ref is not None:
+                        resources.append(ref)
+            decode_seconds += time.perf_counter() - started
+
+        started = time.perf_counter()
+        err = self.stream_command(cmd, _on_line, timeout=timeout)
+        if timings is not None:
+            timings.fetch_seconds += time.perf_counter() - started - decode_seconds
+            timings.decode_seconds += decode_seconds
+            timings.bytes_received += received
+        if err:
+            return [], err
         return resources, None
+
+    def watch_resources(
+        self,
+        resource: str,
+        namespace: str | None,
+        stop_event: threading.Event,
+        with_status: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> Iterator[WatchEvent]:
+        """Emit a SYNCED list, then follow `kubectl get --watch-only` until stopped.
+
+        kubectl cannot start a watch at a resourceVersion, so each (re)start opens the watch
+        before listing: changes made while the list runs wait in the pipe and are applied on
+        top of it, and ones already in the list are repeated harmlessly. kubectl ends watches
+        on its own after a while; the next start lists again, so deletions between streams
+        are never missed.
+        """
+        default_ns = namespace or "default"
+        cmd = self._get_command(resource, namespace, label_selector, field_selector)
+        cmd += ["--watch-only", "--output-watch-events", "-o", "json"]
+
+        def _kill_on_stop(proc: subprocess.Popen) -> None:
+            # Ends with its process, so restarts do not leave a thread behind each.
+            while proc.poll() is None:
+                if stop_event.wait(0.5):
+                    proc.kill()
+                    return
+
+        while not stop_event.is_set():
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                )
+            except Exception as exc:  # pragma: no cover
+                yield WatchEvent(WATCH_ERROR, error=str(exc))
+                return
+            killer = threading.Thread(target=_kill_on_stop, args=(proc,), daemon=True)
+            killer.start()
+            try:
+                resources, err = self.get_resources(
+                    resource=resource,
+                    namespace=namespace,
+                    with_status=with_status,
+                    label_selector=label_selector,
+                    field_selector=field_selector,
+                )
+                if err:
+                    yield WatchEvent(WATCH_ERROR, error=err)
+                    stop_event.wait(self.watch_restart_seconds)
+                    continue
+                yield WatchEvent(WATCH_SYNCED, resources)
+
+                # `-o json` pretty-prints one event object after another; a closing brace in
+                # the first column ends each top-level object.
+                buffer: list[str] = []
+                for line in proc.stdout or []:
+                    buffer.append(line)
+                    if not line.startswith("}"):
+                        continue
+                    try:
+                        event = json.loads("".join(buffer))
+                    except json.JSONDecodeError:
+                        continue
+                    buffer = []
+                    ref = ref_from_object(event.get("object") or {}, default_ns, with_status)
+                    if ref is not None:
+                        yield WatchEvent(event.get("type", ""), [ref])
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                proc.wait()
+                if proc.stdout is not None:
+                    proc.stdout.close()
+                killer.join()
+            stop_event.wait(1)
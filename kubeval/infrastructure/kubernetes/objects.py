@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from kubeval.domain.models import ResourceRef
+
+
+def _container_images(spec: dict[str, Any]) -> list[str]:
+    # Workloads carry containers under the pod template; pods carry them directly.
+    pod_spec = ((spec.get("template") or {}).get("spec")) or spec
+    return [c["image"] for c in pod_spec.get("containers") or [] if c.get("image")]
+
+
+def _readiness(obj: dict[str, Any]) -> tuple[int | None, int | None]:
+    """Return (ready, unavailable) for Deployments, StatefulSets, ReplicaSets and DaemonSets."""
+    if "status" not in obj:
+        # Plain manifests have no status; conditions on it are skipped rather than failed.
+        return None, None
+    status = obj.get("status") or {}
+    spec = obj.get("spec") or {}
+    # The API server omits zero counters, so a missing field means 0.
+    ready = int(status.get("readyReplicas", status.get("numberReady", 0)) or 0)
+    unavailable = status.get("unavailableReplicas", status.get("numberUnavailable"))
+    if unavailable is None:
+        desired = spec.get("replicas", status.get("desiredNumberScheduled"))
+        unavailable = max(int(desired) - ready, 0) if desired is not None else 0
+    return ready, int(unavailable)
+
+
+def ref_from_object(obj: dict[str, Any], default_ns: str, with_status: bool = False) -> ResourceRef | None:
+    metadata = obj.get("metadata") or {}
+    name = metadata.get("name", "")
+    if not name:
+        return None
+    # Thousands of objects share a handful of namespaces; interning keeps one copy of each.
+    ref = ResourceRef(name=name, namespace=sys.intern(metadata.get("namespace") or default_ns))
+    if with_status:
+        ref.ready, ref.unavailable = _readiness(obj)
+        ref.images = _container_images(obj.get("spec") or {})
+    return ref
+
+
+def object_from_columns(values: dict[str, str]) -> dict[str, Any]:
+    """Rebuild a sparse object from `custom-columns` output keyed by JSONPath."""
+    obj: dict[str, Any] = {"status": {}}
+    for path, value in values.items():
+        if value == "<none>":
+            continue
+        parts = path.strip(".").split(".")
+        if parts[-2:] == ["containers[*]", "image"]:
+            # `[*]` columns print every container image joined by commas.
+            parts, parsed = parts[:-2] + ["containers"], [{"image": image} for image in value.split(",")]
+        else:
+            parsed = int(value) if value.isdigit() else value
+        node = obj
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = parsed
+    return obj
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass(frozen=True)
+class ResourceType:
+    group: str
+    version: str
+    plural: str
+    kind: str
+    namespaced: bool = True
+    short_names: tuple[str, ...] = ()
+
+    @property
+    def name(self) -> str:
+        """Canonical `plural.version.group` name, as kubectl accepts it; core kinds are just plural."""
+        return f"{self.plural}.{self.version}.{self.group}" if self.group else self.plural
+
+    @property
+    def api_version(self) -> str:
+        return f"{self.group}/{self.version}" if self.group else self.version
+
+    def collection_path(self, namespace: str | None) -> str:
+        base = f"/apis/{self.group}/{self.version}" if self.group else f"/api/{self.version}"
+        if namespace and self.namespaced:
+            return f"{base}/namespaces/{namespace}/{self.plural}"
+        return f"{base}/{self.plural}"
+
+
+_WELL_KNOWN = [
+    ResourceType("", "v1", "pods", "Pod", short_names=("po",)),
+    ResourceType("", "v1", "services", "Service", short_names=("svc",)),
+    ResourceType("", "v1", "configmaps", "ConfigMap", short_names=("cm",)),
+    ResourceType("", "v1", "secrets", "Secret"),
+    ResourceType("", "v1", "serviceaccounts", "ServiceAccount", short_names=("sa",)),
+    ResourceType("", "v1", "namespaces", "Namespace", namespaced=False, short_names=("ns",)),
+    ResourceType("", "v1", "nodes", "Node", namespaced=False, short_names=("no",)),
+    ResourceType("apps", "v1", "deployments", "Deployment", short_names=("deploy",)),
+    ResourceType("apps", "v1", "daemonsets", "DaemonSet", short_names=("ds",)),
+    ResourceType("apps", "v1", "statefulsets", "StatefulSet", short_names=("sts",)),
+    ResourceType("apps", "v1", "replicasets", "ReplicaSet", short_names=("rs",)),
+    ResourceType("batch", "v1", "jobs", "Job"),
+    ResourceType("batch", "v1", "cronjobs", "CronJob", short_names=("cj",)),
+    ResourceType("networking.k8s.io", "v1", "ingresses", "Ingress", short_names=("ing",)),
+    ResourceType(
+        "networking.k8s.io", "v1", "ingressclasses", "IngressClass", namespaced=False
+    ),
+    ResourceType("storage.k8s.io", "v1", "storageclasses", "StorageClass", namespaced=False, short_names=("sc",)),
+    ResourceType("storage.k8s.io", "v1", "csidrivers", "CSIDriver", namespaced=False),
+    ResourceType(
+        "apiextensions.k8s.io",
+        "v1",
+        "customresourcedefinitions",
+        "CustomResourceDefinition",
+        namespaced=False,
+        short_names=("crd", "crds"),
+    ),
+]
+
+
+def _aliases(rt: ResourceType) -> list[str]:
+    singular = rt.kind.lower()
+    names = [rt.plural, singular, *rt.short_names]
+    if rt.group:
+        names += [f"{rt.plural}.{rt.group}", f"{singular}.{rt.group}", rt.name]
+    return names
+
+
+def alias_index(types: Iterable[ResourceType]) -> dict[str, ResourceType]:
+    """Map every name kubectl accepts for a kind to it; the first kind claiming a name keeps it."""
+    index: dict[str, ResourceType] = {}
+    for rt in types:
+        for alias in _aliases(rt):
+            index.setdefault(alias.lower(), rt)
+    return index
+
+
+_BY_ALIAS = alias_index(_WELL_KNOWN)
+_QUALIFIED = re.compile(r"^([a-z0-9-]+)\.(v[0-9]+(?:(?:alpha|beta)[0-9]+)?)\.([a-z0-9.-]+)$")
+
+
+def resolve_resource(name: str) -> ResourceType | None:
+    """Resolve a loose kubectl-style resource name (`deployment`, `ds`, ...)."""
+    return _BY_ALIAS.get(name.strip().lower())
+
+
+def parse_canonical(name: str) -> ResourceType | None:
+    """Read a canonical `plural.version.group` name of a kind missing from the table above.
+
+    Such names come from API discovery, which leaves no namespace on checks of
+    cluster-scoped kinds, so the kind is taken as namespaced.
+    """
+    match = _QUALIFIED.match(name.strip().lower())
+    if match is None:
+        return None
+    plural, version, group = match.groups()
+    return ResourceType(group, version, plural, kind=plural)
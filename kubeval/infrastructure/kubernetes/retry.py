@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import random
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Tuple, TypeVar
+
+from kubeval.domain.models import Timings
+
+T = TypeVar("T")
+
+# Throttling, overloaded or briefly unreachable API servers, as kubectl and the API report them.
+# Authorization, not-found and validation errors never match, so they fail on the first attempt.
+_RETRYABLE = re.compile(
+    r"TooManyRequests|too many requests|ServiceUnavailable|unable to handle the request"
+    r"|\bHTTP (?:429|502|503|504)\b|\(Timeout\)|timed out|i/o timeout|TLS handshake timeout"
+    r"|connection refused|connection reset|broken pipe|unexpected EOF|: EOF$|leader changed",
+    re.IGNORECASE,
+)
+
+
+def is_retryable(err: str) -> bool:
+    return _RETRYABLE.search(err) is not None
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how patiently a failed list call is retried."""
+
+    retries: int = 2
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter exponential delay before retry number `retry` (starting at 0)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+NO_RETRY = RetryPolicy(retries=0)
+
+
+def call_with_retry(
+    call: Callable[[float], Tuple[T, str | None]],
+    policy: RetryPolicy,
+    attempt_timeout: float,
+    budget: float | None = None,
+    timings: Timings | None = None,
+) -> tuple[T, str | None]:
+    """Run `call(timeout)` until it succeeds, fails for good or `budget` seconds run out.
+
+    Each attempt gets `attempt_timeout`, cut down to what is left of `budget`; a retry is
+    only started when its backoff still leaves time in the budget.
+    """
+    started = time.monotonic()
+    retry = 0
+    attempt_started = started
+    while True:
+        timeout = attempt_timeout
+        if budget is not None:
+            timeout = max(0.001, min(timeout, budget - (attempt_started - started)))
+        value, err = call(timeout)
+        if not err or retry >= policy.retries or not is_retryable(err):
+            break
+        delay = policy.backoff(retry)
+        if budget is not None and time.monotonic() + delay - started >= budget:
+            break
+        time.sleep(delay)
+        retry += 1
+        attempt_started = time.monotonic()
+    if timings is not None and retry:
+        timings.retries += retry
+        timings.retry_seconds += attempt_started - started
+    if err and retry:
+        err = f"{err} (after {retry + 1} attempts)"
+    return value, err
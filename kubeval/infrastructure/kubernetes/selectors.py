@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Mapping
+
+# Label keys and values as the API server accepts them (optional DNS prefix on keys).
+_KEY = r"(?:[A-Za-z0-9.-]+/)?[A-Za-z0-9]([-A-Za-z0-9_.]*[A-Za-z0-9])?"
+_VALUE = r"(?:[A-Za-z0-9]([-A-Za-z0-9_.]*[A-Za-z0-9])?)?"
+_KEY_RE = re.compile(rf"^{_KEY}$")
+_VALUE_RE = re.compile(rf"^{_VALUE}$")
+_SET_RE = re.compile(r"^(\S+)\s+(in|notin)\s+\((.*)\)$")
+
+
+@dataclass(frozen=True)
+class Requirement:
+    key: str
+    operator: str  # "=", "!=", "in", "notin", "exists", "!exists"
+    values: tuple[str, ...] = ()
+
+
+def _split_terms(text: str) -> list[str]:
+    # Commas separate requirements except inside the parentheses of set-based terms.
+    terms, depth, current = [], 0, []
+    for ch in text:
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        if ch == "," and depth == 0:
+            terms.append("".join(current).strip())
+            current = []
+        else:
+            current.append(ch)
+    terms.append("".join(current).strip())
+    return [t for t in terms if t]
+
+
+def _check_key(key: str, selector: str) -> str:
+    if not _KEY_RE.match(key):
+        raise ValueError(f"invalid key '{key}' in selector '{selector}'")
+    return key
+
+
+def _check_value(value: str, selector: str) -> str:
+    if not _VALUE_RE.match(value):
+        raise ValueError(f"invalid value '{value}' in selector '{selector}'")
+    return value
+
+
+def parse_label_selector(selector: str) -> list[Requirement]:
+    """Parse `k=v`, `k!=v`, `k in (a,b)`, `k notin (a,b)`, `k` and `!k` terms, raising ValueError."""
+    requirements: list[Requirement] = []
+    for term in _split_terms(selector):
+        set_match = _SET_RE.match(term)
+        if set_match:
+            key, operator, raw_values = set_match.groups()
+            values = tuple(_check_value(v.strip(), selector) for v in raw_values.split(","))
+            requirements.append(Requirement(_check_key(key, selector), operator, values))
+        elif "!=" in term:
+            key, value = (part.strip() for part in term.split("!=", 1))
+            requirements.append(Requirement(_check_key(key, selector), "!=", (_check_value(value, selector),)))
+        elif "=" in term:
+            key, value = (part.strip() for part in term.replace("==", "=", 1).split("=", 1))
+            requirements.append(Requirement(_check_key(key, selector), "=", (_check_value(value, selector),)))
+        elif term.startswith("!"):
+            requirements.append(Requirement(_check_key(term[1:].strip(), selector), "!exists"))
+        else:
+            requirements.append(Requirement(_check_key(term, selector), "exists"))
+    return requirements
+
+
+def parse_field_selector(selector: str) -> list[Requirement]:
+    """Field selectors only support equality terms: `path=v`, `path==v` and `path!=v`."""
+    requirements: list[Requirement] = []
+    for term in _split_terms(selector):
+        operator = "!=" if "!=" in term else "="
+        if operator == "=" and "=" not in term:
+            raise ValueError(f"invalid term '{term}' in field selector '{selector}'")
+        key, value = (part.strip() for part in term.replace("==", "=", 1).split(operator, 1))
+        if not key:
+            raise ValueError(f"invalid term '{term}' in field selector '{selector}'")
+        requirements.append(Requirement(key, operator, (value,)))
+    return requirements
+
+
+def matches_requirements(requirements: list[Requirement], values: Mapping[str, str]) -> bool:
+    for req in requirements:
+        present = req.key in values
+        value = values.get(req.key)
+        if req.operator == "=" and value != req.values[0]:
+            return False
+        if req.operator == "!=" and value == req.values[0]:
+            return False
+        if req.operator == "in" and value not in req.values:
+            return False
+        if req.operator == "notin" and present and value in req.values:
+            return False
+        if req.operator == "exists" and not present:
+            return False
+        if req.operator == "!exists" and present:
+            return False
+    return True
@@ -0,0 +1,3 @@
+from kubeval.infrastructure.manifests.manifest_client import ManifestClient
+
+__all__ = ["ManifestClient"]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from kubeval.domain.models import ResourceRef, Timings
+from kubeval.infrastructure.kubernetes.objects import ref_from_object
+from kubeval.infrastructure.kubernetes.resources import resolve_resource
+from kubeval.infrastructure.kubernetes.selectors import (
+    matches_requirements,
+    parse_field_selector,
+    parse_label_selector,
+)
+
+_YAML_SUFFIXES = {".yaml", ".yml"}
+_JSON_SUFFIXES = {".json"}
+_JSON_CHUNK = 1 << 20
+_WHITESPACE = re.compile(r"\s*")
+
+
+def _iter_json_documents(path: Path) -> Iterator[Any]:
+    # Handles a single object, a `kind: List` dump and concatenated or line-delimited objects.
+    # The file is read in chunks and each document decoded once it is complete, so a stream of
+    # objects never sits in memory whole.
+    decoder = json.JSONDecoder()
+    with path.open("r", encoding="utf-8") as fh:
+        buffer, pos, eof = "", 0, False
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                if eof:
+                    return
+                buffer, pos = fh.read(_JSON_CHUNK), 0
+                eof = not buffer
+                continue
+            try:
+                doc, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # A scalar ending the buffer may continue in the next chunk.
+            if end is None or (end == len(buffer) and not eof and not isinstance(doc, (dict, list))):
+                # Reading at least what is buffered keeps retries of a large document logarithmic.
+                chunk = fh.read(max(_JSON_CHUNK, len(buffer) - pos))
+                eof = not chunk
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+            pos = end
+            yield doc
+
+
+def _iter_yaml_documents(path: Path) -> Iterator[Any]:
+    try:
+        import yaml
+    except ImportError as exc:
+        raise ValueError(f"reading YAML manifest '{path}' requires PyYAML (pip install pyyaml)") from exc
+    with path.open("r", encoding="utf-8") as fh:
+        # safe_load_all parses one document at a time, so large multi-document files stream.
+        try:
+            yield from yaml.safe_load_all(fh)
+        except yaml.YAMLError as exc:
+            raise ValueError(f"invalid YAML in '{path}': {exc}") from exc
+
+
+def _selectable_fields(obj: dict[str, Any], ref: ResourceRef) -> dict[str, str]:
+    # Field selectors on the API server cover names plus a few scalar spec/status fields
+    # (spec.nodeName, status.phase, ...); top-level scalars of both are kept for them.
+    fields = {"metadata.name": ref.name, "metadata.namespace": ref.namespace}
+    for section in ("spec", "status"):
+        for key, value in (obj.get(section) or {}).items():
+            if isinstance(value, (str, int, bool)):
+                fields[f"{section}.{key}"] = str(value).lower() if isinstance(value, bool) else str(value)
+    return fields
+
+
+@dataclass
+class _IndexedObject:
+    ref: ResourceRef
+    labels: dict[str, str]
+    fields: dict[str, str]
+
+
+def _iter_objects(doc: Any) -> Iterator[dict[str, Any]]:
+    if not isinstance(doc, dict):
+        return
+    if isinstance(doc.get("items"), list):
+        for item in doc["items"]:
+            yield from _iter_objects(item)
+    elif doc.get("kind") and isinstance(doc.get("metadata"), dict):
+        yield doc
+
+
+def _index_document(index: dict[str, dict[str, list[_IndexedObject]]], doc: Any) -> None:
+    for obj in _iter_objects(doc):
+        # Status is already in memory here, so it is always indexed.
+        ref = ref_from_object(obj, "default", with_status=True)
+        if ref is None:
+            continue
+        labels = {str(k): str(v) for k, v in (obj["metadata"].get("labels") or {}).items()}
+        entry = _IndexedObject(ref, labels, _selectable_fields(obj, ref))
+        kind = str(obj["kind"]).lower()
+        index.setdefault(kind, {}).setdefault(ref.namespace, []).append(entry)
+
+
+class ManifestClient:
+    """Serve resource lists from manifests or `kubectl get -o json` dumps instead of a cluster."""
+
+    def __init__(self, paths: list[str]) -> None:
+        self.paths = [Path(p).expanduser() for p in paths]
+        self._index: dict[str, dict[str, list[_IndexedObject]]] | None = None
+        self._error: str | None = None
+
+    def _files(self) -> Iterator[Path]:
+        for path in self.paths:
+            if path.is_dir():
+                for child in sorted(path.rglob("*")):
+                    if child.is_file() and child.suffix.lower() in _YAML_SUFFIXES | _JSON_SUFFIXES:
+                        yield child
+            else:
+                yield path
+
+    def _build_index(self) -> None:
+        index: dict[str, dict[str, list[_IndexedObject]]] = {}
+        for path in self._files():
+            if not path.is_file():
+                raise ValueError(f"manifest path '{path}' does not exist")
+            if path.suffix.lower() in _JSON_SUFFIXES:
+                documents = _iter_json_documents(path)
+            else:
+                documents = _iter_yaml_documents(path)
+            try:
+                # Objects are indexed as their documents are decoded.
+                for doc in documents:
+                    _index_document(index, doc)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"invalid JSON in '{path}': {exc}") from exc
+        self._index = index
+
+    def _ensure_index(self) -> str | None:
+        if self._index is None and self._error is None:
+            try:
+                self._build_index()
+            except (OSError, ValueError) as exc:
+                self._error = str(exc)
+        return self._error
+
+    def validate(self) -> str | None:
+        if not self.paths:
+            return "no manifest paths given"
+        return self._ensure_index()
+
+    def cluster_server(self) -> str | None:
+        return "file://" + ",".join(str(p) for p in self.paths)
+
+    def _kind(self, resource: str) -> tuple[str, bool]:
+        resource_type = resolve_resource(resource)
+        if resource_type is not None:
+            return resource_type.kind.lower(), resource_type.namespaced
+        # Unknown kinds (CRDs) are matched by kind, singular or naive plural name.
+        name = resource.strip().lower().split(".", 1)[0]
+        known = self._index or {}
+        if name in known or not name.endswith("s"):
+            return name, True
+        return (name[:-1] if name[:-1] in known else name), True
+
+    def get_resources(
+        self,
+        resource: str,
+        namespace: str | None,
+        timings: Timings | None = None,
+        with_status: bool = False,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        timeout: float | None = None,
+    ) -> tuple[list[ResourceRef], str | None]:
+        started = time.perf_counter()
+        err = self._ensure_index()
+        if timings is not None:
+            timings.decode_seconds += time.perf_counter() - started
+        if err:
+            return [], err
+        try:
+            labels = parse_label_selector(label_selector) if label_selector else []
+            fields = parse_field_selector(field_selector) if field_selector else []
+        except ValueError as exc:
+            return [], str(exc)
+        kind, namespaced = self._kind(resource)
+        by_namespace = (self._index or {}).get(kind, {})
+        if namespace and namespaced:
+            entries = by_namespace.get(namespace, [])
+        else:
+            entries = [entry for group in by_namespace.values() for entry in group]
+        return [
+            entry.ref
+            for entry in entries
+            if matches_requirements(labels, entry.labels) and matches_requirements(fields, entry.fields)
+        ], None
@@ -1,15 +1,41 @@
+from kubeval.presentation.console.ndjson import NdjsonWriter
+from kubeval.presentation.console.progress import ProgressRenderer
 from kubeval.presentation.console.reporting import (
+    cluster_status,
+    print_changes,
     print_checks_catalog,
+    print_fleet_table,
+    print_policies,
+    print_policy_notes,
+    print_profile,
     print_table,
+    result_to_dict,
     summarize,
+    summarize_changes,
+    summarize_fleet,
     to_checks_payload,
+    to_chrome_trace,
+    to_fleet_payload,
     to_results_payload,
 )
 
 __all__ = [
+    "NdjsonWriter",
+    "ProgressRenderer",
     "summarize",
+    "summarize_fleet",
+    "summarize_changes",
+    "cluster_status",
     "print_table",
+    "print_fleet_table",
+    "print_profile",
+    "print_changes",
+    "print_policies",
+    "print_policy_notes",
     "print_checks_catalog",
     "to_results_payload",
+    "result_to_dict",
+    "to_chrome_trace",
     "to_checks_payload",
+    "to_fleet_payload",
 ]
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from typing import Any, TextIO
+
+from kubeval.domain.models import CheckResult, ClusterScan, PolicyOutcome, ScanStats, to_dict
+from kubeval.presentation.console.reporting import cluster_status, result_to_dict, summarize
+
+
+class NdjsonWriter:
+    """Write one compact JSON record per line, flushed as written; safe to share across threads.
+
+    Records carry a `type`: `result` per check, `policy` per decided policy, `cluster` per
+    finished fleet cluster and a final `summary`.
+    """
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def write(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":"))
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def write_result(self, result: CheckResult, cluster: str | None = None) -> None:
+        record: dict[str, Any] = {"type": "result"}
+        if cluster is not None:
+            record["cluster"] = cluster
+        record.update(result_to_dict(result))
+        self.write(record)
+
+    def write_policy(self, outcome: PolicyOutcome, cluster: str | None = None) -> None:
+        record: dict[str, Any] = {"type": "policy"}
+        if cluster is not None:
+            record["cluster"] = cluster
+        record.update(to_dict(outcome))
+        self.write(record)
+
+    def write_cluster(self, scan: ClusterScan) -> None:
+        self.write(
+            {
+                "type": "cluster",
+                "cluster": scan.target.name,
+                "context": scan.target.context,
+                "kubeconfig": scan.target.kubeconfig,
+                "status": cluster_status(scan),
+                "error": scan.error,
+                "summary": summarize(scan.results),
+                "policies": [to_dict(outcome) for outcome in scan.policies],
+                "stats": to_dict(scan.stats),
+            }
+        )
+
+    def write_summary(
+        self,
+        summary: dict[str, Any],
+        stats: ScanStats | None = None,
+        changes: dict[str, int] | None = None,
+    ) -> None:
+        record: dict[str, Any] = {"type": "summary", "summary": summary}
+        if changes is not None:
+            record["changes"] = changes
+        if stats is not None:
+            record["stats"] = to_dict(stats)
+        self.write(record)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import queue
+import sys
+import threading
+import time
+from typing import Callable, TextIO
+
+from kubeval.domain.models import ERROR, FAIL, PASS, CheckResult, ResourceCheck
+from kubeval.presentation.console.reporting import GREEN, RED, RESET, YELLOW
+
+PROGRESS_BAR = "bar"
+PROGRESS_PLAIN = "plain"
+PROGRESS_MODES = (PROGRESS_BAR, PROGRESS_PLAIN)
+
+_STOP = object()
+_BAR_WIDTH = 24
+_STATUS_COLORS = {PASS: GREEN, FAIL: RED, ERROR: YELLOW}
+
+
+def _duration(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f}s" if seconds >= 10 else f"{seconds:.1f}s"
+    return f"{int(seconds // 60)}m{int(seconds % 60):02d}s"
+
+
+class ProgressRenderer:
+    """Show scan progress from check events, drawn by one thread for the whole scan.
+
+    `on_event` only queues the event, so threads running checks never wait on the terminal.
+    In `bar` mode one line is repainted with a progress bar, status counts and an ETA, at
+    most every `interval` seconds; in `plain` mode a line is written per finished check, for
+    logs and other non-terminal readers. The ETA spreads the mean latency of finished checks
+    over the most checks seen in flight at once.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        mode: str = PROGRESS_BAR,
+        stream: TextIO | None = None,
+        interval: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.total = total
+        self.mode = mode
+        self.stream = stream or sys.stderr
+        self.interval = interval
+        self.clock = clock
+        self.counts = {PASS: 0, FAIL: 0, ERROR: 0}
+        self.done = 0
+        self._events: queue.Queue = queue.Queue()
+        self._started: dict[int, float] = {}
+        self._titles: dict[int, str] = {}
+        self._latency_total = 0.0
+        self._concurrency = 1
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "ProgressRenderer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="kubeval-progress", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Handle the events already queued, then clear the bar."""
+        if self._thread is not None:
+            self._events.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def on_event(self, kind: str, idx: int, check: ResourceCheck, result: CheckResult | None) -> None:
+        self._events.put((idx, check, result, self.clock()))
+
+    def eta_seconds(self) -> float | None:
+        if not self.done:
+            return None
+        mean = self._latency_total / self.done
+        return mean * (self.total - self.done) / self._concurrency
+
+    def _apply(self, idx: int, check: ResourceCheck, result: CheckResult | None, at: float) -> None:
+        # Started events carry no result.
+        if result is None:
+            self._started[idx] = at
+            self._titles[idx] = check.title
+            self._concurrency = max(self._concurrency, len(self._titles))
+            return
+        self._titles.pop(idx, None)
+        latency = at - self._started.pop(idx, at)
+        self._latency_total += latency
+        self.done += 1
+        self.counts[result.status] = self.counts.get(result.status, 0) + 1
+        if self.mode == PROGRESS_PLAIN:
+            self._write_line(check, result, latency)
+
+    def _write_line(self, check: ResourceCheck, result: CheckResult, latency: float) -> None:
+        eta = self.eta_seconds()
+        eta_text = f", ETA {_duration(eta)}" if eta is not None and self.done < self.total else ""
+        width = len(str(self.total))
+        self.stream.write(
+            f"[{self.done:>{width}}/{self.total}] {result.status:<5} {check.check_id} "
+            f"({_duration(latency)}{eta_text})\n"
+        )
+        self.stream.flush()
+
+    def _draw(self) -> None:
+        filled = _BAR_WIDTH * self.done // self.total if self.total else _BAR_WIDTH
+        bar = "█" * filled + "░" * (_BAR_WIDTH - filled)
+        counts = " ".join(
+            f"{_STATUS_COLORS.get(status, '')}{status}={n}{RESET}" for status, n in self.counts.items()
+        )
+        eta = self.eta_seconds()
+        eta_text = f"ETA {_duration(eta)}" if eta is not None else "ETA --"
+        titles = list(self._titles.values())
+        label = titles[0] if len(titles) == 1 else f"{len(titles)} in flight" if titles else ""
+        self.stream.write(f"\r\033[2K[{bar}] {self.done}/{self.total} {counts} {eta_text}  {label[:40]}")
+        self.stream.flush()
+
+    def _run(self) -> None:
+        last_draw = float("-inf")
+        # Only the bar is redrawn; plain lines are written as checks finish.
+        dirty = self.mode == PROGRESS_BAR
+        while True:
+            # Block until an event arrives; while a redraw is due, wait no longer than that.
+            timeout = None if not dirty else max(0.0, last_draw + self.interval - self.clock())
+            try:
+                item = self._events.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            if item is not None:
+                self._apply(*item)
+                dirty = self.mode == PROGRESS_BAR
+            if dirty and self.clock() - last_draw >= self.interval:
+                self._draw()
+                last_draw = self.clock()
+                dirty = False
+        if self.mode == PROGRESS_BAR:
+            self.stream.write("\r\033[2K")
+            self.stream.flush()
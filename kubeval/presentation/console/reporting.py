@@ -1,9 +1,25 @@
 from __future__ import annotations
 
 import sys
-from typing import Any
+from typing import Any, TextIO
 
-from kubeval.domain.models import CheckResult, ERROR, FAIL, PASS, ResourceCheck
+from kubeval.domain.models import (
+    CHANGE_NEW,
+    CHANGE_NEWLY_FAILING,
+    CHANGE_NEWLY_PASSING,
+    CHANGE_UNCHANGED,
+    CheckPolicy,
+    CheckResult,
+    ClusterScan,
+    ERROR,
+    FAIL,
+    PASS,
+    PolicyOutcome,
+    ResourceCheck,
+    ScanStats,
+    Timings,
+    to_dict,
+)
 
 RESET = "\033[0m"
 GREEN = "\033[92m"
@@ -18,6 +34,36 @@ def summarize(results: list[CheckResult]) -> dict[str, int]:
     return summary
 
 
+def summarize_changes(results: list[CheckResult]) -> dict[str, int] | None:
+    """Count results per baseline change, or None when the scan had no baseline."""
+    if all(res.change is None for res in results):
+        return None
+    summary = {CHANGE_NEWLY_FAILING: 0, CHANGE_NEWLY_PASSING: 0, CHANGE_UNCHANGED: 0, CHANGE_NEW: 0}
+    for res in results:
+        if res.change is not None:
+            summary[res.change] = summary.get(res.change, 0) + 1
+    return summary
+
+
+def cluster_status(scan: ClusterScan) -> str:
+    if scan.error:
+        return ERROR
+    summary = summarize(scan.results)
+    if summary[ERROR] > 0:
+        return ERROR
+    if summary[FAIL] > 0:
+        return FAIL
+    return PASS
+
+
+def summarize_fleet(scans: list[ClusterScan]) -> dict[str, int]:
+    summary = {PASS: 0, FAIL: 0, ERROR: 0}
+    for scan in scans:
+        status = cluster_status(scan)
+        summary[status] = summary.get(status, 0) + 1
+    return summary
+
+
 def _supports_color() -> bool:
     return sys.stdout.isatty()
 
@@ -80,6 +126,73 @@ def print_table(results: list[CheckResult]) -> None:
         )
 
 
+def print_policies(outcomes: list[PolicyOutcome]) -> None:
+    if not outcomes:
+        return
+    print("Policies:")
+    for outcome in outcomes:
+        label = _status_colored(f"{_status_label(outcome.status):<8}", outcome.status)
+        print(f"  {label}  {outcome.policy_id}: {outcome.details}")
+
+
+def print_policy_notes(policies: list[CheckPolicy]) -> None:
+    for policy in policies:
+        if policy.note:
+            print(f"Note: {policy.note}")
+
+
+def print_changes(results: list[CheckResult], stats: ScanStats) -> None:
+    changes = summarize_changes(results)
+    if changes is None:
+        return
+    print(
+        f"Since baseline: {changes[CHANGE_NEWLY_FAILING]} newly failing, "
+        f"{changes[CHANGE_NEWLY_PASSING]} newly passing, {changes[CHANGE_UNCHANGED]} unchanged, "
+        f"{changes[CHANGE_NEW]} new ({stats.reused} reused without re-evaluation)"
+    )
+    for result in results:
+        if result.change in (CHANGE_NEWLY_FAILING, CHANGE_NEWLY_PASSING):
+            label = "newly failing" if result.change == CHANGE_NEWLY_FAILING else "newly passing"
+            print(f"  {_status_colored(label, result.status)}: {result.check_id}")
+
+
+def _cluster_details(scan: ClusterScan) -> str:
+    if scan.error:
+        return scan.error
+    error_details = {r.details for r in scan.results if r.status == ERROR}
+    if len(error_details) == 1 and all(r.status == ERROR for r in scan.results):
+        return error_details.pop()
+    failing = [r.check_id for r in scan.results if r.status != PASS]
+    return f"Not passing: {', '.join(failing)}" if failing else "All checks passed"
+
+
+def print_fleet_table(scans: list[ClusterScan]) -> None:
+    name_w = max(8, *(len(s.target.name) for s in scans))
+    status_w = max(8, *(len(_status_label(cluster_status(s))) for s in scans))
+    header = f"{'CLUSTER':<{name_w}}  {'STATUS':<{status_w}}  {'PASS':>4}  {'FAIL':>4}  {'ERROR':>5}  DETAILS"
+    print(header)
+    print("-" * len(header))
+    for scan in scans:
+        status = cluster_status(scan)
+        summary = summarize(scan.results)
+        padded_status = f"{_status_label(status):<{status_w}}"
+        print(
+            f"{scan.target.name:<{name_w}}  {_status_colored(padded_status, status)}  "
+            f"{summary[PASS]:>4}  {summary[FAIL]:>4}  {summary[ERROR]:>5}  {_cluster_details(scan)}"
+        )
+
+
+def _conditions_text(check: ResourceCheck) -> str:
+    parts = [sel for sel in (check.label_selector, check.field_selector) if sel]
+    if check.min_ready is not None:
+        parts.append(f"ready>={check.min_ready}")
+    if check.max_unavailable is not None:
+        parts.append(f"unavailable<={check.max_unavailable}")
+    if check.image_regex is not None:
+        parts.append(f"image~{check.image_regex}")
+    return f" [{', '.join(parts)}]" if parts else ""
+
+
 def print_checks_catalog(checks: list[ResourceCheck]) -> None:
     id_w = max(8, *(len(c.check_id) for c in checks))
     resource_w = max(8, *(len(c.resource) for c in checks))
@@ -89,15 +202,123 @@ def print_checks_catalog(checks: list[ResourceCheck]) -> None:
     print("-" * len(header))
     for check in checks:
         ns_text = check.namespace or "all-namespaces"
-        match = f"{check.match_type}:{check.match_value} ({ns_text})"
+        match = f"{check.match_type}:{check.match_value} ({ns_text}){_conditions_text(check)}"
         title = f"{_title_emoji(check.check_id)} {check.title}"
         print(f"{check.check_id:<{id_w}}  {check.resource:<{resource_w}}  {title:<{title_w}}  {match}")
 
 
-def to_results_payload(results: list[CheckResult]) -> dict[str, Any]:
-    return {
+def result_to_dict(result: CheckResult) -> dict[str, Any]:
+    return to_dict(result)
+
+
+def _unique_timings(results: list[CheckResult]) -> list[Timings]:
+    seen: dict[int, Timings] = {}
+    for result in results:
+        if result.timings is not None:
+            seen.setdefault(id(result.timings), result.timings)
+    return list(seen.values())
+
+
+def print_profile(
+    results: list[CheckResult],
+    stats: ScanStats,
+    limit: int = 10,
+    stream: TextIO | None = None,
+) -> None:
+    out = stream or sys.stderr
+    timings = _unique_timings(results)
+    print(f"Profile: {stats.fetches} list call(s), wall {stats.wall_seconds:.3f}s", file=out)
+    for phase in ("fetch", "decode", "match"):
+        total = sum(getattr(t, f"{phase}_seconds") for t in timings)
+        print(f"  {phase:<7} {total:>8.3f}s", file=out)
+    print(f"  {'bytes':<7} {sum(t.bytes_received for t in timings):>9}", file=out)
+    retries = sum(t.retries for t in timings)
+    if retries:
+        retry_seconds = sum(t.retry_seconds for t in timings)
+        print(f"  {'retries':<7} {retries:>9} ({retry_seconds:.3f}s before final attempts)", file=out)
+
+    timed = sorted(
+        (r for r in results if r.timings is not None),
+        key=lambda r: r.timings.total_seconds if r.timings else 0.0,
+        reverse=True,
+    )
+    if not timed:
+        return
+    print(f"Slowest checks (top {min(limit, len(timed))}):", file=out)
+    for result in timed[:limit]:
+        t = result.timings
+        if t is None:
+            continue
+        shared = f" (list shared by {t.checks} checks)" if t.checks > 1 else ""
+        print(
+            f"  {result.check_id:<30} {t.total_seconds:>7.3f}s  fetch={t.fetch_seconds:.3f}s "
+            f"decode={t.decode_seconds:.3f}s match={t.match_seconds:.3f}s{shared}",
+            file=out,
+        )
+
+
+def to_chrome_trace(results: list[CheckResult]) -> dict[str, Any]:
+    """Chrome trace (chrome://tracing, Perfetto) with one lane per list call."""
+    events: list[dict[str, Any]] = []
+    for lane, timings in enumerate(_unique_timings(results), start=1):
+        served = [r.check_id for r in results if r.timings is timings]
+        start = timings.started_at
+        for phase in ("fetch", "decode", "match"):
+            duration = getattr(timings, f"{phase}_seconds")
+            events.append(
+                {
+                    "name": phase,
+                    "cat": "scan",
+                    "ph": "X",
+                    "ts": round(start * 1_000_000),
+                    "dur": round(duration * 1_000_000),
+                    "pid": 1,
+                    "tid": lane,
+                    "args": {"checks": served, "bytes": timings.bytes_received},
+                }
+            )
+            start += duration
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def to_results_payload(
+    results: list[CheckResult],
+    stats: ScanStats | None = None,
+    policies: list[PolicyOutcome] | None = None,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
         "summary": summarize(results),
-        "results": [r.__dict__ for r in results],
+        "results": [result_to_dict(r) for r in results],
+    }
+    if policies is not None:
+        payload["policies"] = [to_dict(outcome) for outcome in policies]
+    changes = summarize_changes(results)
+    if changes is not None:
+        payload["changes"] = changes
+    if stats is not None:
+        payload["stats"] = to_dict(stats)
+    return payload
+
+
+def to_fleet_payload(scans: list[ClusterScan]) -> dict[str, Any]:
+    all_results = [r for scan in scans for r in scan.results]
+    clusters = []
+    for scan in scans:
+        entry: dict[str, Any] = {
+            "cluster": scan.target.name,
+            "context": scan.target.context,
+            "kubeconfig": scan.target.kubeconfig,
+            "status": cluster_status(scan),
+            "error": scan.error,
+        }
+        entry.update(to_results_payload(scan.results, scan.stats, scan.policies))
+        clusters.append(entry)
+    return {
+        "summary": {
+            "clusters": summarize_fleet(scans),
+            "checks": summarize(all_results),
+        },
+        "clusters": clusters,
     }
 
 
@@ -113,6 +334,11 @@ def to_checks_payload(checks: list[ResourceCheck]) -> dict[str, Any]:
                 "match_type": c.match_type,
                 "match_value": c.match_value,
                 "min_count": c.min_count,
+                "label_selector": c.label_selector,
+                "field_selector": c.field_selector,
+                "min_ready": c.min_ready,
+                "max_unavailable": c.max_unavailable,
+                "image_regex": c.image_regex,
             }
             for c in checks
         ],
@@ -0,0 +1,4 @@
+from kubeval.presentation.metrics.prometheus import CONTENT_TYPE, render_metrics
+from kubeval.presentation.metrics.server import MetricsServer
+
+__all__ = ["CONTENT_TYPE", "MetricsServer", "render_metrics"]
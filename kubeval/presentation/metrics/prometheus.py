@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from kubeval.application.serve.metrics import Histogram, ServeMetrics
+from kubeval.domain.models import ERROR, FAIL, PASS, ScanSnapshot
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_STATUSES = (PASS, FAIL, ERROR)
+_FAMILIES = {
+    "kubeval_up": ("gauge", "1 once a scan has completed since the process started."),
+    "kubeval_check_status": ("gauge", "Check status in the last scan; 1 for its current status."),
+    "kubeval_policy_status": ("gauge", "Policy status in the last scan; 1 for its current status."),
+    "kubeval_checks": ("gauge", "Number of checks per status in the last scan."),
+    "kubeval_last_scan_timestamp_seconds": ("gauge", "Unix time the last scan completed."),
+    "kubeval_last_scan_duration_seconds": ("gauge", "Wall time of the last scan."),
+    "kubeval_last_scan_reused_checks": ("gauge", "Checks reused in the last scan, lists unchanged."),
+    "kubeval_scans_total": ("counter", "Completed scans."),
+    "kubeval_scan_errors_total": ("counter", "Scans that failed with an unexpected error."),
+    "kubeval_last_scan_error_timestamp_seconds": ("gauge", "Unix time the last scan failed."),
+    "kubeval_scan_duration_seconds": ("histogram", "Wall time of each completed scan."),
+    "kubeval_list_calls_total": ("counter", "kubectl or API server list calls by outcome."),
+    "kubeval_list_call_duration_seconds": ("histogram", "Wall time of each list call with retries."),
+    "kubeval_list_call_retries_total": ("counter", "List call attempts retried after a transient error."),
+    "kubeval_cache_hits_total": ("counter", "List calls answered from the resource cache."),
+    "kubeval_cache_misses_total": ("counter", "List calls the resource cache sent to the cluster."),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Exposition:
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def family(self, name: str) -> None:
+        kind, help_text = _FAMILIES[name]
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value: float, **labels: str) -> None:
+        self.lines.append(f"{name}{_labels(**labels)} {_number(value)}")
+
+    def histogram(self, name: str, histogram: Histogram, **labels: str) -> None:
+        for bound, count in histogram.cumulative():
+            self.sample(f"{name}_bucket", count, **labels, le=_number(bound))
+        self.sample(f"{name}_sum", histogram.sum, **labels)
+        self.sample(f"{name}_count", histogram.count, **labels)
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_metrics(snapshot: ScanSnapshot | None, metrics: ServeMetrics) -> str:
+    """Prometheus text exposition of the last completed scan and the process totals."""
+    out = _Exposition()
+    out.family("kubeval_up")
+    out.sample("kubeval_up", 0 if snapshot is None else 1)
+
+    if snapshot is not None:
+        out.family("kubeval_check_status")
+        for result in snapshot.results:
+            for status in _STATUSES:
+                value = 1 if result.status == status else 0
+                out.sample("kubeval_check_status", value, check_id=result.check_id, status=status)
+
+        out.family("kubeval_policy_status")
+        for outcome in snapshot.policies:
+            for status in _STATUSES:
+                value = 1 if outcome.status == status else 0
+                out.sample("kubeval_policy_status", value, policy_id=outcome.policy_id, status=status)
+
+        out.family("kubeval_checks")
+        for status in _STATUSES:
+            out.sample("kubeval_checks", sum(r.status == status for r in snapshot.results), status=status)
+
+        out.family("kubeval_last_scan_timestamp_seconds")
+        out.sample("kubeval_last_scan_timestamp_seconds", snapshot.finished_at)
+        out.family("kubeval_last_scan_duration_seconds")
+        out.sample("kubeval_last_scan_duration_seconds", snapshot.duration_seconds)
+        out.family("kubeval_last_scan_reused_checks")
+        out.sample("kubeval_last_scan_reused_checks", snapshot.stats.reused)
+
+    out.family("kubeval_scans_total")
+    out.sample("kubeval_scans_total", metrics.scans)
+    out.family("kubeval_scan_errors_total")
+    out.sample("kubeval_scan_errors_total", metrics.scan_errors)
+    if metrics.last_error_at is not None:
+        out.family("kubeval_last_scan_error_timestamp_seconds")
+        out.sample("kubeval_last_scan_error_timestamp_seconds", metrics.last_error_at)
+    out.family("kubeval_scan_duration_seconds")
+    out.histogram("kubeval_scan_duration_seconds", metrics.scan_duration)
+
+    out.family("kubeval_list_calls_total")
+    for (backend, resource, outcome), count in sorted(metrics.calls.items()):
+        out.sample("kubeval_list_calls_total", count, backend=backend, resource=resource, outcome=outcome)
+    out.family("kubeval_list_call_duration_seconds")
+    for (backend, resource), histogram in sorted(metrics.call_duration.items()):
+        out.histogram("kubeval_list_call_duration_seconds", histogram, backend=backend, resource=resource)
+    out.family("kubeval_list_call_retries_total")
+    out.sample("kubeval_list_call_retries_total", metrics.retries)
+
+    out.family("kubeval_cache_hits_total")
+    out.sample("kubeval_cache_hits_total", metrics.cache_hits)
+    out.family("kubeval_cache_misses_total")
+    out.sample("kubeval_cache_misses_total", metrics.cache_misses)
+    return out.text()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from kubeval.presentation.metrics.prometheus import CONTENT_TYPE
+
+
+class MetricsServer:
+    """Answer `/metrics` with the last published exposition; a scrape never waits on a scan."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self._body = b""
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+                path = self.path.split("?", 1)[0]
+                if path == "/metrics":
+                    self._reply(200, server._body, CONTENT_TYPE)
+                elif path == "/healthz":
+                    self._reply(200, b"ok\n", "text/plain; charset=utf-8")
+                else:
+                    self._reply(404, b"not found\n", "text/plain; charset=utf-8")
+
+            def _reply(self, code: int, body: bytes, content_type: str) -> None:
+                self.send_response(code)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self.httpd.server_address[:2]
+        return str(host), int(port)
+
+    def publish(self, text: str) -> None:
+        # Replacing the reference is atomic, so scrapes see either the old or the new body.
+        self._body = text.encode("utf-8")
+
+    def serve_forever(self) -> None:
+        self.httpd.serve_forever()
+
+    def close(self) -> None:
+        self.httpd.server_close()
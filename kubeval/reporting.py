@@ -1,15 +1,29 @@
 from kubeval.presentation.console.reporting import (
+    cluster_status,
     print_checks_catalog,
+    print_fleet_table,
+    print_profile,
     print_table,
+    result_to_dict,
     summarize,
+    summarize_fleet,
     to_checks_payload,
+    to_chrome_trace,
+    to_fleet_payload,
     to_results_payload,
 )
 
 __all__ = [
     "summarize",
+    "summarize_fleet",
+    "cluster_status",
     "print_table",
+    "print_fleet_table",
+    "print_profile",
     "print_checks_catalog",
     "to_results_payload",
+    "result_to_dict",
+    "to_chrome_trace",
     "to_checks_payload",
+    "to_fleet_payload",
 ]
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import unittest
+
+from kubeval.application.checks.fetching import FetchStrategy, plan_calls
+from kubeval.application.checks.runner import needs_status, plan_fetches
+from kubeval.checks.builtin import builtin_checks
+
+
+class BuiltinPlanTest(unittest.TestCase):
+    def test_builtin_daemonsets_share_one_call(self) -> None:
+        checks = builtin_checks()
+        plan = plan_fetches(checks)
+        status_keys = {key for key, indexes in plan.items() if needs_status(checks, indexes)}
+        calls, deferred = plan_calls(plan, FetchStrategy(), status_keys)
+
+        daemonsets = [call for call in calls if call.key[0] == "daemonset"]
+        self.assertEqual(deferred, [])
+        self.assertEqual(len(daemonsets), 1)
+        self.assertEqual(daemonsets[0].key, ("daemonset", "kube-system", None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from kubeval.domain.models import ResourceRef
+from kubeval.infrastructure.cache.resource_cache import ResourceCache
+
+
+class ResourceCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = ResourceCache(Path(self._tmp.name))
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, key: str, text: str) -> None:
+        self.cache.directory.mkdir(parents=True, exist_ok=True)
+        self.cache._path(key).write_text(text, encoding="utf-8")
+
+    def test_round_trip(self) -> None:
+        resources = [ResourceRef(namespace="kube-system", name="coredns")]
+        self.cache.put("key", resources)
+        self.assertEqual(self.cache.get("key"), resources)
+
+    def test_malformed_entries_are_misses(self) -> None:
+        entries = {
+            "not-json": "{",
+            "not-an-object": json.dumps([1, 2]),
+            "bad-created": json.dumps({"created": "yesterday", "items": []}),
+            "outdated-item": json.dumps({"created": time.time(), "items": [{"nme": "x"}]}),
+            "items-not-a-list": json.dumps({"created": time.time(), "items": 3}),
+        }
+        for key, text in entries.items():
+            with self.subTest(key):
+                self._write(key, text)
+                self.assertIsNone(self.cache.get(key))
+
+
+if __name__ == "__main__":
+    unittest.main()